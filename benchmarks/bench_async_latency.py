@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк задержки цикла событий под смешанной нагрузкой (~1000 запросов/с):
+синхронные вызовы DatabaseManager прямо в цикле против AsyncDatabaseManager
+Запуск: python -m benchmarks.bench_async_latency [секунды] [запросов/с]
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from database.async_manager import AsyncDatabaseManager
+from database.pool import PooledDatabaseManager
+from models.task import Task
+
+TICK = 0.001
+
+
+def prepare(path, count=50000):
+    db_manager = PooledDatabaseManager(path)
+    db_manager.create_tables()
+    due = datetime.now() + timedelta(days=7)
+    db_manager.add_tasks_bulk(
+        Task(f"Task {i}", "Description", i % 3 + 1, due, i % 50, i % 20) for i in range(count)
+    )
+    return db_manager, count
+
+
+def mixed_request(db_manager, count):
+    roll = random.random()
+    if roll < 0.55:
+        return db_manager.get_task_by_id(random.randint(1, count))
+    if roll < 0.85:
+        return db_manager.query_task_rows(project_id=random.randrange(50), limit=50)
+    if roll < 0.88:
+        # Тяжёлое чтение: подсчёт с полным просмотром таблицы
+        return db_manager.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE description LIKE ?", (f"%{random.randrange(10)}%",)
+        ).fetchone()
+    return db_manager.update_task(random.randint(1, count), status="in_progress")
+
+
+async def monitor_lag(stop, lags):
+    # Насколько позже запланированного просыпается цикл событий
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def load(call, rate, duration):
+    # Запросы выпускаются по расписанию start + i / rate, отставание догоняется пачкой
+    requests = []
+    start = time.perf_counter()
+    total = int(rate * duration)
+    while len(requests) < total:
+        due = int((time.perf_counter() - start) * rate) + 1
+        while len(requests) < min(due, total):
+            requests.append(asyncio.ensure_future(call()))
+        await asyncio.sleep(TICK)
+    await asyncio.gather(*requests)
+    return len(requests)
+
+
+async def run(mode, db_manager, count, rate, duration):
+    lags = []
+    stop = asyncio.Event()
+    monitor = asyncio.ensure_future(monitor_lag(stop, lags))
+    if mode == "async":
+        async_db = AsyncDatabaseManager(db_manager)
+
+        async def call():
+            return await async_db.run(mixed_request, db_manager, count)
+    else:
+        async def call():
+            return mixed_request(db_manager, count)
+
+    start = time.perf_counter()
+    done = await load(call, rate, duration)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await monitor
+    if mode == "async":
+        async_db.executor.shutdown()
+    return done / elapsed, lags
+
+
+def report(name, throughput, lags):
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[int(len(lags_ms) * 0.99) - 1]
+    print(
+        f"{name:6} {throughput:8.0f} запросов/с | задержка цикла: "
+        f"p50 {statistics.median(lags_ms):6.2f} мс, p99 {p99:6.2f} мс, max {lags_ms[-1]:6.2f} мс"
+    )
+
+
+def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    rate = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db_manager, count = prepare(path)
+    try:
+        for mode in ("sync", "async"):
+            throughput, lags = asyncio.run(run(mode, db_manager, count, rate, duration))
+            report(mode, throughput, lags)
+    finally:
+        db_manager.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
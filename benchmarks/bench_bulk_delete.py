@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк удаления задач: построчный delete_task против delete_tasks с WHERE id IN (...)
+Запуск: python -m benchmarks.bench_bulk_delete [количество строк]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from database.database_manager import DatabaseManager
+from models.task import Task
+
+
+def measure(delete, count):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db_manager = DatabaseManager(path)
+    db_manager.create_tables()
+    due = datetime.now() + timedelta(days=7)
+    ids = db_manager.add_tasks_bulk(
+        Task(f"Task {i}", "Description", 1, due, 1, 1) for i in range(count)
+    )
+    try:
+        start = time.perf_counter()
+        delete(db_manager, ids)
+        return time.perf_counter() - start
+    finally:
+        db_manager.close()
+        os.unlink(path)
+
+
+def delete_per_row(db_manager, ids):
+    for task_id in ids:
+        db_manager.delete_task(task_id)
+
+
+def delete_bulk(db_manager, ids):
+    db_manager.delete_tasks(ids)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    per_row = measure(delete_per_row, count)
+    bulk = measure(delete_bulk, count)
+    print(f"Строк: {count}")
+    print(f"delete_task:  {per_row * 1000:10.1f} мс")
+    print(f"delete_tasks: {bulk * 1000:10.1f} мс (x{per_row / bulk:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк вставки задач: построчный add_task против пакетного add_tasks_bulk
+Запуск: python -m benchmarks.bench_bulk_insert [количество строк]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from database.database_manager import DatabaseManager
+from models.task import Task
+
+
+def make_tasks(count):
+    due = datetime.now() + timedelta(days=7)
+    return [Task(f"Task {i}", "Description", i % 3 + 1, due, 1, 1) for i in range(count)]
+
+
+def measure(insert, count):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db_manager = DatabaseManager(path)
+    db_manager.create_tables()
+    tasks = make_tasks(count)
+    try:
+        start = time.perf_counter()
+        insert(db_manager, tasks)
+        return count / (time.perf_counter() - start)
+    finally:
+        db_manager.close()
+        os.unlink(path)
+
+
+def insert_per_row(db_manager, tasks):
+    for task in tasks:
+        db_manager.add_task(task)
+
+
+def insert_bulk(db_manager, tasks):
+    db_manager.add_tasks_bulk(tasks)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    per_row = measure(insert_per_row, count)
+    bulk = measure(insert_bulk, count)
+    print(f"Строк: {count}")
+    print(f"add_task:       {per_row:12.0f} строк/с")
+    print(f"add_tasks_bulk: {bulk:12.0f} строк/с (x{bulk / per_row:.1f})")
+
+
+if __name__ == "__main__":
+    main()
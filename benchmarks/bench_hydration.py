@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк get_all_tasks: построение объектов через Task.__init__ + strptime
+против Task.from_row
+Запуск: python -m benchmarks.bench_hydration [количество строк]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from database.database_manager import DatabaseManager
+from models.task import Task
+
+
+def hydrate_validated(rows):
+    tasks = []
+    for row in rows:
+        task = Task(
+            title=row[1],
+            description=row[2],
+            priority=row[3],
+            due_date=datetime.strptime(row[5], "%Y-%m-%d %H:%M:%S"),
+            project_id=row[6],
+            assignee_id=row[7]
+        )
+        task.id = row[0]
+        task.status = row[4]
+        tasks.append(task)
+    return tasks
+
+
+def hydrate_from_row(rows):
+    return [Task.from_row(row) for row in rows]
+
+
+def measure(hydrate, rows):
+    start = time.perf_counter()
+    hydrate(rows)
+    return len(rows) / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db_manager = DatabaseManager(path)
+    db_manager.create_tables()
+    try:
+        due = datetime.now() + timedelta(days=7)
+        db_manager.add_tasks_bulk(
+            Task(f"Task {i}", "Description", i % 3 + 1, due, 1, 1) for i in range(count)
+        )
+        rows = db_manager.conn.execute("SELECT * FROM tasks").fetchall()
+
+        validated = measure(hydrate_validated, rows)
+        from_row = measure(hydrate_from_row, rows)
+
+        start = time.perf_counter()
+        db_manager.get_all_tasks()
+        end_to_end = count / (time.perf_counter() - start)
+    finally:
+        db_manager.close()
+        os.unlink(path)
+
+    print(f"Строк: {count}")
+    print(f"Task.__init__ + strptime: {validated:12.0f} объектов/с")
+    print(f"Task.from_row:            {from_row:12.0f} объектов/с (x{from_row / validated:.1f})")
+    print(f"get_all_tasks целиком:    {end_to_end:12.0f} объектов/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк пиковой памяти (tracemalloc) при полном проходе по задачам:
+get_all_tasks целиком против потокового iter_tasks
+Запуск: python -m benchmarks.bench_iter_memory [количество строк]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from database.database_manager import DatabaseManager
+from models.task import Task
+
+
+def count_all(db_manager):
+    return sum(1 for _ in db_manager.get_all_tasks())
+
+
+def count_streamed(db_manager):
+    return sum(1 for _ in db_manager.iter_tasks())
+
+
+def measure(db_manager, read):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = read(db_manager)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed, peak
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db_manager = DatabaseManager(path)
+    db_manager.create_tables()
+    due = datetime.now() + timedelta(days=7)
+    db_manager.add_tasks_bulk(
+        Task(f"Task {i}", "Description", i % 3 + 1, due, 1, 1) for i in range(count)
+    )
+    try:
+        print(f"Строк: {count}")
+        for name, read in (("get_all_tasks", count_all), ("iter_tasks", count_streamed)):
+            rows, elapsed, peak = measure(db_manager, read)
+            print(f"{name:14} {rows / elapsed:12.0f} строк/с, пик {peak / 2 ** 20:8.1f} МиБ")
+    finally:
+        db_manager.close()
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
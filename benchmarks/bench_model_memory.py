@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк памяти моделей (tracemalloc): байт на объект для классов
+со __slots__ против тех же полей в обычном __dict__
+Запуск: python -m benchmarks.bench_model_memory [количество объектов]
+"""
+
+import sys
+import tracemalloc
+
+from models.project import Project
+from models.task import Task
+from models.user import User
+
+ROWS = {
+    Task: (1, "Task", "Description", 2, "pending", "2025-01-01 10:00:00", 1, 1),
+    Project: (1, "Project", "Description", "2025-01-01 10:00:00", "2025-02-01 10:00:00", "active"),
+    User: (1, "user", "user@example.com", "developer", "2025-01-01 10:00:00"),
+}
+
+
+def dict_based(model):
+    # Тот же набор полей, но с __dict__ — как было до перехода на __slots__
+    dict_class = type(f"Dict{model.__name__}", (), {})
+
+    def build(row):
+        source = model.from_row(row)
+        obj = dict_class()
+        for name in model.__slots__:
+            setattr(obj, name, getattr(source, name))
+        return obj
+
+    return build
+
+
+def bytes_per_object(build, row, count):
+    # Строки и числа общие для всех объектов: учитываются сам объект,
+    # его datetime и ссылка в списке
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [build(row) for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    total = sum(stat.size_diff for stat in stats)
+    del objects
+    return total / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Объектов: {count}")
+    for model, row in ROWS.items():
+        slots = bytes_per_object(model.from_row, row, count)
+        with_dict = bytes_per_object(dict_based(model), row, count)
+        print(
+            f"{model.__name__:8} __dict__: {with_dict:7.0f} байт, __slots__: {slots:7.0f} байт "
+            f"(-{100 * (1 - slots / with_dict):.0f}%)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import functools
+
+from controllers.project_controller import ProjectController
+from controllers.task_controller import TaskController
+from controllers.user_controller import UserController
+
+
+class AsyncController:
+    # Асинхронный вариант контроллера: методы с теми же именами
+    # выполняются в пуле потоков AsyncDatabaseManager
+    controller_class = None
+
+    def __init__(self, async_db) -> None:
+        self.async_db = async_db
+        self.controller = self.controller_class(async_db.db)
+
+    def __getattr__(self, name):
+        method = getattr(self.controller, name)
+        if not callable(method):
+            return method
+        if name.startswith('iter_'):
+            return functools.partial(self.async_db.iterate, method)
+
+        async def call(*args, **kwargs):
+            return await self.async_db.run(method, *args, **kwargs)
+
+        call.__name__ = name
+        return call
+
+
+class AsyncTaskController(AsyncController):
+    controller_class = TaskController
+
+
+class AsyncProjectController(AsyncController):
+    controller_class = ProjectController
+
+
+class AsyncUserController(AsyncController):
+    controller_class = UserController
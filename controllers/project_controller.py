@@ -1,5 +1,6 @@
+from datetime import datetime
 from models.project import Project
-from database.database_manager import DatabaseManager
+from database.database_manager import DatabaseManager, ITER_BATCH_SIZE, PROGRESS_STEP
 import sqlite3
 
 class ProjectController:
@@ -12,9 +13,27 @@ class ProjectController:
         project_id = self.db.add_project(project)
         return project_id
 
+    def add_projects_bulk(self, projects) -> list[int]:
+        return self.db.add_projects_bulk(Project(**fields) for fields in projects)
+
     def get_project(self, project_id) -> Project | None:
         return self.db.get_project_by_id(project_id)
 
+    def get_project_by_name(self, name) -> Project | None:
+        return self.db.get_project_by_name(name)
+
+    def iter_projects(self, batch_size=ITER_BATCH_SIZE):
+        return self.db.iter_projects(batch_size)
+
+    def get_projects_by_ids(self, project_ids) -> list[Project]:
+        return self.db.get_projects_by_ids(project_ids)
+
+    def get_change_version(self) -> int:
+        return self.db.get_change_version()
+
+    def get_changes_since(self, version) -> dict:
+        return self.db.get_changes_since(version)
+
     def get_all_projects(self) -> list[Project]:
         return self.db.get_all_projects()
 
@@ -32,6 +51,13 @@ class ProjectController:
         except sqlite3.Error:
             return False
 
+    def delete_projects(self, project_ids, progress=None) -> bool:
+        try:
+            self.db.delete_projects(project_ids, chunk_size=PROGRESS_STEP, progress=progress)
+            return True
+        except sqlite3.Error:
+            return False
+
     def update_project_status(self, project_id, new_status) -> bool:
         try:
             self.db.update_project(project_id, status=new_status)
@@ -39,6 +65,24 @@ class ProjectController:
         except sqlite3.Error:
             return False
 
+    def get_project_stats(self, now=None) -> dict[int, dict]:
+        # {project_id: {'total', 'by_status', 'by_priority', 'overdue', 'next_due'}}
+        return self.db.get_task_stats('project_id', now or datetime.now())
+
+    def get_task_counts(self, project_ids=None) -> dict[int, dict]:
+        # {project_id: {'total', 'by_status'}} из таблицы-счётчика, без прохода по задачам
+        return self.db.get_task_counts('project_id', project_ids)
+
+    def get_all_projects_with_progress(self, now=None) -> list[tuple[Project, float, float]]:
+        # (проект, прогресс по времени, доля выполненных задач) для всех проектов сразу;
+        # время берётся один раз, задачи считаются в том же запросе, что и проекты
+        now = now or datetime.now()
+        result = []
+        for project, total, completed in self.db.iter_projects_with_task_counts():
+            task_progress = completed / total * 100 if total else 0.0
+            result.append((project, project.get_progress(now), task_progress))
+        return result
+
     def get_project_progress(self, project_id) -> float:
         project = self.get_project(project_id)
         if project:
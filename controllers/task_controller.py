@@ -1,5 +1,7 @@
+from datetime import datetime
 from models.task import Task
-from database.database_manager import DatabaseManager
+from database.database_manager import DatabaseManager, ITER_BATCH_SIZE, PROGRESS_STEP
+from database.task_table import TaskTable
 
 class TaskController:
     def __init__(self, db_manager: DatabaseManager) -> None:
@@ -11,14 +13,55 @@ class TaskController:
         self.db.add_task(task)
         return task
 
+    def add_tasks_bulk(self, tasks) -> list[int]:
+        return self.db.add_tasks_bulk(Task(**fields) for fields in tasks)
+
     def get_task(self, task_id) -> Task | None:
         if isinstance(task_id, Task):
             task_id = task_id.id
         return self.db.get_task_by_id(task_id)
 
+    def get_change_version(self) -> int:
+        return self.db.get_change_version()
+
+    def get_changes_since(self, version) -> dict:
+        return self.db.get_changes_since(version)
+
     def get_all_tasks(self) -> list[Task]:
         return self.db.get_all_tasks()
 
+    def iter_tasks(self, batch_size=ITER_BATCH_SIZE, order_by='id', **filters):
+        return self.db.iter_tasks(batch_size, order_by=order_by, **filters)
+
+    def query_tasks(self, text=None, status=None, priority=None, project_id=None,
+                    assignee_id=None, due_before=None, order_by='id', descending=False,
+                    limit=100, after=None, ids=None, offset=0) -> tuple[list, str | None]:
+        return self.db.query_task_rows(
+            text=text,
+            status=status,
+            priority=priority,
+            project_id=project_id,
+            assignee_id=assignee_id,
+            due_before=due_before,
+            order_by=order_by,
+            descending=descending,
+            limit=limit,
+            after=after,
+            ids=ids,
+            offset=offset,
+        )
+
+    def count_tasks(self, text=None, status=None, priority=None, project_id=None,
+                    assignee_id=None, due_before=None) -> int:
+        return self.db.count_task_rows(
+            text=text,
+            status=status,
+            priority=priority,
+            project_id=project_id,
+            assignee_id=assignee_id,
+            due_before=due_before,
+        )
+
     def update_task(self, task_id, **kwargs) -> None:
         if isinstance(task_id, Task):
             task_id = task_id.id
@@ -29,17 +72,37 @@ class TaskController:
             task_id = task_id.id
         self.db.delete_task(task_id)
 
-    def search_tasks(self, query) -> list[Task]:
-        return self.db.search_tasks(query)
+    def delete_tasks(self, task_ids, progress=None) -> int:
+        # Удаление пачками по PROGRESS_STEP id в одной транзакции: progress(done, total)
+        # вызывается после каждой пачки, исключение из него откатывает всё
+        task_ids = [task.id if isinstance(task, Task) else task for task in task_ids]
+        return self.db.delete_tasks(task_ids, chunk_size=PROGRESS_STEP, progress=progress)
+
+    def update_tasks_status(self, task_ids, new_status, progress=None) -> int:
+        task_ids = [task.id if isinstance(task, Task) else task for task in task_ids]
+        return self.db.update_tasks_status(
+            task_ids, new_status, chunk_size=PROGRESS_STEP, progress=progress
+        )
+
+    def search_tasks(self, query, limit=None) -> list[Task]:
+        return self.db.search_tasks(query, limit=limit)
+
+    def search_tasks_highlighted(self, query, markers=('[', ']'), limit=None) -> list[tuple]:
+        return self.db.search_tasks_highlighted(query, markers=markers, limit=limit)
 
     def update_task_status(self, task_id, new_status) -> None:
         if isinstance(task_id, Task):
             task_id = task_id.id
         self.db.update_task(task_id, status=new_status)
 
-    def get_overdue_tasks(self) -> list[Task]:
-        all_tasks = self.db.get_all_tasks()
-        return [task for task in all_tasks if task.is_overdue()]
+    def get_overdue_tasks(self, limit=None) -> list[Task]:
+        return self.db.get_overdue_tasks(datetime.now(), limit=limit)
+
+    def iter_overdue_tasks(self, now=None, batch_size=ITER_BATCH_SIZE):
+        return self.db.iter_tasks(batch_size, order_by='due_date', overdue_at=now or datetime.now())
+
+    def get_task_table(self) -> TaskTable:
+        return TaskTable.load(self.db)
 
     def get_tasks_by_project(self, project_id) -> list[Task]:
         return self.db.get_tasks_by_project(project_id)
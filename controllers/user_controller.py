@@ -1,5 +1,6 @@
+from datetime import datetime
 from models.user import User
-from database.database_manager import DatabaseManager
+from database.database_manager import DatabaseManager, ITER_BATCH_SIZE, PROGRESS_STEP
 import sqlite3
 
 class UserController:
@@ -7,14 +8,38 @@ class UserController:
         self.db = db_manager
         self.db.create_tables()
 
-    def add_user(self, username, email, role) -> int:
+    def add_user(self, username, email, role) -> int | None:
+        # None, если имя пользователя или email уже заняты
         user = User(username, email, role)
-        user_id = self.db.add_user(user)
-        return user_id
+        try:
+            return self.db.add_user(user)
+        except sqlite3.IntegrityError:
+            return None
+
+    def add_users_bulk(self, users) -> list[int]:
+        return self.db.add_users_bulk(User(**fields) for fields in users)
 
     def get_user(self, user_id) -> User | None:
         return self.db.get_user_by_id(user_id)
 
+    def get_user_by_username(self, username) -> User | None:
+        return self.db.get_user_by_username(username)
+
+    def get_user_by_email(self, email) -> User | None:
+        return self.db.get_user_by_email(email)
+
+    def iter_users(self, batch_size=ITER_BATCH_SIZE):
+        return self.db.iter_users(batch_size)
+
+    def get_users_by_ids(self, user_ids) -> list[User]:
+        return self.db.get_users_by_ids(user_ids)
+
+    def get_change_version(self) -> int:
+        return self.db.get_change_version()
+
+    def get_changes_since(self, version) -> dict:
+        return self.db.get_changes_since(version)
+
     def get_all_users(self) -> list[User]:
         return self.db.get_all_users()
 
@@ -32,5 +57,20 @@ class UserController:
         except sqlite3.Error:
             return False
 
+    def delete_users(self, user_ids, progress=None) -> bool:
+        try:
+            self.db.delete_users(user_ids, chunk_size=PROGRESS_STEP, progress=progress)
+            return True
+        except sqlite3.Error:
+            return False
+
     def get_user_tasks(self, user_id) -> list:
         return self.db.get_tasks_by_user(user_id)
+
+    def get_workload_stats(self, now=None) -> dict[int, dict]:
+        # {user_id: {'total', 'by_status', 'by_priority', 'overdue', 'next_due'}}
+        return self.db.get_task_stats('assignee_id', now or datetime.now())
+
+    def get_task_counts(self, user_ids=None) -> dict[int, dict]:
+        # {user_id: {'total', 'by_status'}} из таблицы-счётчика, без прохода по задачам
+        return self.db.get_task_counts('assignee_id', user_ids)
@@ -0,0 +1,82 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from database.database_manager import ITER_BATCH_SIZE
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_PENDING = 256
+
+
+def _next_batch(iterator, batch_size) -> list:
+    return list(islice(iterator, batch_size))
+
+
+class AsyncDatabaseManager:
+    # Асинхронный фасад: методы DatabaseManager с теми же именами выполняются
+    # в отдельном пуле потоков и не блокируют цикл событий.
+    # db_manager должен быть потокобезопасным (PooledDatabaseManager).
+    # Не больше max_pending вызовов одновременно: остальные ждут в очереди
+    def __init__(self, db_manager, max_workers=DEFAULT_MAX_WORKERS,
+                 max_pending=DEFAULT_MAX_PENDING) -> None:
+        self.db = db_manager
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='db')
+        self.pending = asyncio.Semaphore(max_pending)
+
+    def __getattr__(self, name):
+        method = getattr(self.db, name)
+        if not callable(method):
+            return method
+        if name.startswith('iter_'):
+            # Генераторы iter_* отдаются асинхронным итератором, а не корутиной
+            return functools.partial(self.iterate, method)
+
+        async def call(*args, **kwargs):
+            return await self.run(method, *args, **kwargs)
+
+        call.__name__ = name
+        return call
+
+    async def run(self, func, *args, **kwargs):
+        async with self.pending:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, functools.partial(func, *args, **kwargs)
+            )
+
+    async def iterate(self, func, *args, batch_size=ITER_BATCH_SIZE, **kwargs):
+        # Асинхронный итератор по генератору func(...). Генератор читает курсором
+        # соединения своего потока, поэтому целиком выполняется в отдельном потоке;
+        # в цикл событий элементы приходят пачками по batch_size.
+        # Недочитанный итератор нужно закрыть (contextlib.aclosing), как и генератор
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-iter')
+        loop = asyncio.get_running_loop()
+
+        async def step(func, *args):
+            async with self.pending:
+                return await loop.run_in_executor(executor, func, *args)
+
+        iterator = None
+        try:
+            iterator = await step(functools.partial(func, *args, batch_size=batch_size, **kwargs))
+            while batch := await step(_next_batch, iterator, batch_size):
+                for item in batch:
+                    yield item
+        finally:
+            if iterator is not None:
+                await step(iterator.close)
+            executor.shutdown(wait=False)
+
+    async def run_in_transaction(self, func, *args, **kwargs):
+        # Транзакция привязана к потоку, поэтому func(db, ...) целиком выполняется в одном потоке
+        def work():
+            with self.db.transaction():
+                return func(self.db, *args, **kwargs)
+
+        return await self.run(work)
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.executor.shutdown)
+        self.db.close()
@@ -0,0 +1,225 @@
+import sys
+import threading
+from collections import OrderedDict
+
+
+def _entity_size(entity) -> int:
+    # Приблизительный размер: сам объект плюс значения его атрибутов
+    if hasattr(entity, '__dict__'):
+        values = entity.__dict__.values()
+    else:
+        values = [getattr(entity, name, None) for name in getattr(type(entity), '__slots__', ())]
+    return sys.getsizeof(entity) + sum(sys.getsizeof(value) for value in values)
+
+
+class EntityCache:
+    # LRU-кэш объектов по ключу (таблица, id) с ограничением по числу записей и/или байтам
+    def __init__(self, max_entries=1024, max_bytes=None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Растёт при каждом сбросе: загруженное до сброса значение в кэш не кладётся
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, entity, generation=None) -> None:
+        # generation — значение self.generation до чтения entity из базы
+        size = _entity_size(entity)
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._discard(key)
+            self.entries[key] = (entity, size)
+            self.bytes += size
+            while self.entries and self._over_limit():
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, key) -> None:
+        with self.lock:
+            self.generation += 1
+            self._discard(key)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'bytes': self.bytes,
+            }
+
+    def _discard(self, key) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def _over_limit(self) -> bool:
+        if self.max_entries is not None and len(self.entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.bytes > self.max_bytes
+
+
+class CachedDatabaseManager:
+    # Обёртка над DatabaseManager: get_*_by_id отдаются из кэша,
+    # update_*/delete_* (в том числе пакетные) сбрасывают записи после записи,
+    # а внутри transaction() — ещё раз после commit, чтобы значение, прочитанное
+    # другим потоком до фиксации, не осталось в кэше. Остальные методы передаются как есть
+    def __init__(self, db_manager, max_entries=1024, max_bytes=None) -> None:
+        self.db = db_manager
+        self.cache = EntityCache(max_entries=max_entries, max_bytes=max_bytes)
+        # Ключи, изменённые в открытой транзакции текущего потока
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        return getattr(self.db, name)
+
+    def cache_stats(self) -> dict:
+        return self.cache.stats()
+
+    def transaction(self):
+        return _InvalidatingTransaction(self.db.transaction(), self.cache, self._local)
+
+    def _get(self, table, entity_id, load):
+        key = (table, entity_id)
+        entity = self.cache.get(key)
+        if entity is None:
+            generation = self.cache.generation
+            entity = load(entity_id)
+            if entity is not None:
+                self.cache.put(key, entity, generation)
+        return entity
+
+    def _changed(self, table, ids) -> None:
+        keys = [(table, entity_id) for entity_id in ids]
+        for key in keys:
+            self.cache.invalidate(key)
+        pending = getattr(self._local, 'pending', None)
+        if pending is not None:
+            pending.update(keys)
+
+    def get_task_by_id(self, task_id):
+        return self._get('tasks', task_id, self.db.get_task_by_id)
+
+    def get_project_by_id(self, project_id):
+        return self._get('projects', project_id, self.db.get_project_by_id)
+
+    def get_user_by_id(self, user_id):
+        return self._get('users', user_id, self.db.get_user_by_id)
+
+    def update_task(self, task_id, **kwargs):
+        result = self.db.update_task(task_id, **kwargs)
+        self._changed('tasks', [task_id])
+        return result
+
+    def update_project(self, project_id, **kwargs):
+        result = self.db.update_project(project_id, **kwargs)
+        self._changed('projects', [project_id])
+        return result
+
+    def update_user(self, user_id, **kwargs):
+        result = self.db.update_user(user_id, **kwargs)
+        self._changed('users', [user_id])
+        return result
+
+    def delete_task(self, task_id):
+        result = self.db.delete_task(task_id)
+        self._changed('tasks', [task_id])
+        return result
+
+    def delete_project(self, project_id):
+        result = self.db.delete_project(project_id)
+        self._changed('projects', [project_id])
+        return result
+
+    def delete_user(self, user_id):
+        result = self.db.delete_user(user_id)
+        self._changed('users', [user_id])
+        return result
+
+    def update_tasks_status(self, task_ids, status, **kwargs):
+        task_ids = list(task_ids)
+        try:
+            return self.db.update_tasks_status(task_ids, status, **kwargs)
+        finally:
+            # Отменённая пакетная операция могла успеть изменить часть строк
+            self._changed('tasks', task_ids)
+
+    def delete_tasks(self, task_ids, **kwargs):
+        task_ids = list(task_ids)
+        try:
+            return self.db.delete_tasks(task_ids, **kwargs)
+        finally:
+            self._changed('tasks', task_ids)
+
+    def delete_projects(self, project_ids, **kwargs):
+        project_ids = list(project_ids)
+        try:
+            return self.db.delete_projects(project_ids, **kwargs)
+        finally:
+            self._changed('projects', project_ids)
+
+    def delete_users(self, user_ids, **kwargs):
+        user_ids = list(user_ids)
+        try:
+            return self.db.delete_users(user_ids, **kwargs)
+        finally:
+            self._changed('users', user_ids)
+
+
+class _InvalidatingTransaction:
+    # При откате кэш мог запомнить незафиксированные данные — сбрасываем его целиком.
+    # После commit внешнего уровня повторно сбрасываются ключи, изменённые внутри
+    def __init__(self, transaction, cache, local) -> None:
+        self.transaction = transaction
+        self.cache = cache
+        self.local = local
+        self.outer = False
+
+    def __enter__(self):
+        result = self.transaction.__enter__()
+        if getattr(self.local, 'pending', None) is None:
+            self.local.pending = set()
+            self.outer = True
+        return result
+
+    def __exit__(self, exc_type, exc, tb):
+        pending = self.local.pending
+        if self.outer:
+            self.local.pending = None
+        try:
+            result = self.transaction.__exit__(exc_type, exc, tb)
+        except BaseException:
+            self.cache.clear()
+            raise
+        if exc_type is not None:
+            self.cache.clear()
+        elif self.outer:
+            self._invalidate(pending)
+        return result
+
+    def _invalidate(self, keys) -> None:
+        for key in keys:
+            self.cache.invalidate(key)
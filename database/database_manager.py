@@ -1,17 +1,448 @@
+import base64
+import json
+import re
 import sqlite3
+from contextlib import contextmanager
+from itertools import islice
 from models.task import Task
 from models.project import Project
 from models.user import User
 from datetime import datetime
+from database.dates import (
+    DATE_COLUMNS, DATE_STORAGES, convert_date_columns_sql, from_db_datetime, to_db_datetime
+)
+
+BULK_CHUNK_SIZE = 1000
+# Ниже лимита параметров запроса в старых сборках SQLite (999)
+IN_CHUNK_SIZE = 900
+ITER_BATCH_SIZE = 500
+# Пачка пакетных операций контроллеров, после каждой вызывается progress(done, total)
+PROGRESS_STEP = 100
+
+TASK_ORDER_COLUMNS = ('id', 'title', 'priority', 'status', 'due_date')
+
+# Колонки таблиц в порядке создания — для выгрузки сырых строк
+TABLE_COLUMNS = {
+    'tasks': (
+        'id', 'title', 'description', 'priority', 'status', 'due_date', 'project_id',
+        'assignee_id',
+    ),
+    'projects': ('id', 'name', 'description', 'start_date', 'end_date', 'status'),
+    'users': ('id', 'username', 'email', 'role', 'registration_date'),
+}
+TASK_STATS_GROUPS = ('project_id', 'assignee_id')
+
+TASK_ROWS_SELECT = '''
+    SELECT tasks.*, projects.name AS project_name, users.username AS assignee_name
+    FROM tasks
+    LEFT JOIN projects ON projects.id = tasks.project_id
+    LEFT JOIN users ON users.id = tasks.assignee_id
+'''
+
+TASKS_FTS_TRIGGERS = [
+    '''
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    ''',
+]
+
+
+def _create_tasks_fts(cursor) -> None:
+    # Без FTS5 в сборке SQLite поиск остаётся на LIKE
+    try:
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts
+            USING fts5(title, description, content='tasks', content_rowid='id')
+        ''')
+    except sqlite3.OperationalError:
+        return
+    for trigger in TASKS_FTS_TRIGGERS:
+        cursor.execute(trigger)
+    cursor.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+
+def _fts_query(text) -> str:
+    # Каждое слово ищется как префикс, слова объединяются через AND
+    return ' '.join(f'"{token}"*' for token in re.findall(r'\w+', text))
+
+
+# Изменяемые пользователем колонки: их обновление повышает row_version строки
+TRACKED_COLUMNS = {
+    'tasks': (
+        'title', 'description', 'priority', 'status', 'due_date', 'project_id', 'assignee_id',
+    ),
+    'projects': ('name', 'description', 'start_date', 'end_date', 'status'),
+    'users': ('username', 'email', 'role', 'registration_date'),
+}
+
+
+def _version_triggers(table) -> list[str]:
+    # Любая вставка и изменение получают следующий номер из change_counter,
+    # удаление оставляет запись в deleted_rows
+    touch = f'''
+        UPDATE change_counter SET version = version + 1;
+        UPDATE {table} SET row_version = (SELECT version FROM change_counter),
+                           updated_at = CURRENT_TIMESTAMP
+        WHERE id = new.id;
+    '''
+    return [
+        f'''
+        CREATE TRIGGER IF NOT EXISTS {table}_version_ai
+        AFTER INSERT ON {table} BEGIN {touch} END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS {table}_version_au
+        AFTER UPDATE OF {', '.join(TRACKED_COLUMNS[table])} ON {table} BEGIN {touch} END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS {table}_version_ad AFTER DELETE ON {table} BEGIN
+            UPDATE change_counter SET version = version + 1;
+            INSERT OR REPLACE INTO deleted_rows (table_name, row_id, row_version)
+            VALUES ('{table}', old.id, (SELECT version FROM change_counter));
+        END
+        ''',
+    ]
+
+
+def _create_change_tracking(cursor) -> None:
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS change_counter (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            version INTEGER NOT NULL
+        )
+    ''')
+    cursor.execute('INSERT OR IGNORE INTO change_counter (id, version) VALUES (0, 0)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS deleted_rows (
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            row_version INTEGER NOT NULL,
+            PRIMARY KEY (table_name, row_id)
+        )
+    ''')
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_deleted_rows_version '
+        'ON deleted_rows (table_name, row_version)'
+    )
+    for table in TRACKED_COLUMNS:
+        # Уже существующие строки получают версию 0; повторный прогон миграции колонки не дублирует
+        columns = {row[1] for row in cursor.execute(f'PRAGMA table_info({table})').fetchall()}
+        if 'row_version' not in columns:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN row_version INTEGER NOT NULL DEFAULT 0')
+        if 'updated_at' not in columns:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN updated_at TEXT')
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS idx_{table}_row_version ON {table} (row_version)'
+        )
+        for trigger in _version_triggers(table):
+            cursor.execute(trigger)
+
+
+# Таблицы-счётчики задач по (группа, статус): их держат точными триггеры на tasks,
+# поэтому счётчики читаются без прохода по задачам
+TASK_COUNT_TABLES = {
+    'project_id': 'project_task_counts',
+    'assignee_id': 'user_task_counts',
+}
+
+
+def _task_count_triggers(table, column) -> list[str]:
+    # Задачи без проекта или исполнителя не считаются; пустые счётчики удаляются
+    increment = f'''
+        INSERT INTO {table} ({column}, status, count)
+        SELECT new.{column}, new.status, 1 WHERE new.{column} IS NOT NULL
+        ON CONFLICT ({column}, status) DO UPDATE SET count = count + 1;
+    '''
+    decrement = f'''
+        UPDATE {table} SET count = count - 1 WHERE {column} = old.{column} AND status = old.status;
+        DELETE FROM {table} WHERE {column} = old.{column} AND status = old.status AND count = 0;
+    '''
+    return [
+        f'CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON tasks BEGIN {increment} END',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE OF status, {column} ON tasks
+        WHEN old.status IS NOT new.status OR old.{column} IS NOT new.{column}
+        BEGIN {decrement} {increment} END
+        ''',
+        f'CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON tasks BEGIN {decrement} END',
+    ]
+
+
+def _task_counts_fill_sql(table, column, where='') -> str:
+    # Счётчики по задачам из tasks одним GROUP BY; where сужает выборку (пачка вставки)
+    return f'''
+        INSERT INTO {table} ({column}, status, count)
+        SELECT {column}, status, COUNT(*) FROM tasks
+        WHERE {column} IS NOT NULL {where}
+        GROUP BY {column}, status
+        ON CONFLICT ({column}, status) DO UPDATE SET count = count + excluded.count
+    '''
+
+
+def _rebuild_task_counts(cursor) -> None:
+    for column, table in TASK_COUNT_TABLES.items():
+        cursor.execute(f'DELETE FROM {table}')
+        cursor.execute(_task_counts_fill_sql(table, column))
+
+
+def _create_task_counts(cursor) -> None:
+    for column, table in TASK_COUNT_TABLES.items():
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                {column} INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY ({column}, status)
+            ) WITHOUT ROWID
+        ''')
+        for trigger in _task_count_triggers(table, column):
+            cursor.execute(trigger)
+    # Начальное заполнение по уже существующим задачам
+    _rebuild_task_counts(cursor)
+
+
+# Триггеры AFTER INSERT, которые при пакетной вставке снимаются на время пачки
+# и заменяются запросами по диапазону id пачки (:first_id, :last_id)
+BULK_INSERT_TRIGGERS = {
+    'tasks': [
+        ('tasks_fts_ai', TASKS_FTS_TRIGGERS[0], [
+            '''
+            INSERT INTO tasks_fts (rowid, title, description)
+            SELECT id, title, description FROM tasks WHERE id BETWEEN :first_id AND :last_id
+            ''',
+        ]),
+    ],
+}
+for _table in TRACKED_COLUMNS:
+    BULK_INSERT_TRIGGERS.setdefault(_table, []).append((
+        f'{_table}_version_ai',
+        _version_triggers(_table)[0],
+        [
+            'UPDATE change_counter SET version = version + 1',
+            f'''
+            UPDATE {_table} SET row_version = (SELECT version FROM change_counter),
+                                updated_at = CURRENT_TIMESTAMP
+            WHERE id BETWEEN :first_id AND :last_id
+            ''',
+        ],
+    ))
+for _column, _table in TASK_COUNT_TABLES.items():
+    BULK_INSERT_TRIGGERS['tasks'].append((
+        f'{_table}_ai',
+        _task_count_triggers(_table, _column)[0],
+        [_task_counts_fill_sql(_table, _column, 'AND id BETWEEN :first_id AND :last_id')],
+    ))
+
+
+def _create_lookup_indexes(cursor) -> None:
+    # Имена проектов могут повторяться; для пользователей индексы уникальные,
+    # если в уже существующей базе нет дублей
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_projects_name ON projects (name)')
+    for column in ('username', 'email'):
+        try:
+            cursor.execute(
+                f'CREATE UNIQUE INDEX IF NOT EXISTS idx_users_{column} ON users ({column})'
+            )
+        except sqlite3.IntegrityError:
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_users_{column} ON users ({column})')
+
+
+# Миграции схемы: элемент с индексом N переводит базу с версии N на N + 1.
+# Текущая версия хранится в PRAGMA user_version
+MIGRATIONS = [
+    [
+        'CREATE INDEX IF NOT EXISTS idx_tasks_project_status ON tasks (project_id, status)',
+        'CREATE INDEX IF NOT EXISTS idx_tasks_assignee_status ON tasks (assignee_id, status)',
+        'CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status)',
+        'CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date)',
+    ],
+    [
+        _create_tasks_fts,
+    ],
+    [
+        'CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL)',
+        "INSERT OR IGNORE INTO settings (key, value) VALUES ('date_storage', 'text')",
+    ],
+    [
+        # Покрывающие индексы для агрегатов по проектам и исполнителям;
+        # префикс (project_id, status) заменяет прежние индексы
+        'CREATE INDEX IF NOT EXISTS idx_tasks_project_stats '
+        'ON tasks (project_id, status, priority, due_date)',
+        'CREATE INDEX IF NOT EXISTS idx_tasks_assignee_stats '
+        'ON tasks (assignee_id, status, priority, due_date)',
+        'DROP INDEX IF EXISTS idx_tasks_project_status',
+        'DROP INDEX IF EXISTS idx_tasks_assignee_status',
+    ],
+    [
+        _create_lookup_indexes,
+    ],
+    [
+        _create_change_tracking,
+    ],
+    [
+        _create_task_counts,
+    ],
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def _encode_page_cursor(order_by, value, row_id) -> str:
+    payload = json.dumps([order_by, value, row_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def _decode_page_cursor(token, order_by) -> tuple:
+    try:
+        cursor_order, value, row_id = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f'Invalid page cursor: {token}') from e
+    if cursor_order != order_by:
+        raise ValueError(f'Page cursor was issued for order_by={cursor_order}')
+    return value, row_id
+
+
+def _keyset_condition(after, order_by, descending) -> tuple[str, list]:
+    # Условие «строго после курсора» в порядке сортировки; id разрешает равные значения
+    value, last_id = _decode_page_cursor(after, order_by)
+    operator = '<' if descending else '>'
+    if order_by == 'id':
+        return f'tasks.id {operator} ?', [last_id]
+    return f'(tasks.{order_by}, tasks.id) {operator} (?, ?)', [value, last_id]
+
+
+def _order_clause(order_by, descending=False) -> str:
+    direction = 'DESC' if descending else 'ASC'
+    if order_by == 'id':
+        return f'tasks.id {direction}'
+    return f'tasks.{order_by} {direction}, tasks.id {direction}'
+
+
+def _where(conditions) -> str:
+    return ' WHERE ' + ' AND '.join(conditions) if conditions else ''
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 class DatabaseManager:
-    def __init__(self, db_path="tasks.db") -> None:
-        self.conn = sqlite3.connect(db_path)
+    BEGIN_STATEMENT = 'BEGIN'
+
+    def __init__(self, db_path="tasks.db", date_storage=None) -> None:
+        # date_storage: 'text' или 'epoch'; None — оставить формат, записанный в базе
+        if date_storage is not None and date_storage not in DATE_STORAGES:
+            raise ValueError(f'Invalid date storage: {date_storage}')
+        self.requested_date_storage = date_storage
+        self.epoch_dates = False
+        self.db_path = db_path
+        self.conn = self._connect()
         self.cursor = self.conn.cursor()
+        self._transaction_depth = 0
+        self.fts_enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
 
     def close(self) -> None:
         self.conn.close()
 
+    @contextmanager
+    def transaction(self):
+        # Внешний уровень открывает транзакцию, вложенные — точки сохранения.
+        # Пока транзакция открыта, методы не делают commit после каждого запроса
+        savepoint = self._begin_level()
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            self._rollback_level(savepoint)
+            raise
+        self._transaction_depth -= 1
+        self._commit_level(savepoint)
+
+    def _begin_level(self) -> str | None:
+        # Возвращает имя точки сохранения или None для внешнего уровня
+        savepoint = None
+        if self._transaction_depth == 0:
+            if self.conn.in_transaction:
+                self.conn.commit()
+            self.conn.execute(self.BEGIN_STATEMENT)
+        else:
+            savepoint = f'sp_{self._transaction_depth}'
+            self.conn.execute(f'SAVEPOINT {savepoint}')
+        self._transaction_depth += 1
+        return savepoint
+
+    def _rollback_level(self, savepoint) -> None:
+        if savepoint is None:
+            self.conn.rollback()
+        else:
+            self.conn.execute(f'ROLLBACK TO {savepoint}')
+            self.conn.execute(f'RELEASE {savepoint}')
+
+    def _commit_level(self, savepoint) -> None:
+        if savepoint is None:
+            self.conn.commit()
+        else:
+            self.conn.execute(f'RELEASE {savepoint}')
+
+    @contextmanager
+    def read_snapshot(self):
+        # Несколько чтений из одного снимка базы. BEGIN всегда отложенный: BEGIN IMMEDIATE
+        # пула взял бы блокировку записи, и чтение ждало бы открытую транзакцию писателя.
+        # Только для чтения: по выходе транзакция откатывается. Внутри уже открытой
+        # транзакции снимок и так общий
+        if self._transaction_depth > 0:
+            yield self
+            return
+        if self.conn.in_transaction:
+            self.conn.commit()
+        self.conn.execute('BEGIN')
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            self.conn.rollback()
+
+    def _commit(self) -> None:
+        if self._transaction_depth == 0:
+            self.conn.commit()
+
+    @contextmanager
+    def _autocommit(self):
+        # Одиночная запись вне transaction() фиксируется сразу. При ошибке неявная
+        # транзакция sqlite3 откатывается: иначе соединение осталось бы в ней и в режиме
+        # WAL удерживало бы блокировку записи, а другие потоки получали бы "database is locked"
+        try:
+            yield
+            self._commit()
+        except BaseException:
+            if self._transaction_depth == 0:
+                self.conn.rollback()
+            raise
+
     def create_tables(self) -> None:
         self.cursor.execute('''
                     CREATE TABLE IF NOT EXISTS tasks (
@@ -44,264 +475,695 @@ class DatabaseManager:
                                         registration_date DATETIME NOT NULL
                                     )
                                 ''')
-        self.conn.commit()
+        self._commit()
+        self.migrate()
+        self.fts_enabled = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'"
+        ).fetchone() is not None
+        if self.requested_date_storage is not None:
+            self.set_date_storage(self.requested_date_storage)
+        self.epoch_dates = self.get_date_storage() == 'epoch'
+
+    def get_date_storage(self) -> str:
+        row = self.conn.execute("SELECT value FROM settings WHERE key = 'date_storage'").fetchone()
+        return row[0] if row else 'text'
+
+    def set_date_storage(self, storage) -> None:
+        # Переводит все колонки с датами в формат storage на месте
+        if storage not in DATE_STORAGES:
+            raise ValueError(f'Invalid date storage: {storage}')
+        if storage == self.get_date_storage():
+            return
+        with self.transaction():
+            for statement in convert_date_columns_sql(storage):
+                self.cursor.execute(statement)
+            self.cursor.execute(
+                "UPDATE settings SET value = ? WHERE key = 'date_storage'", (storage,)
+            )
+        self.epoch_dates = storage == 'epoch'
+
+    def _to_db(self, value):
+        return to_db_datetime(value, self.epoch_dates)
+
+    def _update(self, table, row_id, kwargs) -> None:
+        fields = []
+        values = []
+
+        for key, value in kwargs.items():
+            if key in DATE_COLUMNS[table] and isinstance(value, datetime):
+                value = self._to_db(value)
+            fields.append(f'{key} = ?')
+            values.append(value)
+
+        values.append(row_id)
+        sql = f"UPDATE {table} SET {', '.join(fields)} WHERE id = ?"
+        with self._autocommit():
+            self.cursor.execute(sql, values)
+
+    def _change_many(self, sql, ids, params, chunk_size, progress) -> int:
+        # sql содержит {ids} — место для списка плейсхолдеров очередной пачки.
+        # Все пачки выполняются в одной транзакции; исключение из progress откатывает всё
+        ids = list(ids)
+        changed = 0
+        done = 0
+        with self.transaction():
+            for chunk in _chunked(ids, chunk_size):
+                placeholders = ', '.join('?' * len(chunk))
+                self.cursor.execute(sql.format(ids=placeholders), [*params, *chunk])
+                changed += self.cursor.rowcount
+                done += len(chunk)
+                if progress is not None:
+                    progress(done, len(ids))
+        return changed
+
+    def insert_rows(self, table, columns, rows) -> range:
+        # Пакетная вставка готовых кортежей значений без построения моделей;
+        # даты должны быть уже в формате хранения базы. Возвращает id вставленных строк
+        if table not in TABLE_COLUMNS or not set(columns) <= set(TABLE_COLUMNS[table]):
+            raise ValueError(f'Invalid columns for {table}: {columns}')
+        # id выдаёт база: диапазон id пачки выводится из last_insert_rowid()
+        if 'id' in columns:
+            raise ValueError('id cannot be inserted explicitly')
+        placeholders = ', '.join('?' * len(columns))
+        return self._executemany_insert(
+            table, f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows
+        )
+
+    def _executemany_insert(self, table, sql, params) -> range:
+        # Внутри одной транзакции AUTOINCREMENT выдаёт id подряд,
+        # поэтому id пачки восстанавливаются по last_insert_rowid()
+        with self.transaction():
+            # Триггеры на вставку срабатывают на каждую строку; на время пачки они снимаются,
+            # а их работа выполняется запросами по диапазону id в той же транзакции
+            existing = {
+                name for (name,) in self.cursor.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ?",
+                    (table,),
+                ).fetchall()
+            }
+            deferred = [
+                trigger for trigger in BULK_INSERT_TRIGGERS.get(table, ()) if trigger[0] in existing
+            ]
+            for name, _, _ in deferred:
+                self.cursor.execute(f'DROP TRIGGER {name}')
+            self.cursor.executemany(sql, params)
+            count = self.cursor.rowcount
+            last_id = self.cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+            ids = range(last_id - count + 1, last_id + 1) if count > 0 else range(0)
+            for _, create, statements in deferred:
+                if ids:
+                    for statement in statements:
+                        self.cursor.execute(statement, {'first_id': ids[0], 'last_id': ids[-1]})
+                self.cursor.execute(create)
+        return ids
+
+    def get_change_version(self) -> int:
+        return self.conn.execute('SELECT version FROM change_counter').fetchone()[0]
+
+    def get_changes_since(self, version) -> dict:
+        # {'version': текущая версия, 'tasks': {'upserted': [...], 'deleted': [...]}, ...}.
+        # Следующий запрос делается с полученной версией
+        changes = {}
+        with self.read_snapshot():
+            changes['version'] = self.get_change_version()
+            for table in TRACKED_COLUMNS:
+                upserted = self.conn.execute(
+                    f'SELECT id FROM {table} WHERE row_version > ? ORDER BY id', (version,)
+                ).fetchall()
+                deleted = self.conn.execute(
+                    'SELECT row_id FROM deleted_rows '
+                    'WHERE table_name = ? AND row_version > ? ORDER BY row_id',
+                    (table, version)
+                ).fetchall()
+                changes[table] = {
+                    'upserted': [row_id for (row_id,) in upserted],
+                    'deleted': [row_id for (row_id,) in deleted],
+                }
+        return changes
+
+    def prune_deleted_rows(self, version) -> int:
+        # Записи об удалении, которые уже получили все читатели, больше не нужны.
+        # Приложение вызывает его при запуске, пока ни одно окно не держит версию
+        with self._autocommit():
+            self.cursor.execute('DELETE FROM deleted_rows WHERE row_version <= ?', (version,))
+        return self.cursor.rowcount
+
+    def _select_by_ids(self, table, ids, model) -> list:
+        result = []
+        for chunk in _chunked(ids, IN_CHUNK_SIZE):
+            placeholders = ', '.join('?' * len(chunk))
+            self.cursor.execute(
+                f'SELECT * FROM {table} WHERE id IN ({placeholders}) ORDER BY id', chunk
+            )
+            result.extend(model.from_row(row) for row in self.cursor.fetchall())
+        return result
+
+    def get_schema_version(self) -> int:
+        return self.conn.execute('PRAGMA user_version').fetchone()[0]
+
+    def migrate(self) -> None:
+        version = self.get_schema_version()
+        if version >= SCHEMA_VERSION:
+            return
+        with self.transaction():
+            for steps in MIGRATIONS[version:]:
+                for step in steps:
+                    if callable(step):
+                        step(self.cursor)
+                    else:
+                        self.cursor.execute(step)
+            self.cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
 
     def add_task(self, task: Task) -> int:
-        self.cursor.execute(
+        with self._autocommit():
+            self.cursor.execute(
+                '''
+                INSERT INTO tasks (title, description, priority, 
+                status, due_date, project_id, assignee_id) VALUES
+                (?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    task.title,
+                    task.description,
+                    task.priority,
+                    task.status,
+                    self._to_db(task.due_date),
+                    task.project_id,
+                    task.assignee_id
+                ))
+        task.id = self.cursor.lastrowid
+        return task.id
+
+    def _insert_many(self, table, sql, objects, to_params, chunk_size) -> list[int]:
+        # Каждая пачка — отдельная транзакция
+        ids = []
+        for chunk in _chunked(objects, chunk_size):
+            chunk_ids = self._executemany_insert(table, sql, [to_params(obj) for obj in chunk])
+            for obj, obj_id in zip(chunk, chunk_ids):
+                obj.id = obj_id
+            ids.extend(chunk_ids)
+        return ids
+
+    def add_tasks_bulk(self, tasks, chunk_size=BULK_CHUNK_SIZE) -> list[int]:
+        return self._insert_many(
+            'tasks',
             '''
-            INSERT INTO tasks (title, description, priority, 
+            INSERT INTO tasks (title, description, priority,
             status, due_date, project_id, assignee_id) VALUES
             (?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            ''',
+            tasks,
+            lambda task: (
                 task.title,
                 task.description,
                 task.priority,
                 task.status,
-                task.due_date.strftime("%Y-%m-%d %H:%M:%S"),
+                self._to_db(task.due_date),
                 task.project_id,
                 task.assignee_id
-            ))
-        self.conn.commit()
-        task.id = self.cursor.lastrowid
-        return task.id
+            ),
+            chunk_size
+        )
 
     def get_task_by_id(self, task_id) -> Task | None:
         self.cursor.execute('SELECT * FROM tasks WHERE id = ?', (task_id,))
         row = self.cursor.fetchone()
         if row:
-            task = Task(
-                title=row[1],
-                description=row[2],
-                priority=row[3],
-                due_date=datetime.strptime(row[5], "%Y-%m-%d %H:%M:%S"),
-                project_id=row[6],
-                assignee_id=row[7]
-            )
-            task.id = row[0]
-            task.status = row[4]
-            return task
+            return Task.from_row(row)
         return None
 
+    def _iter_rows(self, sql, params=(), batch_size=ITER_BATCH_SIZE):
+        # Отдельный курсор: self.cursor можно использовать, пока генератор не исчерпан.
+        # Незавершённый генератор держит чтение открытым — его нужно дочитать или закрыть
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            cursor.close()
+
+    def iter_tasks(self, batch_size=ITER_BATCH_SIZE, order_by='id', **filters):
+        # Потоковое чтение задач пачками по batch_size; фильтры как в count_task_rows
+        if order_by not in TASK_ORDER_COLUMNS:
+            raise ValueError(f'Invalid order_by: {order_by}')
+        conditions, params = self._task_filters(**filters)
+        sql = f'SELECT tasks.* FROM tasks{_where(conditions)} ORDER BY {_order_clause(order_by)}'
+        for row in self._iter_rows(sql, params, batch_size):
+            yield Task.from_row(row)
+
+    def iter_table_rows(self, table, batch_size=ITER_BATCH_SIZE, as_json=False, **filters):
+        # Сырые кортежи в порядке TABLE_COLUMNS без построения моделей.
+        # as_json=True — одна колонка с готовым JSON-объектом строки (json_object из SQLite).
+        # Даты отдаются текстом 'YYYY-MM-DD HH:MM:SS' при любом формате хранения;
+        # фильтры (как в iter_tasks) поддерживаются только для tasks
+        if table not in TABLE_COLUMNS:
+            raise ValueError(f'Invalid table: {table}')
+        if filters and table != 'tasks':
+            raise ValueError(f'Filters are supported only for tasks, got {table}')
+        columns = [
+            f"CASE typeof({table}.{column}) WHEN 'integer' "
+            f"THEN datetime({table}.{column}, 'unixepoch', 'localtime') ELSE {table}.{column} END"
+            if column in DATE_COLUMNS[table] else f'{table}.{column}'
+            for column in TABLE_COLUMNS[table]
+        ]
+        if as_json:
+            pairs = (f"'{name}', {column}" for name, column in zip(TABLE_COLUMNS[table], columns))
+            columns = [f"json_object({', '.join(pairs)})"]
+        conditions, params = self._task_filters(**filters) if filters else ([], [])
+        sql = f"SELECT {', '.join(columns)} FROM {table}{_where(conditions)} ORDER BY {table}.id"
+        return self._iter_rows(sql, params, batch_size)
+
     def get_all_tasks(self) -> list[Task]:
         self.cursor.execute('SELECT * FROM tasks')
-        rows = self.cursor.fetchall()
-        tasks = []
-        for row in rows:
-            task = Task(
-                title=row[1],
-                description=row[2],
-                priority=row[3],
-                due_date=datetime.strptime(row[5], "%Y-%m-%d %H:%M:%S"),
-                project_id=row[6],
-                assignee_id=row[7]
-            )
-            task.id = row[0]
-            task.status = row[4]
-            tasks.append(task)
-        return tasks
+        return [Task.from_row(row) for row in self.cursor.fetchall()]
 
     def update_task(self, task_id, **kwargs) -> bool:
-        fields = []
-        values = []
+        self._update('tasks', task_id, kwargs)
 
-        for key, value in kwargs.items():
-            if key == 'due_date' and isinstance(value, datetime):
-                value = value.strftime('%Y-%m-%d %H:%M:%S')
-            fields.append(f'{key} = ?')
-            values.append(value)
+    def delete_task(self, task_id) -> bool:
+        with self._autocommit():
+            self.cursor.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
 
-        values.append(task_id)
-        sql = f"UPDATE tasks SET {', '.join(fields)} WHERE id = ?"
-        self.cursor.execute(sql, values)
-        self.conn.commit()
+    def delete_tasks(self, task_ids, chunk_size=IN_CHUNK_SIZE, progress=None) -> int:
+        return self._change_many(
+            'DELETE FROM tasks WHERE id IN ({ids})', task_ids, (), chunk_size, progress
+        )
 
-    def delete_task(self, task_id) -> bool:
-        self.cursor.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
-        self.conn.commit()
+    def update_tasks_status(self, task_ids, status, chunk_size=IN_CHUNK_SIZE, progress=None) -> int:
+        if status not in Task.STATUSES:
+            raise ValueError(f'Invalid status: {status}')
+        return self._change_many(
+            'UPDATE tasks SET status = ? WHERE id IN ({ids})', task_ids, (status,),
+            chunk_size, progress,
+        )
 
-    def search_tasks(self, query) -> list[Task]:
-        self.cursor.execute(
-            '''
+    def search_tasks(self, query, limit=None) -> list[Task]:
+        match = _fts_query(query)
+        if not self.fts_enabled or not match:
+            return self._search_tasks_like(query, limit)
+        sql = '''
+            SELECT tasks.* FROM tasks_fts
+            JOIN tasks ON tasks.id = tasks_fts.rowid
+            WHERE tasks_fts MATCH ?
+            ORDER BY bm25(tasks_fts)
+        '''
+        params = [match]
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        self.cursor.execute(sql, params)
+        return [Task.from_row(row) for row in self.cursor.fetchall()]
+
+    def search_tasks_highlighted(self, query, markers=('[', ']'), limit=None) -> list[tuple]:
+        # Возвращает (id задачи, название, описание) с выделенными совпадениями
+        match = _fts_query(query)
+        if not self.fts_enabled or not match:
+            return [
+                (task.id, task.title, task.description)
+                for task in self._search_tasks_like(query, limit)
+            ]
+        start, end = markers
+        sql = '''
+            SELECT rowid, highlight(tasks_fts, 0, ?, ?), highlight(tasks_fts, 1, ?, ?)
+            FROM tasks_fts
+            WHERE tasks_fts MATCH ?
+            ORDER BY bm25(tasks_fts)
+        '''
+        params = [start, end, start, end, match]
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        return self.cursor.execute(sql, params).fetchall()
+
+    def _search_tasks_like(self, query, limit=None) -> list[Task]:
+        sql = '''
             SELECT * FROM tasks
             WHERE title LIKE ? OR description LIKE ?
+        '''
+        params = [f'%{query}%', f'%{query}%']
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        self.cursor.execute(sql, params)
+        return [Task.from_row(row) for row in self.cursor.fetchall()]
+
+    def _row_cursor(self):
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        return cursor
+
+    def _task_filters(self, text=None, status=None, priority=None, project_id=None,
+                      assignee_id=None, due_before=None, overdue_at=None,
+                      ids=None) -> tuple[list[str], list]:
+        conditions = []
+        params = []
+        if ids is not None:
+            # Короткий список id (не длиннее IN_CHUNK_SIZE), например изменённые строки
+            conditions.append(f"tasks.id IN ({', '.join('?' * len(ids))})")
+            params.extend(ids)
+        if text:
+            condition, values = self._text_filter(text)
+            conditions.append(condition)
+            params.extend(values)
+        for condition, value in (
+            ('tasks.status = ?', status),
+            ('tasks.priority = ?', priority),
+            ('tasks.project_id = ?', project_id),
+            ('tasks.assignee_id = ?', assignee_id),
+            ('tasks.due_date < ?', due_before and self._to_db(due_before)),
+            (
+                "tasks.status != 'completed' AND tasks.due_date < ?",
+                overdue_at and self._to_db(overdue_at),
+            ),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        return conditions, params
+
+    def _text_filter(self, text) -> tuple[str, list]:
+        match = _fts_query(text)
+        if self.fts_enabled and match:
+            return 'tasks.id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)', [match]
+        return '(tasks.title LIKE ? OR tasks.description LIKE ?)', [f'%{text}%', f'%{text}%']
+
+    def count_task_rows(self, **filters) -> int:
+        conditions, params = self._task_filters(**filters)
+        sql = 'SELECT COUNT(*) FROM tasks' + _where(conditions)
+        return self.conn.execute(sql, params).fetchone()[0]
+
+    def query_task_rows(self, text=None, status=None, priority=None, project_id=None,
+                        assignee_id=None, due_before=None, order_by='id', descending=False,
+                        limit=100, after=None, ids=None,
+                        offset=0) -> tuple[list[sqlite3.Row], str | None]:
+        # Фильтрация, сортировка и постраничный вывод (keyset) на стороне SQLite.
+        # Возвращает строки страницы и курсор следующей страницы (или None).
+        # offset — переход сразу к далёкой странице, когда её курсор ещё не известен
+        if order_by not in TASK_ORDER_COLUMNS:
+            raise ValueError(f'Invalid order_by: {order_by}')
+        conditions, params = self._task_filters(
+            text=text,
+            status=status,
+            priority=priority,
+            project_id=project_id,
+            assignee_id=assignee_id,
+            due_before=due_before,
+            ids=ids,
+        )
+        if after is not None:
+            condition, values = _keyset_condition(after, order_by, descending)
+            conditions.append(condition)
+            params.extend(values)
+
+        order = _order_clause(order_by, descending)
+        sql = f'{TASK_ROWS_SELECT}{_where(conditions)} ORDER BY {order} LIMIT ? OFFSET ?'
+        params.extend([limit + 1, offset])
+
+        cursor = self._row_cursor()
+        rows = cursor.execute(sql, params).fetchall()
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, _encode_page_cursor(order_by, last[order_by], last['id'])
+
+    def get_overdue_tasks(self, now, limit=None) -> list[Task]:
+        sql = '''
+            SELECT * FROM tasks
+            WHERE status != 'completed' AND due_date < ?
+            ORDER BY due_date
+        '''
+        params = [self._to_db(now)]
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        self.cursor.execute(sql, params)
+        return [Task.from_row(row) for row in self.cursor.fetchall()]
+
+    def get_task_stats(self, group_by, now) -> dict[int, dict]:
+        # Счётчики задач по проекту или исполнителю одним GROUP BY по покрывающему индексу.
+        # В результат попадают только id, у которых есть задачи
+        if group_by not in TASK_STATS_GROUPS:
+            raise ValueError(f'Invalid group_by: {group_by}')
+        now = self._to_db(now)
+        self.cursor.execute(
+            f'''
+            SELECT {group_by}, status, priority, COUNT(*),
+                   SUM(status != 'completed' AND due_date < ?),
+                   MIN(CASE WHEN status != 'completed' AND due_date >= ? THEN due_date END)
+            FROM tasks
+            WHERE {group_by} IS NOT NULL
+            GROUP BY {group_by}, status, priority
             ''',
-            (f'%{query}%', f'%{query}%')
+            (now, now)
         )
-        rows = self.cursor.fetchall()
-        results = []
-        for row in rows:
-            task = Task(
-                title=row[1],
-                description=row[2],
-                priority=row[3],
-                due_date=datetime.strptime(row[5], "%Y-%m-%d %H:%M:%S"),
-                project_id=row[6],
-                assignee_id=row[7]
-            )
-            task.id = row[0]
-            task.status = row[4]
-            results.append(task)
-        return results
+        stats = {}
+        for group_id, status, priority, count, overdue, next_due in self.cursor.fetchall():
+            entry = stats.get(group_id)
+            if entry is None:
+                entry = stats[group_id] = {
+                    'total': 0,
+                    'by_status': dict.fromkeys(Task.STATUSES, 0),
+                    'by_priority': {},
+                    'overdue': 0,
+                    'next_due': None,
+                }
+            entry['total'] += count
+            entry['by_status'][status] = entry['by_status'].get(status, 0) + count
+            entry['by_priority'][priority] = entry['by_priority'].get(priority, 0) + count
+            entry['overdue'] += overdue
+            if next_due is not None:
+                next_due = from_db_datetime(next_due)
+                if entry['next_due'] is None or next_due < entry['next_due']:
+                    entry['next_due'] = next_due
+        return stats
+
+    def get_task_counts(self, group_by, ids=None) -> dict[int, dict]:
+        # {id: {'total', 'by_status'}} из таблицы-счётчика: строк читается не больше,
+        # чем статусов у выбранных id, независимо от числа задач
+        if group_by not in TASK_COUNT_TABLES:
+            raise ValueError(f'Invalid group_by: {group_by}')
+        sql = f'SELECT {group_by}, status, count FROM {TASK_COUNT_TABLES[group_by]}'
+        if ids is None:
+            rows = self.conn.execute(sql).fetchall()
+        else:
+            rows = []
+            for chunk in _chunked(ids, IN_CHUNK_SIZE):
+                placeholders = ', '.join('?' * len(chunk))
+                chunk_sql = f'{sql} WHERE {group_by} IN ({placeholders})'
+                rows.extend(self.conn.execute(chunk_sql, chunk).fetchall())
+        counts = {}
+        for group_id, status, count in rows:
+            entry = counts.get(group_id)
+            if entry is None:
+                entry = counts[group_id] = {
+                    'total': 0,
+                    'by_status': dict.fromkeys(Task.STATUSES, 0),
+                }
+            entry['total'] += count
+            entry['by_status'][status] = entry['by_status'].get(status, 0) + count
+        return counts
+
+    def rebuild_task_counts(self) -> None:
+        # Пересчёт таблиц-счётчиков по tasks, например после правки базы в обход триггеров
+        with self.transaction():
+            _rebuild_task_counts(self.cursor)
+
+    def verify_task_counts(self) -> list[tuple]:
+        # Расхождения счётчиков с GROUP BY по tasks: (таблица, id, статус, в счётчике, в задачах)
+        mismatches = []
+        with self.read_snapshot():
+            for column, table in TASK_COUNT_TABLES.items():
+                stored = {
+                    (group_id, status): count
+                    for group_id, status, count in self.conn.execute(
+                        f'SELECT {column}, status, count FROM {table}'
+                    )
+                }
+                actual = {
+                    (group_id, status): count
+                    for group_id, status, count in self.conn.execute(
+                        f'''
+                        SELECT {column}, status, COUNT(*) FROM tasks
+                        WHERE {column} IS NOT NULL GROUP BY {column}, status
+                        '''
+                    )
+                }
+                for key in sorted(stored.keys() | actual.keys()):
+                    if stored.get(key, 0) != actual.get(key, 0):
+                        mismatches.append((table, *key, stored.get(key, 0), actual.get(key, 0)))
+        return mismatches
 
     def get_tasks_by_project(self, project_id) -> list[Task]:
         self.cursor.execute('SELECT * FROM tasks WHERE project_id = ?', (project_id,))
-        rows = self.cursor.fetchall()
-        tasks = []
-        for row in rows:
-            task = Task(
-                title=row[1],
-                description=row[2],
-                priority=row[3],
-                due_date=datetime.strptime(row[5], "%Y-%m-%d %H:%M:%S"),
-                project_id=row[6],
-                assignee_id=row[7]
-            )
-            task.id = row[0]
-            task.status = row[4]
-            tasks.append(task)
-        return tasks
+        return [Task.from_row(row) for row in self.cursor.fetchall()]
 
     def get_tasks_by_user(self, user_id) -> list[Task]:
         self.cursor.execute('SELECT * FROM tasks WHERE assignee_id = ?', (user_id,))
-        rows = self.cursor.fetchall()
-        tasks = []
-        for row in rows:
-            task = Task(
-                title=row[1],
-                description=row[2],
-                priority=row[3],
-                due_date=datetime.strptime(row[5], "%Y-%m-%d %H:%M:%S"),
-                project_id=row[6],
-                assignee_id=row[7]
-            )
-            task.id = row[0]
-            task.status = row[4]
-            tasks.append(task)
-        return tasks
+        return [Task.from_row(row) for row in self.cursor.fetchall()]
 
     def add_project(self, project: Project) -> int:
-        self.cursor.execute(
+        with self._autocommit():
+            self.cursor.execute(
+                '''
+                INSERT INTO projects (name, description, start_date, end_date, status) 
+                VALUES (?, ?, ?, ?, ?)
+                ''', (
+                    project.name,
+                    project.description,
+                    self._to_db(project.start_date),
+                    self._to_db(project.end_date),
+                    project.status,
+                ))
+        project.id = self.cursor.lastrowid
+        return project.id
+
+    def add_projects_bulk(self, projects, chunk_size=BULK_CHUNK_SIZE) -> list[int]:
+        return self._insert_many(
+            'projects',
             '''
-            INSERT INTO projects (name, description, start_date, end_date, status) 
+            INSERT INTO projects (name, description, start_date, end_date, status)
             VALUES (?, ?, ?, ?, ?)
-            ''', (
+            ''',
+            projects,
+            lambda project: (
                 project.name,
                 project.description,
-                project.start_date.strftime("%Y-%m-%d %H:%M:%S"),
-                project.end_date.strftime("%Y-%m-%d %H:%M:%S"),
+                self._to_db(project.start_date),
+                self._to_db(project.end_date),
                 project.status,
-            ))
-        self.conn.commit()
-        project.id = self.cursor.lastrowid
-        return project.id
+            ),
+            chunk_size
+        )
 
     def get_project_by_id(self, project_id) -> Project | None:
         self.cursor.execute('SELECT * FROM projects WHERE id = ?', (project_id,))
         row = self.cursor.fetchone()
         if row:
-            return Project(
-                name=row[1],
-                description=row[2],
-                start_date=datetime.strptime(row[3], "%Y-%m-%d %H:%M:%S"),
-                end_date=datetime.strptime(row[4], "%Y-%m-%d %H:%M:%S"),
-                status=row[5],
-            )
+            return Project.from_row(row)
+        return None
+
+    def get_project_by_name(self, name) -> Project | None:
+        self.cursor.execute('SELECT * FROM projects WHERE name = ? ORDER BY id LIMIT 1', (name,))
+        row = self.cursor.fetchone()
+        if row:
+            return Project.from_row(row)
         return None
 
+    def iter_projects(self, batch_size=ITER_BATCH_SIZE):
+        for row in self._iter_rows('SELECT * FROM projects ORDER BY id', batch_size=batch_size):
+            yield Project.from_row(row)
+
+    def get_projects_by_ids(self, project_ids) -> list[Project]:
+        return self._select_by_ids('projects', project_ids, Project)
+
     def get_all_projects(self) -> list[Project]:
         self.cursor.execute('SELECT * FROM projects')
-        rows = self.cursor.fetchall()
-        projects = []
+        return [Project.from_row(row) for row in self.cursor.fetchall()]
+
+    def iter_projects_with_task_counts(self, batch_size=ITER_BATCH_SIZE):
+        # Проекты вместе с числом задач и выполненных задач одним запросом;
+        # задачи не читаются — суммируются строки таблицы-счётчика
+        rows = self._iter_rows('''
+            SELECT projects.*, COALESCE(SUM(counts.count), 0),
+                   COALESCE(SUM(CASE WHEN counts.status = 'completed' THEN counts.count END), 0)
+            FROM projects
+            LEFT JOIN project_task_counts AS counts ON counts.project_id = projects.id
+            GROUP BY projects.id
+            ORDER BY projects.id
+        ''', batch_size=batch_size)
         for row in rows:
-            project = Project(
-                name=row[1],
-                description=row[2],
-                start_date=datetime.strptime(row[3], "%Y-%m-%d %H:%M:%S"),
-                end_date=datetime.strptime(row[4], "%Y-%m-%d %H:%M:%S"),
-                status=row[5],
-            )
-            project.id = row[0]
-            projects.append(project)
-        return projects
+            yield Project.from_row(row), row[-2], row[-1]
 
     def update_project(self, project_id, **kwargs) -> bool:
-        fields = []
-        values = []
-
-        for key, value in kwargs.items():
-            if (key == 'start_date' or key == 'end_date') and isinstance(value, datetime):
-                value = value.strftime('%Y-%m-%d %H:%M:%S')
-            fields.append(f'{key} = ?')
-            values.append(value)
-
-        values.append(project_id)
-        sql = f"UPDATE projects SET {', '.join(fields)} WHERE id = ?"
-        self.cursor.execute(sql, values)
-        self.conn.commit()
+        self._update('projects', project_id, kwargs)
 
     def delete_project(self, project_id) -> bool:
-        self.cursor.execute('DELETE FROM projects WHERE id = ?', (project_id,))
-        self.conn.commit()
+        with self._autocommit():
+            self.cursor.execute('DELETE FROM projects WHERE id = ?', (project_id,))
+
+    def delete_projects(self, project_ids, chunk_size=IN_CHUNK_SIZE, progress=None) -> int:
+        return self._change_many(
+            'DELETE FROM projects WHERE id IN ({ids})', project_ids, (), chunk_size, progress
+        )
 
     def add_user(self, user: User) -> int:
-        self.cursor.execute(
+        with self._autocommit():
+            self.cursor.execute(
+                '''
+                INSERT INTO users (username, email, role, registration_date) 
+                VALUES (?, ?, ?, ?)
+                ''', (
+                    user.username,
+                    user.email,
+                    user.role,
+                    self._to_db(user.registration_date)
+                ))
+        user.id = self.cursor.lastrowid
+        return user.id
+
+    def add_users_bulk(self, users, chunk_size=BULK_CHUNK_SIZE) -> list[int]:
+        return self._insert_many(
+            'users',
             '''
-            INSERT INTO users (username, email, role, registration_date) 
+            INSERT INTO users (username, email, role, registration_date)
             VALUES (?, ?, ?, ?)
-            ''', (
+            ''',
+            users,
+            lambda user: (
                 user.username,
                 user.email,
                 user.role,
-                user.registration_date.strftime("%Y-%m-%d %H:%M:%S")
-            ))
-        self.conn.commit()
-        user.id = self.cursor.lastrowid
-        return user.id
+                self._to_db(user.registration_date)
+            ),
+            chunk_size
+        )
 
     def get_user_by_id(self, user_id) -> User | None:
         self.cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
         row = self.cursor.fetchone()
         if row:
-            user = User(
-                username=row[1],
-                email=row[2],
-                role=row[3],
-            )
-            user.id = row[0]
-            user.registration_date = datetime.strptime(row[4], "%Y-%m-%d %H:%M:%S")
-            return user
+            return User.from_row(row)
+        return None
+
+    def get_user_by_username(self, username) -> User | None:
+        self.cursor.execute(
+            'SELECT * FROM users WHERE username = ? ORDER BY id LIMIT 1', (username,)
+        )
+        row = self.cursor.fetchone()
+        if row:
+            return User.from_row(row)
+        return None
+
+    def get_user_by_email(self, email) -> User | None:
+        self.cursor.execute('SELECT * FROM users WHERE email = ? ORDER BY id LIMIT 1', (email,))
+        row = self.cursor.fetchone()
+        if row:
+            return User.from_row(row)
         return None
 
+    def iter_users(self, batch_size=ITER_BATCH_SIZE):
+        for row in self._iter_rows('SELECT * FROM users ORDER BY id', batch_size=batch_size):
+            yield User.from_row(row)
+
+    def get_users_by_ids(self, user_ids) -> list[User]:
+        return self._select_by_ids('users', user_ids, User)
+
     def get_all_users(self) -> list[User]:
         self.cursor.execute('SELECT * FROM users')
-        rows = self.cursor.fetchall()
-        users = []
-        for row in rows:
-            user = User(
-                username=row[1],
-                email=row[2],
-                role=row[3],
-            )
-            user.id = row[0]
-            user.registration_date = datetime.strptime(row[4], "%Y-%m-%d %H:%M:%S")
-            users.append(user)
-        return users
+        return [User.from_row(row) for row in self.cursor.fetchall()]
 
     def update_user(self, user_id, **kwargs) -> bool:
-        fields = []
-        values = []
-
-        for key, value in kwargs.items():
-            if key == 'registration_date' and isinstance(value, datetime):
-                value = value.strftime('%Y-%m-%d %H:%M:%S')
-            fields.append(f'{key} = ?')
-            values.append(value)
-
-        values.append(user_id)
-        sql = f"UPDATE users SET {', '.join(fields)} WHERE id = ?"
-        self.cursor.execute(sql, values)
-        self.conn.commit()
+        self._update('users', user_id, kwargs)
 
     def delete_user(self, user_id) -> bool:
-        self.cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
-        self.conn.commit()
+        with self._autocommit():
+            self.cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
+
+    def delete_users(self, user_ids, chunk_size=IN_CHUNK_SIZE, progress=None) -> int:
+        return self._change_many(
+            'DELETE FROM users WHERE id IN ({ids})', user_ids, (), chunk_size, progress
+        )
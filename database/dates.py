@@ -0,0 +1,39 @@
+from datetime import datetime
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+DATE_STORAGES = ('text', 'epoch')
+
+# Колонки с датами по таблицам
+DATE_COLUMNS = {
+    'tasks': ('due_date',),
+    'projects': ('start_date', 'end_date'),
+    'users': ('registration_date',),
+}
+
+
+def to_db_datetime(value, epoch=False):
+    # Наивные datetime считаются локальным временем, epoch хранится в секундах UTC
+    if epoch:
+        return int(value.timestamp())
+    return value.strftime(DATETIME_FORMAT)
+
+
+def from_db_datetime(value) -> datetime:
+    if isinstance(value, int):
+        return datetime.fromtimestamp(value)
+    return datetime.fromisoformat(value)
+
+
+def convert_date_columns_sql(storage) -> list[str]:
+    if storage == 'epoch':
+        expression = "CAST(strftime('%s', {column}, 'utc') AS INTEGER)"
+        source_type = 'text'
+    else:
+        expression = "datetime({column}, 'unixepoch', 'localtime')"
+        source_type = 'integer'
+    return [
+        f"UPDATE {table} SET {column} = {expression.format(column=column)} "
+        f"WHERE typeof({column}) = '{source_type}'"
+        for table, columns in DATE_COLUMNS.items()
+        for column in columns
+    ]
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Потоковая выгрузка таблиц в CSV или JSON Lines (опционально gzip)
+Запуск: python -m database.export <база> <tasks|projects|users> <файл|-> [опции]
+Пример: python -m database.export database/library.db tasks tasks.jsonl.gz --status pending
+"""
+
+import argparse
+import csv
+import gzip
+import itertools
+import json
+import sqlite3
+import sys
+import time
+from datetime import datetime
+
+from database.database_manager import DatabaseManager, TABLE_COLUMNS
+
+EXPORT_BATCH_SIZE = 5000
+FORMATS = ('csv', 'jsonl')
+
+
+def _write_csv(db_manager, table, out, batch_size, filters) -> int:
+    writer = csv.writer(out)
+    writer.writerow(TABLE_COLUMNS[table])
+    count = 0
+    for row in db_manager.iter_table_rows(table, batch_size, **filters):
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def _json_lines(db_manager, table, batch_size, filters):
+    # JSON собирает SQLite; без функций JSON в сборке — кодируем в Python
+    rows = db_manager.iter_table_rows(table, batch_size, as_json=True, **filters)
+    try:
+        first = next(rows, None)
+    except sqlite3.OperationalError:
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+        columns = TABLE_COLUMNS[table]
+        return (
+            (dumps(dict(zip(columns, row))),)
+            for row in db_manager.iter_table_rows(table, batch_size, **filters)
+        )
+    return itertools.chain([first], rows) if first is not None else rows
+
+
+def _write_jsonl(db_manager, table, out, batch_size, filters) -> int:
+    count = 0
+    for (line,) in _json_lines(db_manager, table, batch_size, filters):
+        out.write(line)
+        out.write('\n')
+        count += 1
+    return count
+
+
+WRITERS = {'csv': _write_csv, 'jsonl': _write_jsonl}
+
+
+def export_rows(db_manager, table, out, fmt='csv', batch_size=EXPORT_BATCH_SIZE,
+                **filters) -> int:
+    # Пишет строки таблицы в текстовый файл out и возвращает их число.
+    # В памяти одновременно не больше одной пачки из batch_size строк
+    if fmt not in FORMATS:
+        raise ValueError(f'Invalid format: {fmt}')
+    return WRITERS[fmt](db_manager, table, out, batch_size, filters)
+
+
+def open_output(path, compress=False):
+    if path == '-':
+        return sys.stdout
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    return open(path, 'w', encoding='utf-8', newline='')
+
+
+def export_table(db_manager, table, path, fmt=None, compress=None, batch_size=EXPORT_BATCH_SIZE,
+                 **filters) -> tuple[int, float]:
+    # Формат и сжатие по умолчанию определяются по имени файла: *.jsonl[.gz], *.csv[.gz]
+    if compress is None:
+        compress = path.endswith('.gz')
+    if fmt is None:
+        fmt = 'jsonl' if path.removesuffix('.gz').endswith('.jsonl') else 'csv'
+    start = time.perf_counter()
+    out = open_output(path, compress)
+    try:
+        count = export_rows(db_manager, table, out, fmt, batch_size, **filters)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return count, time.perf_counter() - start
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Выгрузка таблиц в CSV/JSONL')
+    parser.add_argument('database', help='путь к файлу базы SQLite')
+    parser.add_argument('table', choices=sorted(TABLE_COLUMNS))
+    parser.add_argument('output', help="файл выгрузки или '-' для stdout")
+    parser.add_argument('--format', choices=FORMATS, help='по умолчанию — по расширению файла')
+    parser.add_argument('--gzip', action='store_true', default=None, help='сжать выгрузку')
+    parser.add_argument('--batch-size', type=int, default=EXPORT_BATCH_SIZE)
+    # Фильтры задач
+    parser.add_argument('--text')
+    parser.add_argument('--status')
+    parser.add_argument('--priority', type=int)
+    parser.add_argument('--project-id', type=int)
+    parser.add_argument('--assignee-id', type=int)
+    parser.add_argument('--due-before', type=datetime.fromisoformat)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    filters = {
+        name: value
+        for name, value in (
+            ('text', args.text),
+            ('status', args.status),
+            ('priority', args.priority),
+            ('project_id', args.project_id),
+            ('assignee_id', args.assignee_id),
+            ('due_before', args.due_before),
+        )
+        if value is not None
+    }
+    db_manager = DatabaseManager(args.database)
+    db_manager.create_tables()
+    try:
+        count, elapsed = export_table(
+            db_manager, args.table, args.output, args.format, args.gzip, args.batch_size, **filters
+        )
+    finally:
+        db_manager.close()
+    rate = count / elapsed if elapsed else 0
+    print(f"{args.table}: {count} строк за {elapsed:.2f} с ({rate:.0f} строк/с)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
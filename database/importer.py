@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Потоковая загрузка задач, проектов и пользователей из CSV или JSON Lines (опционально gzip)
+Запуск: python -m database.importer <база> <tasks|projects|users> <файл> [--rejects файл] [опции]
+Пример: python -m database.importer database/library.db tasks tasks.csv.gz --rejects rejected.csv
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import sys
+import time
+from datetime import datetime
+
+from database.database_manager import DatabaseManager
+from database.dates import to_db_datetime
+from models.project import Project
+from models.task import Task
+from models.user import User
+
+IMPORT_BATCH_SIZE = 10000
+FORMATS = ('csv', 'jsonl')
+
+# Колонки, которые заполняет импорт, по таблицам
+IMPORT_COLUMNS = {
+    'tasks': (
+        'title', 'description', 'priority', 'status', 'due_date', 'project_id', 'assignee_id',
+    ),
+    'projects': ('name', 'description', 'start_date', 'end_date', 'status'),
+    'users': ('username', 'email', 'role', 'registration_date'),
+}
+REJECT_COLUMNS = ('line', 'reason', 'record')
+
+
+def _value(record, field):
+    # Пустая ячейка CSV и отсутствующее поле JSON равнозначны
+    value = record.get(field)
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return value
+
+
+def _datetime(record, field, required=True):
+    value = _value(record, field)
+    if value is None:
+        if required:
+            raise ValueError(f'{field} is required')
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f'{field} must be a datetime, got {value!r}') from None
+
+
+def _int(record, field):
+    value = _value(record, field)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{field} must be an integer, got {value!r}') from None
+
+
+def _csv_records(source):
+    reader = csv.DictReader(source)
+    for record in reader:
+        yield reader.line_num, record
+
+
+def _jsonl_records(source):
+    for line_number, line in enumerate(source, 1):
+        if line.strip():
+            yield line_number, line
+
+
+# Чтение записей по форматам из FORMATS
+READERS = {'csv': _csv_records, 'jsonl': _jsonl_records}
+
+
+def _open(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+def read_records(path, fmt=None):
+    # Отдаёт пары (номер строки, запись): dict для CSV, исходный текст строки для JSONL —
+    # он разбирается при проверке, чтобы битая строка ушла в отказы, а не прервала загрузку
+    if fmt is None:
+        fmt = 'jsonl' if path.removesuffix('.gz').endswith('.jsonl') else 'csv'
+    if fmt not in FORMATS:
+        raise ValueError(f'Invalid format: {fmt}')
+    with _open(path) as source:
+        yield from READERS[fmt](source)
+
+
+class Importer:
+    # Проверяет записи пачками по тем же правилам, что и модели, и пишет пачку
+    # одной транзакцией. Ссылки на проекты и пользователей в задачах разрешаются
+    # по картам имя/email -> id, загруженным один раз; явные id сверяются
+    # с множествами существующих id из known_ids
+    def __init__(self, db_manager, batch_size=IMPORT_BATCH_SIZE) -> None:
+        self.db = db_manager
+        self.batch_size = batch_size
+        self.project_ids = None
+        self.user_ids = None
+        self.email_ids = None
+        self.known_ids = None
+
+    def load_lookup_maps(self) -> None:
+        self.project_ids = {}
+        self.known_ids = {'projects': set(), 'users': set()}
+        for project_id, name, *_ in self.db.iter_table_rows('projects'):
+            self.project_ids.setdefault(name, project_id)
+            self.known_ids['projects'].add(project_id)
+        self.user_ids = {}
+        self.email_ids = {}
+        for user_id, username, email, *_ in self.db.iter_table_rows('users'):
+            self.user_ids.setdefault(username, user_id)
+            self.email_ids.setdefault(email, user_id)
+            self.known_ids['users'].add(user_id)
+
+    def import_records(self, table, records, rejects=None) -> dict:
+        # records — пары (номер строки, запись); rejects — csv.writer для отказов или None
+        validate = self._validator(table)
+        imported = 0
+        rejected = 0
+        start = time.perf_counter()
+        batch = []
+        keys = []
+        for line_number, record in records:
+            checked = self._check(validate, line_number, record, rejects)
+            if checked is None:
+                rejected += 1
+                continue
+            batch.append(checked[0])
+            keys.append(checked[1])
+            if len(batch) >= self.batch_size:
+                imported += self._write(table, batch, keys)
+                batch, keys = [], []
+        if batch:
+            imported += self._write(table, batch, keys)
+        return {'imported': imported, 'rejected': rejected, 'seconds': time.perf_counter() - start}
+
+    def _validator(self, table):
+        if table not in IMPORT_COLUMNS:
+            raise ValueError(f'Invalid table: {table}')
+        if self.project_ids is None:
+            self.load_lookup_maps()
+        return getattr(self, f'_{table}_row')
+
+    def _check(self, validate, line_number, record, rejects):
+        # Разбор и проверка одной записи: (строка, ключ) или None, если запись отклонена
+        try:
+            if isinstance(record, str):
+                record = json.loads(record)
+                if not isinstance(record, dict):
+                    raise ValueError('record must be a JSON object')
+            return validate(record)
+        except ValueError as e:
+            if rejects is not None:
+                raw = json.dumps(record, ensure_ascii=False, default=str)
+                rejects.writerow((line_number, str(e), raw))
+            return None
+
+    def _write(self, table, rows, keys) -> int:
+        # Пачка пишется одной транзакцией; новые проекты и пользователи
+        # сразу доступны для ссылок из задач
+        try:
+            ids = self.db.insert_rows(table, IMPORT_COLUMNS[table], rows)
+        except Exception:
+            self._release(table, keys)
+            raise
+        self._remember(table, ids, keys)
+        return len(ids)
+
+    def _remember(self, table, ids, keys) -> None:
+        if table in self.known_ids:
+            self.known_ids[table].update(ids)
+        for row_id, key in zip(ids, keys):
+            if table == 'projects':
+                self.project_ids.setdefault(key, row_id)
+            elif table == 'users':
+                username, email = key
+                self.user_ids[username] = row_id
+                self.email_ids[email] = row_id
+
+    def _release(self, table, keys) -> None:
+        # Пачка не записана: снимаем резервы имён и email, чтобы их можно было загрузить снова
+        if table != 'users':
+            return
+        for username, email in keys:
+            if self.user_ids.get(username, 0) is None:
+                del self.user_ids[username]
+            if self.email_ids.get(email, 0) is None:
+                del self.email_ids[email]
+
+    def _to_db(self, value):
+        return to_db_datetime(value, self.db.epoch_dates)
+
+    def _reference(self, record, id_field, name_field, ids, table):
+        # Ссылка задаётся либо id существующей строки table, либо именем из карты ids
+        reference_id = _int(record, id_field)
+        if reference_id is not None:
+            if reference_id not in self.known_ids[table]:
+                raise ValueError(f'unknown {id_field}: {reference_id}')
+            return reference_id
+        name = _value(record, name_field)
+        if name is None:
+            return None
+        reference_id = ids.get(str(name))
+        if reference_id is None:
+            raise ValueError(f'unknown {name_field}: {name}')
+        return reference_id
+
+    def _tasks_row(self, record):
+        # Правила Task.__init__ и Task.update_status
+        title = _value(record, 'title')
+        if not title:
+            raise ValueError('title cannot be empty')
+        priority = _int(record, 'priority')
+        if priority not in Task.PRIORITIES:
+            raise ValueError('priority must be 1, 2, 3')
+        status = _value(record, 'status') or 'pending'
+        if status not in Task.STATUSES:
+            raise ValueError(f'Invalid status: {status}')
+        due_date = _datetime(record, 'due_date')
+        project_id = self._reference(
+            record, 'project_id', 'project', self.project_ids, 'projects'
+        )
+        # Исполнитель указывается именем пользователя или email
+        assignee = str(_value(record, 'assignee') or '')
+        assignee_ids = self.email_ids if '@' in assignee else self.user_ids
+        assignee_id = self._reference(record, 'assignee_id', 'assignee', assignee_ids, 'users')
+        row = (
+            str(title), _value(record, 'description') or '', priority, status,
+            self._to_db(due_date), project_id, assignee_id,
+        )
+        return row, None
+
+    def _projects_row(self, record):
+        name = _value(record, 'name')
+        if not name:
+            raise ValueError('name cannot be empty')
+        status = _value(record, 'status') or 'active'
+        if status not in Project.STATUSES:
+            raise ValueError(f'Invalid status: {status}')
+        start_date = _datetime(record, 'start_date')
+        end_date = _datetime(record, 'end_date')
+        row = (
+            str(name), _value(record, 'description') or '',
+            self._to_db(start_date), self._to_db(end_date), status,
+        )
+        return row, str(name)
+
+    def _users_row(self, record):
+        username = _value(record, 'username')
+        if not username:
+            raise ValueError('username cannot be empty')
+        username = str(username)
+        email = str(_value(record, 'email') or '')
+        if not User._is_valid_email(email):
+            raise ValueError('Invalid email address')
+        role = _value(record, 'role')
+        if role not in User.ROLES:
+            raise ValueError(f'Invalid role: {role}')
+        # Уникальность проверяется по карте, чтобы дубль не откатил всю пачку
+        if username in self.user_ids:
+            raise ValueError(f'username already exists: {username}')
+        if email in self.email_ids:
+            raise ValueError(f'email already exists: {email}')
+        registration_date = _datetime(record, 'registration_date', required=False) or datetime.now()
+        # Имя и email резервируются только после всех проверок; id появится после записи пачки
+        self.user_ids[username] = None
+        self.email_ids[email] = None
+        return (username, email, role, self._to_db(registration_date)), (username, email)
+
+
+def import_file(db_manager, table, path, rejects_path=None, fmt=None, batch_size=IMPORT_BATCH_SIZE,
+                importer=None) -> dict:
+    importer = importer or Importer(db_manager, batch_size)
+    records = read_records(path, fmt)
+    if rejects_path is None:
+        return importer.import_records(table, records)
+    with open(rejects_path, 'w', encoding='utf-8', newline='') as f:
+        rejects = csv.writer(f)
+        rejects.writerow(REJECT_COLUMNS)
+        return importer.import_records(table, records, rejects)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Загрузка таблиц из CSV/JSONL')
+    parser.add_argument('database', help='путь к файлу базы SQLite')
+    parser.add_argument('table', choices=sorted(IMPORT_COLUMNS))
+    parser.add_argument('input', help='файл CSV или JSONL, можно *.gz')
+    parser.add_argument('--rejects', help='CSV для отклонённых строк с причинами')
+    parser.add_argument('--format', choices=FORMATS, help='по умолчанию — по расширению файла')
+    parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    db_manager = DatabaseManager(args.database)
+    db_manager.create_tables()
+    try:
+        result = import_file(
+            db_manager, args.table, args.input, args.rejects, args.format, args.batch_size
+        )
+    finally:
+        db_manager.close()
+    elapsed = result['seconds']
+    rate = result['imported'] / elapsed if elapsed else 0
+    print(
+        f"{args.table}: загружено {result['imported']}, отклонено {result['rejected']} "
+        f"за {elapsed:.2f} с ({rate:.0f} строк/с)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == '__main__':
+    main()
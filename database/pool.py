@@ -0,0 +1,88 @@
+import sqlite3
+import threading
+import weakref
+
+from database.database_manager import DatabaseManager
+
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+
+
+class _ThreadConnection:
+    # Соединение потока в threading.local: когда поток завершается, объект
+    # освобождается и weakref.finalize закрывает соединение
+    def __init__(self, conn) -> None:
+        self.conn = conn
+
+
+class PooledDatabaseManager(DatabaseManager):
+    # Потокобезопасный режим: у каждого потока своё соединение и свой курсор.
+    # В режиме WAL читатели работают со своим снимком и не ждут писателя,
+    # писатели упорядочиваются самим SQLite через busy_timeout
+    BEGIN_STATEMENT = 'BEGIN IMMEDIATE'
+
+    def __init__(self, db_path="tasks.db", date_storage=None,
+                 busy_timeout_ms=DEFAULT_BUSY_TIMEOUT_MS) -> None:
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        super().__init__(db_path, date_storage=date_storage)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False,
+        )
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute(f'PRAGMA busy_timeout = {int(self.busy_timeout_ms)}')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _release(self, conn) -> None:
+        with self._connections_lock:
+            if conn not in self._connections:
+                return
+            self._connections.remove(conn)
+        conn.close()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            self.conn = self._connect()
+            holder = self._local.holder
+        return holder.conn
+
+    @conn.setter
+    def conn(self, value) -> None:
+        holder = self._local.holder = _ThreadConnection(value)
+        weakref.finalize(holder, self._release, value)
+
+    @property
+    def cursor(self) -> sqlite3.Cursor:
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self._local.cursor = self.conn.cursor()
+        return cursor
+
+    @cursor.setter
+    def cursor(self, value) -> None:
+        self._local.cursor = value
+
+    @property
+    def _transaction_depth(self) -> int:
+        return getattr(self._local, 'transaction_depth', 0)
+
+    @_transaction_depth.setter
+    def _transaction_depth(self, value) -> None:
+        self._local.transaction_depth = value
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Проверка и пересчёт таблиц-счётчиков задач (project_task_counts, user_task_counts)
+Запуск: python -m database.task_counts <база> <verify|rebuild>
+Пример: python -m database.task_counts database/library.db verify
+"""
+
+import argparse
+import sys
+import time
+
+from database.database_manager import DatabaseManager
+
+COMMANDS = ('verify', 'rebuild')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Проверка и пересчёт счётчиков задач')
+    parser.add_argument('database', help='путь к файлу базы SQLite')
+    parser.add_argument('command', choices=COMMANDS,
+                        help='verify — сверить с задачами, rebuild — пересчитать заново')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    # Код возврата 1 — verify нашёл расхождения
+    args = parse_args(argv)
+    db_manager = DatabaseManager(args.database)
+    db_manager.create_tables()
+    start = time.perf_counter()
+    try:
+        if args.command == 'rebuild':
+            db_manager.rebuild_task_counts()
+            mismatches = []
+        else:
+            mismatches = db_manager.verify_task_counts()
+    finally:
+        db_manager.close()
+    elapsed = time.perf_counter() - start
+    for table, group_id, status, stored, actual in mismatches:
+        print(f"{table}: id {group_id}, {status}: в счётчике {stored}, в задачах {actual}")
+    if args.command == 'rebuild':
+        print(f"Счётчики пересчитаны за {elapsed:.2f} с", file=sys.stderr)
+    else:
+        print(f"Расхождений: {len(mismatches)} (проверка за {elapsed:.2f} с)", file=sys.stderr)
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
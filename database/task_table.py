@@ -0,0 +1,130 @@
+from array import array
+from collections import Counter
+from datetime import datetime
+from itertools import compress
+from operator import eq, lt, ne
+
+from models.task import Task
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Статус хранится кодом — номером в Task.STATUSES, неизвестный статус — кодом -1
+STATUS_CODES = {status: code for code, status in enumerate(Task.STATUSES)}
+COMPLETED = STATUS_CODES['completed']
+# Операции условий filter(); для numpy сравнение выполняется над всей колонкой
+OPERATORS = {'==': eq, '!=': ne, '<': lt}
+
+# Колонка -> код типа array; NULL в project_id/assignee_id хранится как 0
+COLUMNS = {
+    'id': 'q',
+    'priority': 'b',
+    'status': 'b',
+    'due': 'q',
+    'project_id': 'q',
+    'assignee_id': 'q',
+}
+
+_STATUS_CASE = ' '.join(f"WHEN '{status}' THEN {code}" for status, code in STATUS_CODES.items())
+TASK_COLUMNS_SELECT = f'''
+    SELECT
+        id,
+        priority,
+        CASE status {_STATUS_CASE} ELSE -1 END,
+        CASE WHEN typeof(due_date) = 'integer' THEN due_date
+             ELSE CAST(strftime('%s', due_date, 'utc') AS INTEGER) END,
+        COALESCE(project_id, 0),
+        COALESCE(assignee_id, 0)
+    FROM tasks
+'''
+
+
+def _to_numpy(column):
+    # Без копирования: массив NumPy смотрит в буфер array
+    if not column:
+        return numpy.empty(0, dtype=column.typecode)
+    return numpy.frombuffer(column, dtype=column.typecode)
+
+
+class TaskTable:
+    # Снимок таблицы tasks по колонкам: типизированные массивы вместо объекта на строку.
+    # С NumPy фильтры и подсчёты векторизованы, без него работают циклы по array
+    def __init__(self, columns) -> None:
+        self.columns = columns
+
+    @classmethod
+    def load(cls, db_manager, batch_size=10000) -> 'TaskTable':
+        columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        targets = list(columns.values())
+        cursor = db_manager.conn.cursor()
+        cursor.execute(TASK_COLUMNS_SELECT)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for target, values in zip(targets, zip(*rows)):
+                target.extend(values)
+        cursor.close()
+        if numpy is not None:
+            columns = {name: _to_numpy(column) for name, column in columns.items()}
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self.columns['id'])
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def filter(self, status=None, priority=None, project_id=None, assignee_id=None,
+               overdue_at=None) -> 'TaskTable':
+        conditions = []
+        if status is not None:
+            conditions.append(('status', '==', STATUS_CODES[status]))
+        if priority is not None:
+            conditions.append(('priority', '==', priority))
+        if project_id is not None:
+            conditions.append(('project_id', '==', project_id))
+        if assignee_id is not None:
+            conditions.append(('assignee_id', '==', assignee_id))
+        if overdue_at is not None:
+            conditions.append(('status', '!=', COMPLETED))
+            conditions.append(('due', '<', int(overdue_at.timestamp())))
+        return self._take(self._mask(conditions))
+
+    def overdue(self, now=None) -> 'TaskTable':
+        return self.filter(overdue_at=now or datetime.now())
+
+    def count_by(self, column) -> dict:
+        values = self.columns[column]
+        if numpy is not None:
+            keys, counts = numpy.unique(values, return_counts=True)
+            return dict(zip(keys.tolist(), counts.tolist()))
+        return dict(Counter(values))
+
+    def count_by_status(self) -> dict:
+        return {
+            Task.STATUSES[code] if code >= 0 else 'unknown': count
+            for code, count in self.count_by('status').items()
+        }
+
+    def _mask(self, conditions):
+        if numpy is not None:
+            mask = numpy.ones(len(self), dtype=bool)
+            for column, op, value in conditions:
+                mask &= OPERATORS[op](self.columns[column], value)
+            return mask
+        mask = [True] * len(self)
+        for column, op, value in conditions:
+            compare = OPERATORS[op]
+            mask = [m and compare(v, value) for m, v in zip(mask, self.columns[column])]
+        return mask
+
+    def _take(self, mask) -> 'TaskTable':
+        if numpy is not None:
+            return TaskTable({name: column[mask] for name, column in self.columns.items()})
+        return TaskTable({
+            name: array(column.typecode, compress(column, mask))
+            for name, column in self.columns.items()
+        })
@@ -15,7 +15,7 @@ try:
     from controllers.task_controller import TaskController
     from controllers.project_controller import ProjectController
     from controllers.user_controller import UserController
-    from database.database_manager import DatabaseManager
+    from database.pool import PooledDatabaseManager
     from views.main_window import MainWindow
 except ImportError as e:
     print(f"Ошибка импорта модулей: {e}")
@@ -26,9 +26,12 @@ except ImportError as e:
 def main():
     """Главная функция приложения"""
     try:
-        # Инициализация базы данных
-        db_manager = DatabaseManager("database/library.db")
+        # Инициализация базы данных: запросы идут и из потока Tk, и из фонового потока
+        db_manager = PooledDatabaseManager("database/library.db")
         db_manager.create_tables()
+        # Записи об удалениях нужны только окнам, которые уже показывают данные.
+        # При запуске окна загружаются заново, поэтому старые записи не нужны никому
+        db_manager.prune_deleted_rows(db_manager.get_change_version())
 
         # Инициализация контроллеров
         task_controller = TaskController(db_manager)
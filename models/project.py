@@ -1,7 +1,9 @@
 from datetime import datetime
+from database.dates import from_db_datetime
 
 class Project:
     STATUSES = ['active', 'completed', 'on_hold']
+    __slots__ = ('id', 'name', 'description', 'start_date', 'end_date', 'status')
 
     def __init__(self, name, description, start_date, end_date, status='active'):
         self.id = None
@@ -14,14 +16,30 @@ class Project:
             raise ValueError(f'Invalid status: {status}')
         self.status = status
 
+    @classmethod
+    def from_row(cls, row):
+        # Строка из БД уже прошла проверки при записи, поэтому __init__ не вызывается
+        project = cls.__new__(cls)
+        project.id = row[0]
+        project.name = row[1]
+        project.description = row[2]
+        project.start_date = from_db_datetime(row[3])
+        project.end_date = from_db_datetime(row[4])
+        project.status = row[5]
+        return project
+
     def update_status(self, new_status):
         if new_status not in self.STATUSES:
             raise ValueError('Invalid status')
         self.status = new_status
 
-    def get_progress(self):
+    def get_progress(self, now=None):
+        # now позволяет считать прогресс нескольких проектов на один момент времени
+        now = now or datetime.now()
         total_time = (self.end_date - self.start_date).total_seconds()
-        elapsed_time = (datetime.now() - self.start_date).total_seconds()
+        elapsed_time = (now - self.start_date).total_seconds()
+        if total_time <= 0:
+            return 100.0 if elapsed_time >= 0 else 0.0
         progress = (elapsed_time / total_time) * 100
 
         if progress < 0:
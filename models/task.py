@@ -1,10 +1,17 @@
 from datetime import datetime
+from database.dates import from_db_datetime
 
 class Task:
+    PRIORITIES = (1, 2, 3)
+    STATUSES = ('pending', 'in_progress', 'completed')
+    __slots__ = (
+        'id', 'title', 'description', 'priority', 'status', 'due_date', 'project_id', 'assignee_id'
+    )
+
     def __init__(self, title, description, priority, due_date, project_id, assignee_id) -> None:
         if not title:
             raise ValueError('title cannot be empty')
-        if priority not in (1, 2, 3):
+        if priority not in self.PRIORITIES:
             raise ValueError('priority must be 1, 2, 3')
         if not isinstance(due_date, datetime):
             raise TypeError('due_date must be a datetime object')
@@ -18,11 +25,22 @@ class Task:
         self.project_id = project_id
         self.assignee_id = assignee_id
 
+    @classmethod
+    def from_row(cls, row) -> 'Task':
+        # Строка из БД уже прошла проверки при записи, поэтому __init__ не вызывается
+        task = cls.__new__(cls)
+        task.id = row[0]
+        task.title = row[1]
+        task.description = row[2]
+        task.priority = row[3]
+        task.status = row[4]
+        task.due_date = from_db_datetime(row[5])
+        task.project_id = row[6]
+        task.assignee_id = row[7]
+        return task
 
     def update_status(self, new_status) -> bool:
-        allowed_statuses = ['pending', 'in_progress', 'completed']
-
-        if new_status not in allowed_statuses:
+        if new_status not in self.STATUSES:
             raise ValueError('Invalid status')
 
         self.status = new_status
@@ -1,8 +1,11 @@
 from datetime import datetime
+from database.dates import from_db_datetime
 import re
 
 class User:
     ROLES = ['admin', 'manager', 'developer']
+    __slots__ = ('id', 'username', 'email', 'role', 'registration_date')
+
     def __init__(self, username, email, role) -> None:
         self.id = None
         self.username = username
@@ -14,7 +17,19 @@ class User:
         if not self._is_valid_email(email):
             raise ValueError('Invalid email address')
 
-    def _is_valid_email(self, email) -> bool:
+    @classmethod
+    def from_row(cls, row) -> 'User':
+        # Строка из БД уже прошла проверки при записи, поэтому __init__ не вызывается
+        user = cls.__new__(cls)
+        user.id = row[0]
+        user.username = row[1]
+        user.email = row[2]
+        user.role = row[3]
+        user.registration_date = from_db_datetime(row[4])
+        return user
+
+    @staticmethod
+    def _is_valid_email(email) -> bool:
         pattern = r'^[\w\.-]+@([\w-]+\.)+[\w-]{2,}$'
         return re.match(pattern, email) is not None
 
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import tempfile
+import threading
+from contextlib import aclosing
+from datetime import datetime, timedelta
+
+from database.async_manager import AsyncDatabaseManager
+from database.pool import PooledDatabaseManager
+from controllers.async_controller import AsyncTaskController, AsyncUserController
+from models.task import Task
+
+
+class TestAsyncDatabaseManager:
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()
+
+    def teardown_method(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+
+    def run(self, scenario, **options):
+        async def main():
+            async_db = AsyncDatabaseManager(PooledDatabaseManager(self.temp_db.name), **options)
+            try:
+                return await scenario(async_db)
+            finally:
+                await async_db.close()
+
+        return asyncio.run(main())
+
+    def test_controllers_and_gather(self):
+        """Асинхронные контроллеры и параллельные чтения через gather"""
+        async def scenario(async_db):
+            tasks = AsyncTaskController(async_db)
+            users = AsyncUserController(async_db)
+            user_id = await users.add_user("async", "async@example.com", "developer")
+            due = datetime.now() + timedelta(days=1)
+            created = await asyncio.gather(*(
+                tasks.add_task(f"Task {i}", "", 1, due, None, user_id) for i in range(5)
+            ))
+            fetched, user_tasks, user = await asyncio.gather(
+                tasks.get_task(created[0].id),
+                tasks.get_tasks_by_user(user_id),
+                async_db.get_user_by_id(user_id),
+            )
+            return fetched.title, len(user_tasks), user.username
+
+        assert self.run(scenario) == ("Task 0", 5, "async")
+
+    def test_back_pressure(self):
+        """Одновременно выполняется не больше max_pending вызовов"""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_call(db):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.01)
+            with lock:
+                active -= 1
+
+        async def scenario(async_db):
+            await asyncio.gather(*(async_db.run(slow_call, async_db.db) for _ in range(10)))
+
+        self.run(scenario, max_workers=4, max_pending=2)
+        assert peak == 2
+
+    def test_run_in_transaction(self):
+        """Несколько операций в одной транзакции на одном потоке"""
+        def add_two(db):
+            due = datetime.now()
+            return [db.add_task(Task(f"T{i}", "", 1, due, None, None)) for i in range(2)]
+
+        async def scenario(async_db):
+            await async_db.create_tables()
+            ids = await async_db.run_in_transaction(add_two)
+            return ids, len(await async_db.get_all_tasks())
+
+        ids, total = self.run(scenario)
+        assert len(ids) == 2
+        assert total == 2
+
+    def test_iterate_generators(self):
+        """Методы iter_* отдаются асинхронными итераторами, читающими пачками"""
+        async def scenario(async_db):
+            await async_db.create_tables()
+            tasks = AsyncTaskController(async_db)
+            due = datetime.now() + timedelta(days=1)
+            for i in range(5):
+                await tasks.add_task(f"Task {i}", "", 1, due, None, None)
+
+            titles = [task.title async for task in async_db.iter_tasks(batch_size=2)]
+            rows = [row async for row in async_db.iter_table_rows("tasks", batch_size=2)]
+            async with aclosing(tasks.iter_tasks(batch_size=2)) as iterator:
+                async for task in iterator:
+                    first = task.title
+                    break
+            return titles, len(rows), first
+
+        titles, rows, first = self.run(scenario)
+        assert titles == [f"Task {i}" for i in range(5)]
+        assert rows == 5
+        assert first == "Task 0"
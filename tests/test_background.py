@@ -0,0 +1,108 @@
+import threading
+import time
+
+from views.background import BackgroundWorker
+
+
+class FakeWidget:
+    """Заменяет виджет Tk: after() только запоминает обратный вызов"""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+
+    def pump(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+def wait_until(widget, condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+        widget.pump()
+    assert condition()
+
+
+class TestBackgroundWorker:
+    def setup_method(self):
+        self.widget = FakeWidget()
+        self.worker = BackgroundWorker(self.widget)
+
+    def teardown_method(self):
+        self.worker.stop()
+
+    def test_result_delivered_on_poll(self):
+        """Результат приходит в обработчик только при опросе из потока UI"""
+        results = []
+        self.worker.submit(lambda a, b: a + b, 2, 3, on_done=results.append)
+        wait_until(self.widget, lambda: results == [5])
+
+    def test_errors_go_to_handler(self):
+        """Исключение из фонового вызова передаётся в on_error"""
+        errors = []
+        self.worker.submit(lambda: 1 / 0, on_error=errors.append)
+        wait_until(self.widget, lambda: len(errors) == 1)
+        assert isinstance(errors[0], ZeroDivisionError)
+
+    def test_refreshes_are_coalesced(self):
+        """Из серии обновлений с одним ключом выполняется и доставляется только последнее"""
+        gate = threading.Event()
+        calls = []
+        results = []
+        self.worker.submit(gate.wait)
+        for i in range(5):
+            self.worker.submit(
+                calls.append, i, key="refresh", on_done=lambda _, i=i: results.append(i)
+            )
+        gate.set()
+
+        wait_until(self.widget, lambda: results == [4])
+        assert calls == [4]
+
+    def test_cancel_with_progress(self):
+        """Отмена прерывает операцию на ближайшем отчёте о прогрессе"""
+        progress = []
+        done = []
+        started = threading.Event()
+        proceed = threading.Event()
+
+        def long_operation(progress):
+            for step in range(1, 4):
+                progress(step, 3)
+                started.set()
+                proceed.wait()
+            return "finished"
+
+        job = self.worker.submit(
+            long_operation, on_progress=lambda *p: progress.append(p), on_done=done.append
+        )
+        started.wait(1)
+        job.cancel()
+        proceed.set()
+        self.worker.submit(lambda: None, on_done=done.append)
+
+        wait_until(self.widget, lambda: done == [None])
+        assert progress == []
+
+    def test_cancel_after_last_report_delivers_result(self):
+        """Операция, отменённая после последнего отчёта, завершена — результат доставляется"""
+        done = []
+        reported = threading.Event()
+        proceed = threading.Event()
+
+        def operation(progress):
+            progress(1, 1)
+            reported.set()
+            proceed.wait()
+            return "committed"
+
+        job = self.worker.submit(operation, on_progress=lambda *p: None, on_done=done.append)
+        reported.wait(1)
+        job.cancel()
+        proceed.set()
+
+        wait_until(self.widget, lambda: done == ["committed"])
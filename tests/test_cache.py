@@ -0,0 +1,123 @@
+import os
+import tempfile
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from database.cache import CachedDatabaseManager, EntityCache
+from database.database_manager import DatabaseManager
+from database.pool import PooledDatabaseManager
+from controllers.task_controller import TaskController
+from models.task import Task
+from models.user import User
+
+
+class TestEntityCache:
+    def test_lru_eviction_by_entries(self):
+        """Вытеснение самой давно использованной записи"""
+        cache = EntityCache(max_entries=2)
+        cache.put(("tasks", 1), "a")
+        cache.put(("tasks", 2), "b")
+        assert cache.get(("tasks", 1)) == "a"
+        cache.put(("tasks", 3), "c")
+
+        assert cache.get(("tasks", 2)) is None
+        assert cache.get(("tasks", 1)) == "a"
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["entries"] == 2
+
+    def test_eviction_by_bytes(self):
+        """Ограничение по объёму в байтах"""
+        cache = EntityCache(max_entries=None, max_bytes=1)
+        cache.put(("users", 1), User("u", "u@example.com", "developer"))
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["bytes"] == 0
+
+    def test_put_after_invalidation_skipped(self):
+        """Значение, прочитанное до сброса, в кэш не попадает"""
+        cache = EntityCache()
+        generation = cache.generation
+        cache.invalidate(("tasks", 1))
+        cache.put(("tasks", 1), "old", generation)
+        assert cache.get(("tasks", 1)) is None
+
+
+class TestCachedDatabaseManager:
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.db_manager = CachedDatabaseManager(DatabaseManager(self.temp_db.name), max_entries=10)
+        self.controller = TaskController(self.db_manager)
+
+    def teardown_method(self):
+        self.db_manager.close()
+        self.temp_db.close()
+        os.unlink(self.temp_db.name)
+
+    def test_hits_and_invalidation(self):
+        """Повторное чтение из кэша, сброс при обновлении и удалении"""
+        task_id = self.db_manager.add_task(Task("Task", "", 1, datetime.now(), None, None))
+
+        first = self.controller.get_task(task_id)
+        assert self.controller.get_task(task_id) is first
+        assert self.db_manager.cache_stats()["hits"] == 1
+        assert self.db_manager.cache_stats()["misses"] == 1
+
+        self.controller.update_task(task_id, title="Renamed")
+        assert self.controller.get_task(task_id).title == "Renamed"
+
+        self.controller.delete_tasks([task_id])
+        assert self.controller.get_task(task_id) is None
+
+    def test_bulk_changes_invalidate(self):
+        """Пакетные смена статуса и удаление сбрасывают записи кэша"""
+        ids = self.db_manager.add_tasks_bulk(
+            Task(f"Task {i}", "", 1, datetime.now(), None, None) for i in range(3)
+        )
+        for task_id in ids:
+            self.controller.get_task(task_id)
+
+        self.controller.update_tasks_status(ids[:2], "completed")
+        statuses = [self.controller.get_task(task_id).status for task_id in ids]
+        assert statuses == ["completed", "completed", "pending"]
+
+        self.db_manager.delete_tasks(ids)
+        assert all(self.controller.get_task(task_id) is None for task_id in ids)
+
+    def test_rollback_clears_cache(self):
+        """Откат транзакции сбрасывает кэш"""
+        task_id = self.db_manager.add_task(Task("Task", "", 1, datetime.now(), None, None))
+        with pytest.raises(RuntimeError):
+            with self.db_manager.transaction():
+                self.db_manager.update_task(task_id, title="Uncommitted")
+                assert self.db_manager.get_task_by_id(task_id).title == "Uncommitted"
+                raise RuntimeError
+
+        assert self.db_manager.get_task_by_id(task_id).title == "Task"
+
+
+class TestCachedPooledDatabaseManager:
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.db_manager = CachedDatabaseManager(PooledDatabaseManager(self.temp_db.name))
+        self.db_manager.create_tables()
+
+    def teardown_method(self):
+        self.db_manager.close()
+        self.temp_db.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+
+    def test_read_during_transaction_not_left_stale(self):
+        """Чтение из другого потока до commit не оставляет в кэше старую версию"""
+        task_id = self.db_manager.add_task(Task("old", "", 1, datetime.now(), None, None))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with self.db_manager.transaction():
+                self.db_manager.update_task(task_id, title="new")
+                seen = executor.submit(self.db_manager.get_task_by_id, task_id).result(timeout=2)
+                assert seen.title == "old"
+            cached = executor.submit(self.db_manager.get_task_by_id, task_id).result(timeout=2)
+        assert cached.title == "new"
+        assert self.db_manager.get_task_by_id(task_id).title == "new"
@@ -109,6 +109,16 @@ class TestProjectController:
         project = self.controller.get_project(project_id)
         assert project is None
 
+    def test_delete_projects(self):
+        """Тест удаления нескольких проектов"""
+        ids = [
+            self.controller.add_project(f"Проект {i}", "Описание", datetime.now(), datetime.now())
+            for i in range(3)
+        ]
+
+        assert self.controller.delete_projects(ids[:2]) is True
+        assert [p.id for p in self.controller.get_all_projects()] == [ids[2]]
+
     def test_update_project_status(self):
         """Тест обновления статуса проекта"""
         project_id = self.controller.add_project(
@@ -151,6 +161,64 @@ class TestProjectController:
         assert isinstance(progress, float)
         assert 0 <= progress <= 100
 
+    def test_get_all_projects_with_progress(self):
+        """Прогресс всех проектов на один момент времени и по выполненным задачам"""
+        now = datetime(2025, 1, 11)
+        half = self.controller.add_project(
+            "Половина", "", datetime(2025, 1, 1), datetime(2025, 1, 21)
+        )
+        empty = self.controller.add_project(
+            "Пустой", "", datetime(2025, 2, 1), datetime(2025, 3, 1)
+        )
+        task_controller = TaskController(self.db_manager)
+        done = task_controller.add_task("Готово", "", 1, now, half, None)
+        task_controller.add_task("В работе", "", 1, now, half, None)
+        task_controller.update_task_status(done.id, "completed")
+
+        result = {
+            project.id: (progress, tasks_done)
+            for project, progress, tasks_done in self.controller.get_all_projects_with_progress(now)
+        }
+        assert result[half] == (50.0, 50.0)
+        assert result[empty] == (0.0, 0.0)
+
+    def test_get_project_by_name(self):
+        """Поиск проекта по имени"""
+        project_id = self.controller.add_project("Искомый", "", datetime.now(), datetime.now())
+        assert self.controller.get_project_by_name("Искомый").id == project_id
+        assert self.controller.get_project_by_name("Другой") is None
+
+    def test_get_project_stats(self):
+        """Счётчики задач по проектам без загрузки задач"""
+        project_id = self.controller.add_project(
+            "Проект", "Описание", datetime.now(), datetime.now() + timedelta(days=10)
+        )
+        task_controller = TaskController(self.db_manager)
+        now = datetime.now()
+        task_controller.add_task("Просрочена", "", 1, now - timedelta(days=1), project_id, None)
+        task_controller.add_task("В срок", "", 2, now + timedelta(days=1), project_id, None)
+
+        stats = self.controller.get_project_stats()
+        assert stats[project_id]["total"] == 2
+        assert stats[project_id]["overdue"] == 1
+        assert stats[project_id]["by_priority"] == {1: 1, 2: 1}
+
+    def test_get_task_counts(self):
+        """Счётчики задач по проектам из таблицы-счётчика"""
+        project_id = self.controller.add_project("Проект", "", datetime.now(), datetime.now())
+        other_id = self.controller.add_project("Пустой", "", datetime.now(), datetime.now())
+        task_controller = TaskController(self.db_manager)
+        task = task_controller.add_task("Первая", "", 1, datetime.now(), project_id, None)
+        task_controller.add_task("Вторая", "", 1, datetime.now(), project_id, None)
+        task_controller.update_task_status(task.id, "completed")
+
+        counts = self.controller.get_task_counts()
+        assert counts[project_id] == {
+            "total": 2, "by_status": {"pending": 1, "in_progress": 0, "completed": 1}
+        }
+        assert other_id not in counts
+        assert self.controller.get_task_counts([other_id]) == {}
+
 
 class TestTaskController:
     """Тесты для TaskController"""
@@ -286,6 +354,20 @@ class TestTaskController:
         results = self.controller.search_tasks("Срочное")
         assert len(results) >= 1
 
+    def test_query_tasks(self):
+        """Тест серверной фильтрации задач"""
+        now = datetime.now()
+        self.controller.add_task("Важная задача", "Срочное выполнение", 1,
+                                 now + timedelta(days=1), self.project_id, self.user_id)
+        self.controller.add_task("Обычная задача", "Плановое выполнение", 2,
+                                 now + timedelta(days=2), self.project_id, self.user_id)
+
+        rows, cursor = self.controller.query_tasks(text="срочн", project_id=self.project_id)
+        assert cursor is None
+        assert [row["title"] for row in rows] == ["Важная задача"]
+        assert rows[0]["project_name"] == "Тестовый проект"
+        assert rows[0]["assignee_name"] == "test_user"
+
     def test_update_task_status(self):
         """Тест обновления статуса задачи"""
         task_id = self.controller.add_task(
@@ -327,6 +409,61 @@ class TestTaskController:
         for task in overdue_tasks:
             assert task.is_overdue() == True
 
+    def test_iter_overdue_tasks(self):
+        """Тест потокового чтения просроченных задач"""
+        now = datetime.now()
+        ids = (self.project_id, self.user_id)
+        late = self.controller.add_task("Давно", "", 1, now - timedelta(days=2), *ids)
+        recent = self.controller.add_task("Вчера", "", 1, now - timedelta(days=1), *ids)
+        self.controller.add_task("Завтра", "", 1, now + timedelta(days=1), *ids)
+
+        overdue = self.controller.iter_overdue_tasks(now, batch_size=1)
+        assert [task.id for task in overdue] == [late.id, recent.id]
+
+    def test_add_tasks_bulk(self):
+        """Тест пакетного добавления задач"""
+        due = datetime.now() + timedelta(days=1)
+        ids = self.controller.add_tasks_bulk(
+            {"title": f"Задача {i}", "description": "Описание", "priority": 1, "due_date": due,
+             "project_id": self.project_id, "assignee_id": self.user_id}
+            for i in range(5)
+        )
+
+        assert len(ids) == 5
+        assert [self.controller.get_task(i).title for i in ids] == [f"Задача {i}" for i in range(5)]
+
+    def test_delete_tasks_progress_and_cancel(self):
+        """Тест прогресса и отмены пакетного удаления"""
+        due = datetime.now() + timedelta(days=1)
+        ids = self.controller.add_tasks_bulk(
+            {"title": f"Задача {i}", "description": "", "priority": 1, "due_date": due,
+             "project_id": self.project_id, "assignee_id": self.user_id}
+            for i in range(250)
+        )
+
+        def cancel(done, total):
+            raise KeyboardInterrupt
+
+        try:
+            self.controller.delete_tasks(ids, progress=cancel)
+        except KeyboardInterrupt:
+            pass
+        assert len(self.controller.get_all_tasks()) == 250
+
+        reports = []
+        self.controller.delete_tasks(ids, progress=lambda *report: reports.append(report))
+        assert reports == [(100, 250), (200, 250), (250, 250)]
+        assert self.controller.get_all_tasks() == []
+
+    def test_update_tasks_status(self):
+        """Тест пакетной смены статуса"""
+        due = datetime.now() + timedelta(days=1)
+        first = self.controller.add_task("Первая", "", 1, due, self.project_id, self.user_id)
+        second = self.controller.add_task("Вторая", "", 1, due, self.project_id, self.user_id)
+
+        assert self.controller.update_tasks_status([first, second.id], "in_progress") == 2
+        assert {task.status for task in self.controller.get_all_tasks()} == {"in_progress"}
+
     def test_get_tasks_by_project(self):
         """Тест получения задач проекта"""
         # Создаем второй проект
@@ -397,6 +534,14 @@ class TestUserController:
         assert user.email == "new_user@example.com"
         assert user.role == "developer"
 
+    def test_add_user_duplicate(self):
+        """Занятые имя или email не добавляют пользователя"""
+        self.controller.add_user("taken", "taken@example.com", "developer")
+
+        assert self.controller.add_user("taken", "other@example.com", "developer") is None
+        assert self.controller.add_user("other", "taken@example.com", "developer") is None
+        assert self.controller.add_user("other", "other@example.com", "developer") is not None
+
     def test_get_user(self):
         """Тест получения пользователя по ID"""
         user_id = self.controller.add_user(
@@ -481,4 +626,38 @@ class TestUserController:
         assert len(tasks) >= 2
 
         for task in tasks:
-            assert task.assignee_id == user_id
\ No newline at end of file
+            assert task.assignee_id == user_id
+
+    def test_get_workload_stats(self):
+        """Нагрузка пользователей по статусам задач"""
+        user_id = self.controller.add_user("busy", "busy@example.com", "developer")
+        idle_id = self.controller.add_user("idle", "idle@example.com", "developer")
+        task_controller = TaskController(self.db_manager)
+        now = datetime.now()
+        task = task_controller.add_task("Задача", "", 1, now + timedelta(days=1), None, user_id)
+        task_controller.add_task("Ещё", "", 1, now + timedelta(days=3), None, user_id)
+        task_controller.update_task_status(task.id, "in_progress")
+
+        stats = self.controller.get_workload_stats()
+        assert idle_id not in stats
+        assert stats[user_id]["by_status"] == {"pending": 1, "in_progress": 1, "completed": 0}
+        assert stats[user_id]["next_due"] is not None
+
+    def test_get_task_counts(self):
+        """Счётчики задач по исполнителям следуют за переназначением"""
+        first_id = self.controller.add_user("first", "first@example.com", "developer")
+        second_id = self.controller.add_user("second", "second@example.com", "developer")
+        task_controller = TaskController(self.db_manager)
+        task = task_controller.add_task("Задача", "", 1, datetime.now(), None, first_id)
+        task_controller.update_task(task.id, assignee_id=second_id)
+
+        counts = self.controller.get_task_counts([first_id, second_id])
+        assert list(counts) == [second_id]
+        assert counts[second_id]["by_status"]["pending"] == 1
+
+    def test_get_user_by_username_and_email(self):
+        """Поиск пользователя по имени и email"""
+        user_id = self.controller.add_user("finder", "finder@example.com", "manager")
+        assert self.controller.get_user_by_username("finder").id == user_id
+        assert self.controller.get_user_by_email("finder@example.com").id == user_id
+        assert self.controller.get_user_by_username("missing") is None
@@ -1,9 +1,10 @@
 import os
+import sqlite3
 import tempfile
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from database.database_manager import DatabaseManager
+from database.database_manager import DatabaseManager, SCHEMA_VERSION
 from models.user import User
 from models.project import Project
 from models.task import Task
@@ -61,3 +62,493 @@ class TestDatabase:
         assert user.username == "newname"
         assert user.email == "new@example.com"
         assert user.role == "manager"
+
+    def test_add_tasks_bulk(self):
+        """Пакетная вставка задач возвращает id в порядке входа"""
+        tasks = [Task(f"Task {i}", "Desc", 1, datetime.now(), None, None) for i in range(25)]
+        ids = self.db_manager.add_tasks_bulk(tasks, chunk_size=10)
+
+        assert len(ids) == 25
+        assert ids == [task.id for task in tasks]
+        for task_id, task in zip(ids, tasks):
+            assert self.db_manager.get_task_by_id(task_id).title == task.title
+
+    def test_add_projects_and_users_bulk(self):
+        """Пакетная вставка проектов и пользователей"""
+        self.db_manager.add_user(User("first", "first@example.com", "developer"))
+        user_ids = self.db_manager.add_users_bulk(
+            User(f"user{i}", f"user{i}@example.com", "developer") for i in range(3)
+        )
+        project_ids = self.db_manager.add_projects_bulk(
+            [Project(f"Project {i}", "Desc", datetime.now(), datetime.now()) for i in range(3)]
+        )
+
+        usernames = [self.db_manager.get_user_by_id(i).username for i in user_ids]
+        assert usernames == ["user0", "user1", "user2"]
+        assert [self.db_manager.get_project_by_id(i).name for i in project_ids] == [
+            "Project 0", "Project 1", "Project 2"
+        ]
+
+    def test_insert_rows(self):
+        """Вставка готовых кортежей возвращает id; явные id не принимаются"""
+        ids = self.db_manager.insert_rows(
+            "projects", ("name", "start_date", "end_date", "status"),
+            [
+                ("A", "2025-01-01", "2025-02-01", "active"),
+                ("B", "2025-01-01", "2025-02-01", "active"),
+            ]
+        )
+        assert [self.db_manager.get_project_by_id(i).name for i in ids] == ["A", "B"]
+        with pytest.raises(ValueError):
+            self.db_manager.insert_rows("tasks", ("id", "title"), [(100, "alpha")])
+        with pytest.raises(ValueError):
+            self.db_manager.insert_rows("tasks", ("owner",), [("x",)])
+
+    def test_transaction_commits_once(self):
+        """Изменения внутри транзакции фиксируются одним commit"""
+        with self.db_manager.transaction():
+            user_id = self.db_manager.add_user(User("tx", "tx@example.com", "developer"))
+            self.db_manager.update_user(user_id, role="manager")
+            assert self.db_manager.conn.in_transaction
+
+        assert not self.db_manager.conn.in_transaction
+        assert self.db_manager.get_user_by_id(user_id).role == "manager"
+
+    def test_transaction_rollback_and_savepoint(self):
+        """Ошибка откатывает транзакцию, вложенный уровень — только свою точку сохранения"""
+        with pytest.raises(RuntimeError):
+            with self.db_manager.transaction():
+                self.db_manager.add_user(User("lost", "lost@example.com", "developer"))
+                raise RuntimeError
+
+        with self.db_manager.transaction():
+            kept_id = self.db_manager.add_user(User("kept", "kept@example.com", "developer"))
+            with pytest.raises(RuntimeError):
+                with self.db_manager.transaction():
+                    self.db_manager.add_user(User("inner", "inner@example.com", "developer"))
+                    raise RuntimeError
+
+        usernames = [user.username for user in self.db_manager.get_all_users()]
+        assert usernames == ["kept"]
+        assert self.db_manager.get_user_by_id(kept_id) is not None
+
+    def _query_plan(self, sql, params=()):
+        rows = self.db_manager.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        return " | ".join(row[-1] for row in rows)
+
+    def test_schema_version(self):
+        """Версия схемы записывается в PRAGMA user_version"""
+        assert self.db_manager.get_schema_version() == SCHEMA_VERSION
+
+    def test_task_queries_use_indexes(self):
+        """Выборки задач по проекту, исполнителю, статусу и сроку идут по индексам"""
+        queries = [
+            ("SELECT * FROM tasks WHERE project_id = ?", (1,)),
+            ("SELECT * FROM tasks WHERE assignee_id = ?", (1,)),
+            ("SELECT * FROM tasks WHERE status = ?", ("pending",)),
+            ("SELECT * FROM tasks WHERE due_date < ?", ("2025-01-01 00:00:00",)),
+            ("SELECT * FROM tasks WHERE project_id = ? AND status = ?", (1, "pending")),
+            ("SELECT * FROM tasks WHERE assignee_id = ? AND status = ?", (1, "pending")),
+        ]
+        for sql, params in queries:
+            plan = self._query_plan(sql, params)
+            assert "USING INDEX" in plan, plan
+            assert "SCAN" not in plan, plan
+
+    def test_migrate_existing_database(self):
+        """Старая база без индексов обновляется на месте"""
+        self.db_manager.conn.execute("PRAGMA user_version = 0")
+        for (name,) in self.db_manager.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+        ).fetchall():
+            self.db_manager.conn.execute(f"DROP INDEX {name}")
+        self.db_manager.conn.commit()
+
+        self.db_manager.create_tables()
+
+        assert self.db_manager.get_schema_version() == SCHEMA_VERSION
+        assert "USING INDEX" in self._query_plan("SELECT * FROM tasks WHERE project_id = ?", (1,))
+
+    def test_get_overdue_tasks(self):
+        """Просроченные задачи выбираются запросом по индексу due_date"""
+        now = datetime.now()
+        late = self.db_manager.add_task(Task("Late", "", 1, now - timedelta(days=2), None, None))
+        later = self.db_manager.add_task(Task("Later", "", 1, now - timedelta(days=1), None, None))
+        done = self.db_manager.add_task(Task("Done", "", 1, now - timedelta(days=3), None, None))
+        self.db_manager.add_task(Task("Future", "", 1, now + timedelta(days=1), None, None))
+        self.db_manager.update_task(done, status="completed")
+
+        assert [t.id for t in self.db_manager.get_overdue_tasks(now)] == [late, later]
+        assert [t.id for t in self.db_manager.get_overdue_tasks(now, limit=1)] == [late]
+        plan = self._query_plan(
+            "SELECT * FROM tasks WHERE status != 'completed' AND due_date < ? ORDER BY due_date",
+            ("2025-01-01 00:00:00",)
+        )
+        assert "idx_tasks_due_date" in plan, plan
+
+    def test_get_task_stats(self):
+        """Счётчики по проектам считаются одним GROUP BY по покрывающему индексу"""
+        now = datetime.now()
+        add = self.db_manager.add_task
+        first = add(Task("A", "", 1, now - timedelta(days=1), 1, 1))
+        add(Task("B", "", 3, now + timedelta(days=2), 1, 2))
+        add(Task("C", "", 3, now + timedelta(days=1), 1, None))
+        add(Task("D", "", 2, now - timedelta(days=1), 2, 1))
+        self.db_manager.update_task(first, status="completed")
+
+        stats = self.db_manager.get_task_stats("project_id", now)
+        assert set(stats) == {1, 2}
+        assert stats[1]["total"] == 3
+        assert stats[1]["by_status"] == {"pending": 2, "in_progress": 0, "completed": 1}
+        assert stats[1]["by_priority"] == {1: 1, 3: 2}
+        assert stats[1]["overdue"] == 0
+        assert stats[1]["next_due"] == (now + timedelta(days=1)).replace(microsecond=0)
+        assert stats[2]["overdue"] == 1
+        assert stats[2]["next_due"] is None
+        assert self.db_manager.get_task_stats("assignee_id", now)[1]["total"] == 2
+
+        with pytest.raises(ValueError):
+            self.db_manager.get_task_stats("title", now)
+        plan = self._query_plan(
+            "SELECT project_id, status, priority, COUNT(*) FROM tasks "
+            "WHERE project_id IS NOT NULL GROUP BY project_id, status, priority"
+        )
+        assert "COVERING INDEX idx_tasks_project_stats" in plan, plan
+        assert "TEMP B-TREE" not in plan, plan
+
+    def test_lookup_by_name_and_email(self):
+        """Поиск проекта по имени и пользователя по имени и email идёт по индексам"""
+        now = datetime.now()
+        first = self.db_manager.add_project(Project("Same", "", now, now))
+        self.db_manager.add_project(Project("Same", "", now, now))
+        user_id = self.db_manager.add_user(User("john", "john@example.com", "developer"))
+
+        assert self.db_manager.get_project_by_name("Same").id == first
+        assert self.db_manager.get_project_by_name("Missing") is None
+        assert self.db_manager.get_user_by_username("john").id == user_id
+        assert self.db_manager.get_user_by_email("john@example.com").id == user_id
+        assert self.db_manager.get_user_by_email("nobody@example.com") is None
+        with pytest.raises(sqlite3.IntegrityError):
+            self.db_manager.add_user(User("john", "other@example.com", "developer"))
+
+        for sql, params in [
+            ("SELECT * FROM projects WHERE name = ? ORDER BY id LIMIT 1", ("Same",)),
+            ("SELECT * FROM users WHERE username = ? ORDER BY id LIMIT 1", ("john",)),
+            ("SELECT * FROM users WHERE email = ? ORDER BY id LIMIT 1", ("john@example.com",)),
+        ]:
+            plan = self._query_plan(sql, params)
+            assert "USING INDEX" in plan, plan
+            assert "TEMP B-TREE" not in plan, plan
+
+    def test_lookup_indexes_with_duplicate_users(self):
+        """При дублях в старой базе индекс пользователей создаётся неуникальным"""
+        self.db_manager.conn.execute("DROP INDEX idx_users_username")
+        self.db_manager.add_user(User("twin", "a@example.com", "developer"))
+        self.db_manager.add_user(User("twin", "b@example.com", "developer"))
+        self.db_manager.conn.execute("PRAGMA user_version = 4")
+        self.db_manager.conn.commit()
+
+        self.db_manager.create_tables()
+
+        assert self.db_manager.get_schema_version() == SCHEMA_VERSION
+        assert self.db_manager.get_user_by_username("twin").email == "a@example.com"
+        plan = self._query_plan("SELECT * FROM users WHERE username = ?", ("twin",))
+        assert "idx_users_username" in plan
+
+    def test_delete_and_update_many(self):
+        """Пакетные удаление и смена статуса через WHERE id IN (...) в одной транзакции"""
+        due = datetime.now()
+        ids = self.db_manager.add_tasks_bulk(
+            Task(f"T{i}", "", 1, due, None, None) for i in range(25)
+        )
+        reports = []
+
+        changed = self.db_manager.update_tasks_status(
+            ids[:10], "completed", chunk_size=4, progress=lambda *report: reports.append(report)
+        )
+        assert changed == 10
+        assert reports == [(4, 10), (8, 10), (10, 10)]
+        assert self.db_manager.count_task_rows(status="completed") == 10
+        with pytest.raises(ValueError):
+            self.db_manager.update_tasks_status(ids, "done")
+
+        def fail(done, total):
+            if done == 8:
+                raise RuntimeError
+        with pytest.raises(RuntimeError):
+            self.db_manager.delete_tasks(ids, chunk_size=4, progress=fail)
+        assert self.db_manager.count_task_rows() == 25
+
+        assert self.db_manager.delete_tasks(ids[5:], chunk_size=4) == 20
+        assert [task.id for task in self.db_manager.get_all_tasks()] == ids[:5]
+
+        project_id = self.db_manager.add_project(Project("P", "", due, due))
+        user_id = self.db_manager.add_user(User("u", "u@example.com", "developer"))
+        assert self.db_manager.delete_projects([project_id]) == 1
+        assert self.db_manager.delete_users([user_id, user_id + 1]) == 1
+        assert self.db_manager.get_all_projects() == []
+        assert self.db_manager.get_all_users() == []
+
+    def test_iter_tasks_streams_batches(self):
+        """Потоковое чтение пачками не мешает другим запросам через self.cursor"""
+        now = datetime.now()
+        ids = self.db_manager.add_tasks_bulk(
+            Task(f"T{i}", "", i % 3 + 1, now + timedelta(days=i - 3), None, None) for i in range(7)
+        )
+        seen = []
+        for task in self.db_manager.iter_tasks(batch_size=2):
+            assert self.db_manager.get_task_by_id(task.id).title == task.title
+            seen.append(task.id)
+        assert seen == ids
+
+        assert [t.priority for t in self.db_manager.iter_tasks(batch_size=3, priority=2)] == [2, 2]
+        overdue = self.db_manager.iter_tasks(batch_size=2, order_by="due_date", overdue_at=now)
+        assert [t.id for t in overdue] == ids[:3]
+        with pytest.raises(ValueError):
+            next(self.db_manager.iter_tasks(order_by="description"))
+
+        self.db_manager.add_project(Project("P", "", now, now))
+        self.db_manager.add_user(User("u", "u@example.com", "developer"))
+        assert [p.name for p in self.db_manager.iter_projects(batch_size=1)] == ["P"]
+        assert [u.username for u in self.db_manager.iter_users(batch_size=1)] == ["u"]
+
+    def test_get_changes_since(self):
+        """Триггеры ведут версии строк, журнал отдаёт только изменённое и удалённое"""
+        now = datetime.now()
+        start = self.db_manager.get_change_version()
+        first = self.db_manager.add_task(Task("A", "", 1, now, None, None))
+        second = self.db_manager.add_task(Task("B", "", 1, now, None, None))
+        user_id = self.db_manager.add_user(User("u", "u@example.com", "developer"))
+
+        changes = self.db_manager.get_changes_since(start)
+        assert changes["tasks"] == {"upserted": [first, second], "deleted": []}
+        assert changes["users"] == {"upserted": [user_id], "deleted": []}
+        assert changes["projects"] == {"upserted": [], "deleted": []}
+        version = changes["version"]
+        unchanged = self.db_manager.get_changes_since(version)["tasks"]
+        assert unchanged == {"upserted": [], "deleted": []}
+
+        self.db_manager.update_tasks_status([second], "completed")
+        self.db_manager.delete_task(first)
+        changes = self.db_manager.get_changes_since(version)
+        assert changes["tasks"] == {"upserted": [second], "deleted": [first]}
+        assert changes["users"] == {"upserted": [], "deleted": []}
+        assert self.db_manager.get_task_by_id(second).status == "completed"
+
+        # Вставка пачкой получает версии одним запросом после executemany
+        version = changes["version"]
+        ids = self.db_manager.add_tasks_bulk(
+            Task(f"T{i}", "", 1, now, None, None) for i in range(3)
+        )
+        assert self.db_manager.get_changes_since(version)["tasks"]["upserted"] == ids
+        self.db_manager.add_task(Task("После пачки", "", 1, now, None, None))
+        assert len(self.db_manager.get_changes_since(version)["tasks"]["upserted"]) == 4
+
+        assert self.db_manager.prune_deleted_rows(version) == 1
+        assert [u.username for u in self.db_manager.get_users_by_ids([user_id, 999])] == ["u"]
+
+    def test_task_counts_follow_triggers(self):
+        """Таблицы-счётчики совпадают с GROUP BY по задачам после любых изменений"""
+        now = datetime.now()
+        first = self.db_manager.add_task(Task("A", "", 1, now, 1, 10))
+        ids = self.db_manager.add_tasks_bulk(
+            Task(f"T{i}", "", 1, now, i % 2 + 1, 10 if i else None) for i in range(5)
+        )
+        assert self.db_manager.get_task_counts("project_id")[1]["total"] == 4
+
+        self.db_manager.update_task(first, status="completed", project_id=2)
+        self.db_manager.update_task(ids[0], assignee_id=20)
+        self.db_manager.update_tasks_status(ids[1:3], "in_progress")
+        self.db_manager.delete_tasks(ids[3:])
+
+        assert self.db_manager.verify_task_counts() == []
+        by_project = self.db_manager.get_task_counts("project_id")
+        assert by_project[1]["by_status"] == {"pending": 1, "in_progress": 1, "completed": 0}
+        assert by_project[2]["by_status"] == {"pending": 0, "in_progress": 1, "completed": 1}
+        assert self.db_manager.get_task_counts("assignee_id", [10, 20, 30]) == {
+            10: {"total": 3, "by_status": {"pending": 0, "in_progress": 2, "completed": 1}},
+            20: {"total": 1, "by_status": {"pending": 1, "in_progress": 0, "completed": 0}},
+        }
+        with pytest.raises(ValueError):
+            self.db_manager.get_task_counts("status")
+
+    def test_task_counts_verify_and_rebuild(self):
+        """Проверка находит расхождения, пересчёт их устраняет"""
+        self.db_manager.add_task(Task("A", "", 1, datetime.now(), 1, None))
+        self.db_manager.conn.execute("UPDATE project_task_counts SET count = 5")
+        self.db_manager.conn.execute("INSERT INTO user_task_counts VALUES (7, 'pending', 1)")
+        self.db_manager.conn.commit()
+
+        assert self.db_manager.verify_task_counts() == [
+            ("project_task_counts", 1, "pending", 5, 1),
+            ("user_task_counts", 7, "pending", 1, 0),
+        ]
+        self.db_manager.rebuild_task_counts()
+        assert self.db_manager.verify_task_counts() == []
+
+    def test_task_counts_migration_fills_existing_tasks(self):
+        """Миграция заполняет счётчики по уже существующим задачам"""
+        self.db_manager.add_task(Task("A", "", 1, datetime.now(), 3, 4))
+        for table in ("project_task_counts", "user_task_counts"):
+            self.db_manager.conn.execute(f"DROP TABLE {table}")
+        self.db_manager.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+        self.db_manager.conn.commit()
+
+        self.db_manager.create_tables()
+
+        assert self.db_manager.get_task_counts("project_id") == {
+            3: {"total": 1, "by_status": {"pending": 1, "in_progress": 0, "completed": 0}}
+        }
+        assert list(self.db_manager.get_task_counts("assignee_id")) == [4]
+
+    def test_change_tracking_migration_is_repeatable(self):
+        """Повторный прогон миграций не ломает журнал изменений"""
+        task_id = self.db_manager.add_task(Task("A", "", 1, datetime.now(), None, None))
+        version = self.db_manager.get_change_version()
+        self.db_manager.conn.execute("PRAGMA user_version = 0")
+        self.db_manager.conn.commit()
+
+        self.db_manager.create_tables()
+
+        assert self.db_manager.get_schema_version() == SCHEMA_VERSION
+        self.db_manager.update_task(task_id, title="B")
+        assert self.db_manager.get_changes_since(version)["tasks"]["upserted"] == [task_id]
+        plan = self._query_plan("SELECT id FROM tasks WHERE row_version > ?", (version,))
+        assert "idx_tasks_row_version" in plan, plan
+
+    def test_search_tasks_fts(self):
+        """Полнотекстовый поиск: префиксы, ранжирование, синхронизация триггерами"""
+        due = datetime.now()
+        first = self.db_manager.add_task(
+            Task("Отчёт за квартал", "отчёт отчёт", 1, due, None, None)
+        )
+        second = self.db_manager.add_task(Task("Созвон", "подготовить отчёт", 1, due, None, None))
+        self.db_manager.add_task(Task("Ревью", "код", 1, due, None, None))
+
+        assert self.db_manager.fts_enabled
+        assert [t.id for t in self.db_manager.search_tasks("отч")] == [first, second]
+        assert [t.id for t in self.db_manager.search_tasks("подготовить отч")] == [second]
+
+        self.db_manager.update_task(second, description="без совпадений")
+        assert [t.id for t in self.db_manager.search_tasks("отчёт")] == [first]
+        self.db_manager.delete_task(first)
+        assert self.db_manager.search_tasks("отчёт") == []
+
+    def test_search_tasks_highlighted(self):
+        """Подсветка совпадений в результатах поиска"""
+        task_id = self.db_manager.add_task(Task("Срочный отчёт", "", 1, datetime.now(), None, None))
+        assert self.db_manager.search_tasks_highlighted("отчёт", markers=("<b>", "</b>")) == [
+            (task_id, "Срочный <b>отчёт</b>", "")
+        ]
+
+    def test_search_tasks_like_fallback(self):
+        """Без FTS5 используется поиск по LIKE"""
+        task_id = self.db_manager.add_task(
+            Task("Ежедневный отчёт", "", 1, datetime.now(), None, None)
+        )
+        self.db_manager.fts_enabled = False
+        assert [t.id for t in self.db_manager.search_tasks("дневн")] == [task_id]
+
+    def test_query_task_rows_with_names(self):
+        """Строки задач с именами проекта и исполнителя одним запросом"""
+        user_id = self.db_manager.add_user(User("alice", "alice@example.com", "developer"))
+        now = datetime.now()
+        project_id = self.db_manager.add_project(Project("Alpha", "", now, now))
+        linked = self.db_manager.add_task(Task("Linked", "", 1, now, project_id, user_id))
+        orphan = self.db_manager.add_task(Task("Orphan", "", 2, now, None, None))
+
+        rows, _ = self.db_manager.query_task_rows(limit=10)
+
+        assert [(r["id"], r["project_name"], r["assignee_name"]) for r in rows] == [
+            (linked, "Alpha", "alice"),
+            (orphan, None, None),
+        ]
+
+    def test_query_task_rows_keyset_pagination(self):
+        """Фильтры и постраничный вывод по курсору"""
+        now = datetime.now()
+        ids = self.db_manager.add_tasks_bulk(
+            Task(f"Task {i}", "", i % 3 + 1, now + timedelta(days=i % 4), None, None)
+            for i in range(12)
+        )
+
+        pages = []
+        cursor = None
+        while True:
+            rows, cursor = self.db_manager.query_task_rows(
+                order_by="due_date", descending=True, limit=5, after=cursor
+            )
+            pages.append([row["id"] for row in rows])
+            if cursor is None:
+                break
+
+        assert [len(page) for page in pages] == [5, 5, 2]
+        flat = [task_id for page in pages for task_id in page]
+        assert sorted(flat) == ids
+        due_by_id = {task.id: task.due_date for task in self.db_manager.get_all_tasks()}
+        assert [due_by_id[i] for i in flat] == sorted(due_by_id.values(), reverse=True)
+
+        rows, cursor = self.db_manager.query_task_rows(
+            priority=2, due_before=now + timedelta(days=2)
+        )
+        assert cursor is None
+        assert {row["id"] for row in rows} == {ids[1], ids[4]}
+
+        # Переход к далёкой странице по смещению даёт курсор для продолжения
+        rows, cursor = self.db_manager.query_task_rows(limit=5, offset=5)
+        assert [row["id"] for row in rows] == ids[5:10]
+        rows, cursor = self.db_manager.query_task_rows(limit=5, after=cursor)
+        assert [row["id"] for row in rows] == ids[10:]
+
+    def test_query_task_rows_rejects_unknown_order(self):
+        """Неизвестная колонка сортировки и чужой курсор отклоняются"""
+        with pytest.raises(ValueError):
+            self.db_manager.query_task_rows(order_by="description")
+        self.db_manager.add_tasks_bulk(
+            Task(f"T{i}", "", 1, datetime.now(), None, None) for i in range(3)
+        )
+        _, cursor = self.db_manager.query_task_rows(limit=1)
+        with pytest.raises(ValueError):
+            self.db_manager.query_task_rows(order_by="title", after=cursor)
+
+    def test_epoch_date_storage_migration(self):
+        """Перевод существующей базы на хранение дат в секундах UTC и обратно"""
+        due = datetime(2025, 3, 4, 5, 6, 7)
+        task_id = self.db_manager.add_task(Task("Task", "", 1, due, None, None))
+        user_id = self.db_manager.add_user(User("u", "u@example.com", "developer"))
+        registered = self.db_manager.get_user_by_id(user_id).registration_date
+
+        self.db_manager.set_date_storage("epoch")
+
+        stored = self.db_manager.conn.execute("SELECT due_date FROM tasks").fetchone()[0]
+        assert stored == int(due.timestamp())
+        assert self.db_manager.get_date_storage() == "epoch"
+        assert self.db_manager.get_task_by_id(task_id).due_date == due
+        assert self.db_manager.get_user_by_id(user_id).registration_date == registered
+
+        new_due = datetime(2026, 1, 1, 12, 0, 0)
+        self.db_manager.update_task(task_id, due_date=new_due)
+        assert self.db_manager.get_task_by_id(task_id).due_date == new_due
+        assert [t.id for t in self.db_manager.get_overdue_tasks(datetime(2026, 1, 2))] == [task_id]
+        assert self.db_manager.get_overdue_tasks(datetime(2025, 12, 31)) == []
+
+        self.db_manager.set_date_storage("text")
+        stored = self.db_manager.conn.execute("SELECT due_date FROM tasks").fetchone()[0]
+        assert stored == "2026-01-01 12:00:00"
+
+    def test_epoch_date_storage_option(self):
+        """Формат хранения дат задаётся при создании менеджера и сохраняется в базе"""
+        self.db_manager.close()
+        self.db_manager = DatabaseManager(self.temp_db.name, date_storage="epoch")
+        self.db_manager.create_tables()
+        project_id = self.db_manager.add_project(
+            Project("P", "", datetime(2025, 1, 1), datetime(2025, 2, 1))
+        )
+        self.db_manager.close()
+
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+        assert self.db_manager.epoch_dates
+        assert self.db_manager.get_project_by_id(project_id).end_date == datetime(2025, 2, 1)
+        with pytest.raises(ValueError):
+            DatabaseManager(self.temp_db.name, date_storage="iso")
@@ -0,0 +1,181 @@
+import csv
+import gzip
+import json
+import os
+import sqlite3
+import tempfile
+from datetime import datetime
+
+import pytest
+
+from database.database_manager import DatabaseManager
+from database.importer import Importer, import_file, main
+from models.project import Project
+from models.task import Task
+from models.user import User
+
+
+class TestImporter:
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+        self.paths = []
+
+    def teardown_method(self):
+        self.db_manager.close()
+        self.temp_db.close()
+        os.unlink(self.temp_db.name)
+        for path in self.paths:
+            os.unlink(path)
+
+    def _write(self, suffix, lines):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        self.paths.append(path)
+        opener = gzip.open if suffix.endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8", newline="") as f:
+            f.write("\n".join(lines) + "\n")
+        return path
+
+    def _rejects(self, path):
+        with open(path, encoding="utf-8") as f:
+            return [(int(row["line"]), row["reason"]) for row in csv.DictReader(f)]
+
+    def test_import_users_rejects_invalid(self):
+        """Пользователи проверяются по правилам User, дубли и ошибки уходят в отказы"""
+        self.db_manager.add_user(User("old", "old@example.com", "admin"))
+        path = self._write(".csv", [
+            "username,email,role",
+            "anna,anna@example.com,developer",
+            "bob,not-an-email,developer",
+            "carl,carl@example.com,boss",
+            "anna,other@example.com,manager",
+            "dina,old@example.com,manager",
+            "eva,eva@example.com,manager",
+        ])
+        rejects = self._write(".csv", [])
+
+        result = import_file(self.db_manager, "users", path, rejects, batch_size=2)
+
+        assert result["imported"] == 2
+        assert result["rejected"] == 4
+        assert [u.username for u in self.db_manager.get_all_users()] == ["old", "anna", "eva"]
+        assert self._rejects(rejects) == [
+            (3, "Invalid email address"),
+            (4, "Invalid role: boss"),
+            (5, "username already exists: anna"),
+            (6, "email already exists: old@example.com"),
+        ]
+
+    def test_rejected_user_does_not_reserve_name(self, monkeypatch):
+        """Отклонённая строка не занимает имя и email, сбой записи снимает резервы"""
+        importer = Importer(self.db_manager)
+        users = self._write(".csv", [
+            "username,email,role,registration_date",
+            "ann,ann@example.com,developer,вчера",
+            "ann,ann@example.com,developer,2025-01-01",
+        ])
+        tasks = self._write(".csv", ["title,priority,due_date,assignee", "Задача,1,2025-01-10,ann"])
+
+        assert import_file(self.db_manager, "users", users, importer=importer)["imported"] == 1
+        assert import_file(self.db_manager, "tasks", tasks, importer=importer)["imported"] == 1
+
+        other = self._write(".csv", ["username,email,role", "bob,bob@example.com,manager"])
+
+        def locked(*args, **kwargs):
+            # Запись пачки падает, как при заблокированной базе
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(self.db_manager, "insert_rows", locked)
+        with pytest.raises(sqlite3.OperationalError):
+            import_file(self.db_manager, "users", other, importer=importer)
+        monkeypatch.undo()
+        assert import_file(self.db_manager, "users", other, importer=importer)["imported"] == 1
+
+    def test_import_tasks_resolves_references(self):
+        """Задачи ссылаются на проекты по имени и на исполнителей по имени или email"""
+        importer = Importer(self.db_manager, batch_size=2)
+        projects = self._write(".jsonl", [
+            json.dumps({"name": "Alpha", "start_date": "2025-01-01", "end_date": "2025-02-01"}),
+            json.dumps({"name": "Beta", "start_date": "2025-01-01", "end_date": "2025-02-01",
+                        "status": "closed"}),
+        ])
+        users = self._write(".csv", ["username,email,role", "anna,anna@example.com,developer"])
+        tasks = self._write(".jsonl.gz", [
+            json.dumps({"title": "По имени", "priority": 1, "due_date": "2025-01-10 12:00:00",
+                        "project": "Alpha", "assignee": "anna"}),
+            json.dumps({"title": "По email", "priority": "3", "due_date": "2025-01-11",
+                        "assignee": "anna@example.com", "status": "completed"}),
+            json.dumps({"title": "", "priority": 1, "due_date": "2025-01-10"}),
+            json.dumps({"title": "Приоритет", "priority": 5, "due_date": "2025-01-10"}),
+            json.dumps({"title": "Дата", "priority": 1, "due_date": "завтра"}),
+            json.dumps({"title": "Проект", "priority": 1, "due_date": "2025-01-10",
+                        "project": "Beta"}),
+            "{broken",
+        ])
+        rejects = self._write(".csv", [])
+
+        result = import_file(self.db_manager, "projects", projects, importer=importer)
+        assert result["rejected"] == 1
+        assert import_file(self.db_manager, "users", users, importer=importer)["imported"] == 1
+        result = import_file(self.db_manager, "tasks", tasks, rejects, importer=importer)
+
+        assert result["imported"] == 2
+        alpha = self.db_manager.get_project_by_name("Alpha")
+        anna = self.db_manager.get_user_by_username("anna")
+        first, second = self.db_manager.get_all_tasks()
+        assert (first.project_id, first.assignee_id, first.due_date) == (
+            alpha.id, anna.id, datetime(2025, 1, 10, 12)
+        )
+        assert (second.project_id, second.assignee_id, second.priority, second.status) == (
+            None, anna.id, 3, "completed"
+        )
+        reasons = [reason for _, reason in self._rejects(rejects)]
+        assert reasons[:4] == [
+            "title cannot be empty",
+            "priority must be 1, 2, 3",
+            "due_date must be a datetime, got 'завтра'",
+            "unknown project: Beta",
+        ]
+        assert len(reasons) == 5
+        # Полнотекстовый индекс пополнен пачкой, триггер для обычных вставок восстановлен
+        assert self.db_manager.search_tasks("имени")[0].title == "По имени"
+        self.db_manager.add_task(Task("После импорта", "", 1, datetime(2025, 1, 1), None, None))
+        assert [t.title for t in self.db_manager.search_tasks("импорта")] == ["После импорта"]
+
+    def test_import_tasks_rejects_unknown_ids(self):
+        """Явные project_id и assignee_id должны ссылаться на существующие строки"""
+        project_id = self.db_manager.add_project(
+            Project("Alpha", "", datetime(2025, 1, 1), datetime(2025, 2, 1))
+        )
+        importer = Importer(self.db_manager)
+        users = self._write(".csv", ["username,email,role", "anna,anna@example.com,developer"])
+        assert import_file(self.db_manager, "users", users, importer=importer)["imported"] == 1
+        anna = self.db_manager.get_user_by_username("anna")
+        tasks = self._write(".csv", [
+            "title,priority,due_date,project_id,assignee_id",
+            f"Есть,1,2025-01-10,{project_id},{anna.id}",
+            f"Нет проекта,1,2025-01-10,{project_id + 100},",
+            f"Нет исполнителя,1,2025-01-10,,{anna.id + 100}",
+        ])
+        rejects = self._write(".csv", [])
+
+        result = import_file(self.db_manager, "tasks", tasks, rejects, importer=importer)
+
+        assert result["imported"] == 1
+        assert self._rejects(rejects) == [
+            (3, f"unknown project_id: {project_id + 100}"),
+            (4, f"unknown assignee_id: {anna.id + 100}"),
+        ]
+
+    def test_cli(self, capsys):
+        """Запуск из командной строки с отчётом о скорости"""
+        path = self._write(".csv", [
+            "name,description,start_date,end_date",
+            "Проект,Описание,2025-01-01,2025-03-01",
+        ])
+        main([self.temp_db.name, "projects", path])
+        assert self.db_manager.get_project_by_name("Проект").end_date == datetime(2025, 3, 1)
+        assert "загружено 1, отклонено 0" in capsys.readouterr().err
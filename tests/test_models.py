@@ -53,6 +53,13 @@ class TestProjectModel:
         project = Project("Past", "Desc", start, end)
         assert project.get_progress() == 100.0
 
+    def test_project_progress_at_moment(self):
+        """Прогресс считается на переданный момент времени"""
+        project = Project("Test", "Desc", datetime(2025, 1, 1), datetime(2025, 1, 5))
+        assert project.get_progress(datetime(2025, 1, 2)) == 25.0
+        same_day = Project("Day", "Desc", datetime(2025, 1, 1), datetime(2025, 1, 1))
+        assert same_day.get_progress(datetime(2025, 1, 2)) == 100.0
+
     def test_project_to_dict(self):
         start = datetime.now()
         end = start + timedelta(days=5)
@@ -63,6 +70,16 @@ class TestProjectModel:
         assert "start_date" in d
         assert "end_date" in d
 
+    def test_project_from_row(self):
+        """Создание проекта из строки БД"""
+        project = Project.from_row(
+            (7, "Row", "Desc", "2025-01-01 09:00:00", "2025-02-01 18:30:00", "on_hold")
+        )
+        assert project.id == 7
+        assert project.start_date == datetime(2025, 1, 1, 9, 0)
+        assert project.end_date == datetime(2025, 2, 1, 18, 30)
+        assert project.status == "on_hold"
+
 class TestUserModel:
     def test_user_creation_valid(self):
         """Создание пользователя с валидными данными"""
@@ -110,6 +127,13 @@ class TestUserModel:
         assert "registration_date" in d
         assert d["id"] is None
 
+    def test_user_from_row(self):
+        """Создание пользователя из строки БД без повторной валидации"""
+        user = User.from_row((3, "john", "john@example.com", "admin", "2024-05-06 07:08:09"))
+        assert user.id == 3
+        assert user.role == "admin"
+        assert user.registration_date == datetime(2024, 5, 6, 7, 8, 9)
+
 
 class TestTaskModel:
     def test_task_creation_valid(self):
@@ -167,3 +191,19 @@ class TestTaskModel:
         assert d["assignee_id"] == 1
         assert "due_date" in d
         assert d["id"] is None
+
+    def test_task_from_row(self):
+        """Создание задачи из строки БД"""
+        task = Task.from_row((5, "Task", "Desc", 3, "completed", "2025-01-02 03:04:05", 1, 2))
+        assert task.id == 5
+        assert task.status == "completed"
+        assert task.due_date == datetime(2025, 1, 2, 3, 4, 5)
+        assert task.is_overdue() is False
+        assert task.to_dict()["assignee_id"] == 2
+
+    def test_task_has_no_instance_dict(self):
+        """Модели хранят поля в __slots__"""
+        task = Task("Task", "Desc", 2, datetime.now(), 1, 1)
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown = 1
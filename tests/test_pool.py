@@ -0,0 +1,109 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from database.pool import PooledDatabaseManager
+from controllers.task_controller import TaskController
+from controllers.user_controller import UserController
+
+
+class TestPooledDatabaseManager:
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.db_manager = PooledDatabaseManager(self.temp_db.name)
+        self.controller = TaskController(self.db_manager)
+
+    def teardown_method(self):
+        self.db_manager.close()
+        self.temp_db.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+
+    def add_task(self, title):
+        due = datetime.now() + timedelta(days=1)
+        return self.controller.add_task(title, "", 1, due, None, None).id
+
+    def test_wal_mode(self):
+        """Соединения работают в режиме WAL"""
+        mode = self.db_manager.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_connection_per_thread(self):
+        """Каждый поток получает своё соединение"""
+        connections = []
+        thread = threading.Thread(target=lambda: connections.append(self.db_manager.conn))
+        thread.start()
+        thread.join()
+        assert connections[0] is not self.db_manager.conn
+
+    def test_connection_closed_when_thread_exits(self):
+        """Соединение завершившегося потока закрывается и удаляется из пула"""
+        connections = []
+        thread = threading.Thread(target=lambda: connections.append(self.db_manager.conn))
+        thread.start()
+        thread.join()
+
+        assert self.db_manager._connections == [self.db_manager.conn]
+        with pytest.raises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
+
+    def test_readers_do_not_block_behind_writer(self):
+        """Чтение из другого потока не ждёт открытую транзакцию записи"""
+        committed = self.add_task("Committed")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.db_manager.transaction():
+                self.add_task("Uncommitted")
+                titles = executor.submit(
+                    lambda: [t.title for t in self.controller.get_all_tasks()]
+                ).result(timeout=2)
+        assert titles == ["Committed"]
+        assert self.controller.get_task(committed).title == "Committed"
+        assert len(self.controller.get_all_tasks()) == 2
+
+    def test_changes_since_does_not_wait_for_writer(self):
+        """Журнал изменений читается из снимка, пока другой поток держит запись"""
+        committed = self.add_task("Committed")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with self.db_manager.transaction():
+                self.add_task("Uncommitted")
+                changes = executor.submit(self.db_manager.get_changes_since, 0).result(timeout=2)
+        assert changes["tasks"]["upserted"] == [committed]
+        assert not self.db_manager.conn.in_transaction
+
+    def test_verify_task_counts_does_not_wait_for_writer(self):
+        """Проверка счётчиков не берёт блокировку записи"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with self.db_manager.transaction():
+                self.add_task("Uncommitted")
+                mismatches = executor.submit(self.db_manager.verify_task_counts).result(timeout=2)
+        assert mismatches == []
+
+    def test_concurrent_writers(self):
+        """Параллельные записи из разных потоков не теряются"""
+        users = UserController(self.db_manager)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(
+                lambda i: users.add_user(f"user{i}", f"user{i}@example.com", "developer"),
+                range(40)
+            ))
+        assert len(users.get_all_users()) == 40
+
+    def test_failed_write_releases_write_lock(self):
+        """Ошибка одиночной записи откатывается и не блокирует запись из других потоков"""
+        self.db_manager.busy_timeout_ms = 200
+        users = UserController(self.db_manager)
+        users.add_user("a", "a@example.com", "developer")
+        b = users.add_user("b", "b@example.com", "developer")
+
+        assert users.update_user(b, username="a") is False
+        assert not self.db_manager.conn.in_transaction
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(users.add_user, "c", "c@example.com", "developer").result(timeout=5)
+        assert len(users.get_all_users()) == 3
@@ -0,0 +1,37 @@
+import os
+import tempfile
+from datetime import datetime
+
+from database.database_manager import DatabaseManager
+from database.task_counts import main
+from models.task import Task
+
+
+class TestTaskCounts:
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+        self.db_manager.add_task(Task("Задача", "", 1, datetime.now(), 1, 2))
+
+    def teardown_method(self):
+        self.db_manager.close()
+        self.temp_db.close()
+        os.unlink(self.temp_db.name)
+
+    def test_verify_clean(self, capsys):
+        """Проверка без расхождений возвращает 0"""
+        assert main([self.temp_db.name, "verify"]) == 0
+        assert "Расхождений: 0" in capsys.readouterr().err
+
+    def test_verify_and_rebuild(self, capsys):
+        """Расхождение выводится и исправляется пересчётом"""
+        self.db_manager.conn.execute("DELETE FROM user_task_counts")
+        self.db_manager.conn.commit()
+
+        assert main([self.temp_db.name, "verify"]) == 1
+        report = capsys.readouterr().out
+        assert "user_task_counts: id 2, pending: в счётчике 0, в задачах 1" in report
+        assert main([self.temp_db.name, "rebuild"]) == 0
+        assert main([self.temp_db.name, "verify"]) == 0
@@ -0,0 +1,63 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import task_table
+from database.database_manager import DatabaseManager
+from database.task_table import TaskTable
+from models.task import Task
+
+
+class TestTaskTable:
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+        self.now = datetime(2025, 6, 1, 12, 0, 0)
+        tasks = [
+            Task(f"Task {i}", "", i % 3 + 1, self.now + timedelta(days=i - 5), i % 2 + 1, None)
+            for i in range(10)
+        ]
+        self.ids = self.db_manager.add_tasks_bulk(tasks)
+        self.db_manager.update_task(self.ids[0], status="completed")
+        self.db_manager.update_task(self.ids[1], status="in_progress")
+
+    def teardown_method(self):
+        self.db_manager.close()
+        self.temp_db.close()
+        os.unlink(self.temp_db.name)
+
+    def check_table(self):
+        table = TaskTable.load(self.db_manager, batch_size=3)
+
+        assert len(table) == 10
+        assert list(table["id"]) == self.ids
+        assert list(table["assignee_id"]) == [0] * 10
+        assert int(table["due"][5]) == int(self.now.timestamp())
+        assert table.count_by_status() == {"pending": 8, "in_progress": 1, "completed": 1}
+        assert table.count_by("project_id") == {1: 5, 2: 5}
+
+        overdue = table.overdue(self.now)
+        assert list(overdue["id"]) == self.ids[1:5]
+        high = table.filter(priority=3, project_id=1)
+        assert list(high["id"]) == [self.ids[2], self.ids[8]]
+        assert len(table.filter(status="completed")) == 1
+
+    def test_pure_python_columns(self, monkeypatch):
+        """Колонки на array без NumPy"""
+        monkeypatch.setattr(task_table, "numpy", None)
+        self.check_table()
+
+    def test_numpy_columns(self):
+        """Векторизованные колонки NumPy"""
+        pytest.importorskip("numpy")
+        self.check_table()
+
+    def test_epoch_storage(self, monkeypatch):
+        """Сроки в формате epoch загружаются без преобразования"""
+        monkeypatch.setattr(task_table, "numpy", None)
+        self.db_manager.set_date_storage("epoch")
+        self.check_table()
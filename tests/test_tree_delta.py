@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+from views.tree_delta import TrackedRows, sync_tree
+
+
+class FakeTree:
+    # Запоминает вызовы вместо настоящего Treeview
+    def __init__(self) -> None:
+        self.items = {}
+        self.calls = []
+
+    def insert(self, parent, index, iid, values) -> None:
+        self.items[iid] = values
+        self.calls.append(("insert", iid))
+
+    def item(self, iid, values) -> None:
+        self.items[iid] = values
+        self.calls.append(("item", iid))
+
+    def delete(self, *iids) -> None:
+        for iid in iids:
+            del self.items[iid]
+            self.calls.append(("delete", iid))
+
+
+class TestTreeDelta:
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.tree = FakeTree()
+        self.rows = {}
+        sync_tree(self.tree, self.rows, {1: ("a",), 2: ("b",), 3: ("c",)})
+        self.tree.calls.clear()
+
+    def test_only_changed_rows_touched(self):
+        """Неизменённые строки не перерисовываются"""
+        sync_tree(self.tree, self.rows, {1: ("a",), 2: ("B",), 3: ("c",), 4: ("d",)})
+        assert self.tree.calls == [("item", 2), ("insert", 4)]
+        assert self.rows == self.tree.items == {1: ("a",), 2: ("B",), 3: ("c",), 4: ("d",)}
+
+    def test_missing_rows_deleted(self):
+        """Строки, которых нет в новом состоянии, удаляются"""
+        sync_tree(self.tree, self.rows, {2: ("b",)})
+        assert self.tree.calls == [("delete", 1), ("delete", 3)]
+        assert self.rows == {2: ("b",)}
+
+    def test_nothing_changed(self):
+        """Без изменений виджет не трогается"""
+        sync_tree(self.tree, self.rows, dict(self.rows))
+        assert self.tree.calls == []
+
+
+class FakeController:
+    # Журнал изменений из заранее заданных ответов
+    def __init__(self) -> None:
+        self.records = {1: SimpleNamespace(id=1, name="a"), 2: SimpleNamespace(id=2, name="b")}
+        self.version = 5
+        self.changes = None
+        self.stats_loads = 0
+
+    def get_change_version(self) -> int:
+        return self.version
+
+    def get_changes_since(self, version) -> dict:
+        return self.changes
+
+    def iter_all(self):
+        return iter(self.records.values())
+
+    def get_by_ids(self, ids) -> list:
+        return [self.records[record_id] for record_id in ids]
+
+    def load_stats(self) -> dict:
+        self.stats_loads += 1
+        return {1: self.stats_loads}
+
+
+class TestTrackedRows:
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.tree = FakeTree()
+        self.controller = FakeController()
+        self.tracked = TrackedRows(
+            self.tree, self.controller, "projects",
+            self.controller.iter_all, self.controller.get_by_ids, self.controller.load_stats,
+        )
+        self.tracked.show(self.tracked.load_all(), self.values)
+
+    @staticmethod
+    def values(record, stats) -> tuple:
+        return record.name, stats or 0
+
+    def test_load_all(self):
+        """Полная загрузка запоминает версию, прочитанную до данных"""
+        assert self.tracked.version == 5
+        assert self.tree.items == {1: ("a", 1), 2: ("b", 0)}
+
+    def test_changes_merged(self):
+        """Изменённые записи заменяются, удалённые убираются; статистика не перечитывается"""
+        self.controller.records[1] = SimpleNamespace(id=1, name="A")
+        self.controller.changes = {
+            "version": 7,
+            "projects": {"upserted": [1], "deleted": [2]},
+            "tasks": {"upserted": [], "deleted": []},
+        }
+        self.tree.calls.clear()
+
+        self.tracked.show(self.tracked.load_changes(self.tracked.version), self.values)
+
+        assert self.tracked.version == 7
+        assert self.tree.calls == [("delete", 2), ("item", 1)]
+        assert self.tree.items == {1: ("A", 1)}
+        assert self.controller.stats_loads == 1
@@ -0,0 +1,39 @@
+from views.virtual_tree import PagedRows
+
+
+def page(first, count):
+    return [{"id": row_id, "title": f"T{row_id}"} for row_id in range(first, first + count)]
+
+
+class TestPagedRows:
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.rows = PagedRows(page_size=10, max_pages=3)
+        self.rows.load(100, page(1, 10), "cursor-1")
+
+    def test_missing_pages_use_cursor_or_offset(self):
+        """Следующая страница читается по курсору, далёкая — по смещению"""
+        assert self.rows.missing(5, 25) == [(1, "cursor-1", 0), (2, None, 20)]
+        assert self.rows.missing(0, 10) == []
+        assert self.rows.row(3)["id"] == 4
+        assert self.rows.row(95) is None
+
+    def test_window_is_bounded(self):
+        """В памяти остаётся не больше max_pages страниц, ближайших к окну"""
+        for index in range(1, 10):
+            self.rows.store([(index, page(index * 10 + 1, 10), f"cursor-{index + 1}")])
+            self.rows.evict(index * 10, index * 10 + 10)
+        assert sorted(self.rows.pages) == [7, 8, 9]
+        # Курсоры начала страниц сохраняются: к началу можно вернуться без смещения
+        assert self.rows.missing(10, 20) == [(1, "cursor-1", 0)]
+
+    def test_apply_changes(self):
+        """Изменение на месте заменяет строку, сдвиг строк сбрасывает окно"""
+        updated = {"id": 3, "title": "Новое"}
+        assert self.rows.apply_changes([3], [updated], 100)
+        assert self.rows.row(2) is updated
+
+        assert not self.rows.apply_changes([4], [], 99)
+        assert self.rows.pages == {}
+        assert self.rows.total == 99
+        assert self.rows.missing(0, 10) == [(0, None, 0)]
@@ -0,0 +1,175 @@
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+POLL_MS = 50
+
+
+class OperationCancelled(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, func, args, kwargs, on_done, on_error, on_progress, key, results) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.key = key
+        self.results = results
+        self.cancelled = threading.Event()
+        # Вытеснена более новой задачей с тем же key: её результат не нужен
+        self.superseded = False
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+    def report(self, done, total) -> None:
+        # Вызывается из фонового потока; после отмены прерывает операцию
+        if self.cancelled.is_set():
+            raise OperationCancelled
+        self.results.put(("progress", self, (done, total)))
+
+
+# Фоновый поток для вызовов контроллеров: результаты возвращаются в поток Tk
+# через очередь, которую опрашивает after(). Задачи с одинаковым key
+# схлопываются: выполняется и доставляется только последняя
+class BackgroundWorker:
+    def __init__(self, widget, poll_ms=POLL_MS) -> None:
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.latest = {}
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, name="db-worker", daemon=True)
+        self.thread.start()
+        self.widget.after(self.poll_ms, self._poll)
+
+    def submit(self, func, *args, on_done=None, on_error=None, on_progress=None, key=None,
+               **kwargs) -> Job:
+        job = Job(func, args, kwargs, on_done, on_error, on_progress, key, self.results)
+        if on_progress is not None:
+            job.kwargs["progress"] = job.report
+        if key is not None:
+            with self.lock:
+                previous = self.latest.get(key)
+                self.latest[key] = job
+            if previous is not None:
+                previous.superseded = True
+                previous.cancel()
+        self.jobs.put(job)
+        return job
+
+    def stop(self) -> None:
+        self.jobs.put(None)
+
+    def _run(self) -> None:
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            kind, payload = self._execute(job)
+            self.results.put((kind, job, payload))
+
+    def _execute(self, job) -> tuple:
+        if job.cancelled.is_set():
+            return "cancelled", None
+        try:
+            return "done", job.func(*job.args, **job.kwargs)
+        except OperationCancelled:
+            return "cancelled", None
+        except Exception as e:
+            return "error", e
+
+    def _poll(self) -> None:
+        while True:
+            try:
+                kind, job, payload = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self._deliver(kind, job, payload)
+        self.widget.after(self.poll_ms, self._poll)
+
+    def _deliver(self, kind, job, payload) -> None:
+        if kind == "progress":
+            if not job.cancelled.is_set():
+                job.on_progress(*payload)
+            return
+        self._forget(job)
+        # Операция, отменённая после последнего отчёта о прогрессе, уже завершилась
+        # и записала изменения: её результат доставляется, чтобы окно обновилось
+        if kind == "done" and not job.superseded and job.on_done is not None:
+            job.on_done(payload)
+        elif kind == "error":
+            self._report_error(job, payload)
+
+    def _forget(self, job) -> None:
+        if job.key is None:
+            return
+        with self.lock:
+            if self.latest.get(job.key) is job:
+                del self.latest[job.key]
+
+    def _report_error(self, job, error) -> None:
+        if job.on_error is not None:
+            job.on_error(error)
+        else:
+            messagebox.showerror("Ошибка", str(error))
+
+
+class ProgressDialog(tk.Toplevel):
+    def __init__(self, parent, title) -> None:
+        super().__init__(parent)
+        self.title(title)
+        self.resizable(False, False)
+        self.transient(parent)
+        self.job = None
+
+        self.label = ttk.Label(self, text="Выполняется...")
+        self.label.pack(padx=10, pady=(10, 5))
+        self.bar = ttk.Progressbar(self, length=300, mode="determinate")
+        self.bar.pack(padx=10, pady=5)
+        ttk.Button(self, text="Отмена", command=self.cancel).pack(pady=(5, 10))
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+
+    def update_progress(self, done, total) -> None:
+        self.bar["maximum"] = max(total, 1)
+        self.bar["value"] = done
+        self.label["text"] = f"{done} из {total}"
+
+    def report(self, done, total) -> None:
+        # Отчёт может прийти после закрытия окна
+        if self.winfo_exists():
+            self.update_progress(done, total)
+
+    def close(self) -> None:
+        if self.winfo_exists():
+            self.destroy()
+
+    def cancel(self) -> None:
+        if self.job is not None:
+            self.job.cancel()
+        self.destroy()
+
+
+def run_with_progress(worker, parent, title, func, *args, on_done=None, **kwargs) -> Job:
+    # Длительная операция с окном прогресса и кнопкой отмены
+    dialog = ProgressDialog(parent, title)
+
+    def finish(result):
+        dialog.close()
+        if on_done is not None:
+            on_done(result)
+
+    def fail(error):
+        dialog.close()
+        messagebox.showerror("Ошибка", str(error))
+
+    dialog.job = worker.submit(
+        func, *args, on_done=finish, on_error=fail, on_progress=dialog.report, **kwargs
+    )
+    return dialog.job
@@ -5,6 +5,7 @@ from tkinter import ttk
 from views.project_view import ProjectView
 from views.task_view import TaskView
 from views.user_view import UserView
+from views.background import BackgroundWorker
 from controllers.task_controller import TaskController
 
 
@@ -14,6 +15,9 @@ class MainWindow(tk.Tk):
         self.title("Система управления задачами")
         self.geometry("1000x600")
 
+        # Общий фоновый поток для обращений к БД из всех вкладок
+        self.worker = BackgroundWorker(self)
+
         # Создаём вкладки
         self.tab_control = ttk.Notebook(self)
         self.tab_control.pack(expand=1, fill="both")
@@ -23,7 +27,8 @@ class MainWindow(tk.Tk):
             self,
             task_controller,
             project_controller,
-            user_controller
+            user_controller,
+            worker=self.worker
         )
         self.tab_control.add(self.task_view, text="Задачи")
 
@@ -31,7 +36,8 @@ class MainWindow(tk.Tk):
         self.project_view = ProjectView(
             self,
             project_controller,
-            task_controller
+            task_controller,
+            worker=self.worker
         )
         self.tab_control.add(self.project_view, text="Проекты")
 
@@ -39,6 +45,18 @@ class MainWindow(tk.Tk):
         self.user_view = UserView(
             self,
             user_controller,
+            worker=self.worker
         )
         self.tab_control.add(self.user_view, text="Пользователи")
 
+        # При переключении вкладки она догоняет изменения, сделанные в других
+        self.tab_control.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+
+    def on_tab_changed(self, event) -> None:
+        view = self.nametowidget(self.tab_control.select())
+        if view is self.task_view:
+            view.sync_tasks()
+        elif view is self.project_view:
+            view.sync_projects()
+        elif view is self.user_view:
+            view.sync_users()
@@ -1,10 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from datetime import datetime
+from views.background import BackgroundWorker, run_with_progress
+from views.tree_delta import TrackedRows
 
 class ProjectView(ttk.Frame):
-    def __init__(self, parent, project_controller, task_controller) -> None:
+    def __init__(self, parent, project_controller, task_controller, worker=None) -> None:
         super().__init__(parent)
+        self.worker = worker or BackgroundWorker(self)
         self.project_controller = project_controller
         self.task_controller = task_controller
 
@@ -14,6 +17,8 @@ class ProjectView(ttk.Frame):
         self.start_entry = None
         self.end_entry = None
         self.tree = None
+        # Показанные проекты и версия изменений, до которой они актуальны
+        self.tracked = None
 
         self.create_widgets()
 
@@ -55,27 +60,55 @@ class ProjectView(ttk.Frame):
         # Таблица проектов
         self.tree = ttk.Treeview(
             self,
-            columns=("name", "desc", "start", "end", "progress"),
+            columns=("name", "desc", "start", "end", "progress", "done", "tasks", "overdue"),
             show="headings"
         )
         for col in self.tree["columns"]:
             self.tree.heading(col, text=col.capitalize())
         self.tree.pack(fill="both", expand=True, padx=10, pady=5)
+        self.tracked = TrackedRows(
+            self.tree, self.project_controller, "projects",
+            self.project_controller.iter_projects,
+            self.project_controller.get_projects_by_ids,
+            self.project_controller.get_project_stats,
+        )
 
         self.refresh_projects()
 
     def refresh_projects(self) -> None:
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        for project in self.project_controller.get_all_projects():
-            progress = f"{self.project_controller.get_project_progress(project.id):.0f}%"
-            self.tree.insert("", "end", values=(
-                project.name,
-                project.description,
-                project.start_date,
-                project.end_date,
-                progress
-            ))
+        # Полная загрузка; дальше таблица догоняет базу через sync_projects
+        self.worker.submit(self.tracked.load_all, key="projects.refresh", on_done=self.show_rows)
+
+    def sync_projects(self) -> None:
+        if self.tracked.version is None:
+            self.refresh_projects()
+            return
+        self.worker.submit(
+            self.tracked.load_changes, self.tracked.version,
+            key="projects.refresh",
+            on_done=self.show_rows,
+        )
+
+    def show_rows(self, result) -> None:
+        # Прогресс по времени считается на один момент для всех строк
+        now = datetime.now()
+        self.tracked.show(result, lambda project, stats: self.project_values(project, stats, now))
+
+    @staticmethod
+    def project_values(project, stats, now) -> tuple:
+        total = stats["total"] if stats else 0
+        completed = stats["by_status"]["completed"] if stats else 0
+        done = completed / total * 100 if total else 0.0
+        return (
+            project.name,
+            project.description,
+            project.start_date,
+            project.end_date,
+            f"{project.get_progress(now):.0f}%",
+            f"{done:.0f}%",
+            total,
+            stats["overdue"] if stats else 0,
+        )
 
     def add_project(self) -> None:
         name = self.name_entry.get()
@@ -94,22 +127,22 @@ class ProjectView(ttk.Frame):
             messagebox.showerror("Ошибка", "Дата должна быть в формате YYYY-MM-DD")
             return
 
-        self.project_controller.add_project(name, desc, start_date, end_date)
-        self.refresh_projects()
+        self.worker.submit(
+            self.project_controller.add_project, name, desc, start_date, end_date,
+            on_done=lambda _: self.sync_projects(),
+        )
 
     def delete_selected(self) -> None:
         selected = self.tree.selection()
         if not selected:
             messagebox.showwarning("Ошибка", "Выберите проект для удаления")
             return
-        for item in selected:
-            values = self.tree.item(item, "values")
-            project_name = values[0]
-            for project in self.project_controller.get_all_projects():
-                if project.name == project_name:
-                    self.project_controller.delete_project(project.id)
-                    break
-        self.refresh_projects()
+        project_ids = [int(item) for item in selected]
+        run_with_progress(
+            self.worker, self, "Удаление проектов", self.project_controller.delete_projects,
+            project_ids,
+            on_done=lambda _: self.sync_projects(),
+        )
 
     def edit_selected(self) -> None:
         selected = self.tree.selection()
@@ -117,12 +150,11 @@ class ProjectView(ttk.Frame):
             messagebox.showwarning("Ошибка", "Выберите проект для редактирования")
             return
 
-        item = selected[0]
-        values = self.tree.item(item, "values")
-        project_name = values[0]
+        self.worker.submit(
+            self.project_controller.get_project, int(selected[0]), on_done=self.edit_project
+        )
 
-        # Находим объект проекта
-        project = next((p for p in self.project_controller.get_all_projects() if p.name == project_name), None)
+    def edit_project(self, project) -> None:
         if not project:
             messagebox.showerror("Ошибка", "Проект не найден")
             return
@@ -134,9 +166,16 @@ class ProjectView(ttk.Frame):
         if new_name and new_desc:
             project.name = new_name
             project.description = new_desc
-            self.project_controller.update_project(project)
-            self.refresh_projects()
-            messagebox.showinfo("Успех", "Проект обновлён")
+
+            def done(_) -> None:
+                self.sync_projects()
+                messagebox.showinfo("Успех", "Проект обновлён")
+
+            self.worker.submit(
+                self.project_controller.update_project, project.id,
+                name=new_name, description=new_desc,
+                on_done=done,
+            )
 
     def show_tasks(self) -> None:
         selected = self.tree.selection()
@@ -144,21 +183,26 @@ class ProjectView(ttk.Frame):
             messagebox.showwarning("Ошибка", "Выберите проект для просмотра задач")
             return
 
-        item = selected[0]
-        project_name = self.tree.item(item, "values")[0]
+        self.worker.submit(
+            self.load_project_tasks, int(selected[0]), on_done=self.show_project_tasks
+        )
+
+    def load_project_tasks(self, project_id) -> tuple:
+        # Выполняется в фоновом потоке; задачи читает TaskController
+        project = self.project_controller.get_project(project_id)
+        if not project:
+            return None, []
+        return project, self.task_controller.get_tasks_by_project(project.id)
 
-        # Находим объект проекта
-        project = next((p for p in self.project_controller.get_all_projects() if p.name == project_name), None)
+    def show_project_tasks(self, result) -> None:
+        project, tasks = result
         if not project:
             messagebox.showerror("Ошибка", "Проект не найден")
             return
 
-        # Используем TaskController
-        tasks = self.task_controller.get_tasks_by_project(project.id)
         if not tasks:
             messagebox.showinfo("Задачи проекта", "В проекте нет задач")
             return
 
         tasks_str = "\n".join(f"{t.title} ({t.status})" for t in tasks)
         messagebox.showinfo(f"Задачи проекта '{project.name}'", tasks_str)
-
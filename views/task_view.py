@@ -1,12 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from datetime import datetime, timedelta
+from views.background import BackgroundWorker, run_with_progress
+from views.tree_delta import ChangeTracker
+from views.virtual_tree import VirtualTreeview
 
 allowed_statuses = ['pending', 'in_progress', 'completed']
+PAGE_SIZE = 200
 
 class TaskView(ttk.Frame):
-    def __init__(self, parent, task_controller, project_controller, user_controller) -> None:
+    def __init__(self, parent, task_controller, project_controller, user_controller,
+                 worker=None) -> None:
         super().__init__(parent)
+        self.worker = worker or BackgroundWorker(self)
         self.task_controller = task_controller
         self.project_controller = project_controller
         self.user_controller = user_controller
@@ -16,8 +22,11 @@ class TaskView(ttk.Frame):
         self.project_var = tk.StringVar()
         self.user_var = tk.StringVar()
         self.search_entry = None
-        self.tree = None
+        self.table = None
         self.status_var = tk.StringVar(value="")
+        self.filters = {}
+        # Версия изменений, до которой актуальна таблица
+        self.tracker = ChangeTracker(task_controller)
 
         self.create_widgets()
 
@@ -37,12 +46,12 @@ class TaskView(ttk.Frame):
         ttk.Combobox(form_frame, textvariable=self.priority_var, values=[1, 2, 3]).grid(row=2, column=1, sticky="ew")
 
         ttk.Label(form_frame, text="Проект:").grid(row=3, column=0, sticky="w")
-        project_titles = [p.name for p in self.project_controller.get_all_projects()]
+        project_titles = [p.name for p in self.project_controller.iter_projects()]
         ttk.Combobox(form_frame, textvariable=self.project_var, values=project_titles).grid(row=3, column=1, sticky="ew")
 
         ttk.Label(form_frame, text="Исполнитель:").grid(row=4, column=0, sticky="w")
 
-        user_names = [u.username for u in self.user_controller.get_all_users()]
+        user_names = [u.username for u in self.user_controller.iter_users()]
         ttk.Combobox(form_frame, textvariable=self.user_var, values=user_names).grid(row=4, column=1, sticky="ew")
 
         # Кнопки действий
@@ -55,6 +64,9 @@ class TaskView(ttk.Frame):
         ttk.Button(form_frame, text="Удалить выбранные", command=self.delete_selected).grid(
             row=7, column=0, columnspan=2, pady=5
         )
+        ttk.Button(
+            form_frame, text="Сменить статус выбранных", command=self.change_status_selected
+        ).grid(row=8, column=0, columnspan=2, pady=5)
 
         # Поиск
         search_frame = ttk.Frame(self)
@@ -69,57 +81,99 @@ class TaskView(ttk.Frame):
             side="left")
 
         # Таблица задач
-        self.tree = ttk.Treeview(
+        self.table = VirtualTreeview(
             self,
             columns=("title", "desc", "priority", "status", "project", "assignee"),
-            show="headings"
+            fetch_page=self.fetch_page,
+            worker=self.worker,
+            page_size=PAGE_SIZE,
+            row_values=lambda row: (
+                row["title"], row["description"], row["priority"], row["status"],
+                row["project_name"] or "—", row["assignee_name"] or "—"
+            ),
         )
-        for col in self.tree["columns"]:
-            self.tree.heading(col, text=col.capitalize())
-        self.tree.pack(fill="both", expand=True, padx=10, pady=5)
+        self.table.pack(fill="both", expand=True, padx=10, pady=5)
 
     def refresh_tasks(self) -> None:
-        tasks = self.task_controller.get_all_tasks()
+        # Фильтры фиксируются на момент обновления, по ним же подгружаются следующие страницы
+        self.filters = self.current_filters()
+        self.tracker.version = None
+        self.worker.submit(
+            self.load_first_page, self.filters,
+            key="tasks.refresh",
+            on_done=self.show_first_page,
+        )
+
+    def sync_tasks(self) -> None:
+        # Догоняет базу по журналу изменений при тех же фильтрах
+        if self.tracker.version is None:
+            self.refresh_tasks()
+            return
+        self.worker.submit(
+            self.load_changes, self.tracker.version, self.filters,
+            key="tasks.refresh",
+            on_done=self.show_changes,
+        )
+
+    def load_first_page(self, filters) -> tuple[int, tuple]:
+        return self.tracker.snapshot(self.read_first_page, filters)
+
+    def read_first_page(self, filters) -> tuple[int, list, str | None]:
+        total = self.task_controller.count_tasks(**filters)
+        rows, cursor = self.task_controller.query_tasks(limit=PAGE_SIZE, **filters)
+        return total, rows, cursor
+
+    def load_changes(self, version, filters) -> tuple:
+        # Переименование проекта или пользователя меняет подписи в любой строке,
+        # а большой пакет изменений дешевле перечитать первой страницей
+        changes = self.task_controller.get_changes_since(version)
+        tasks = changes["tasks"]
+        changed_ids = tasks["upserted"] + tasks["deleted"]
+        names_changed = any(
+            changes[table]["upserted"] or changes[table]["deleted"]
+            for table in ("projects", "users")
+        )
+        if names_changed or len(changed_ids) > PAGE_SIZE:
+            return None, self.load_first_page(filters)
+        rows = []
+        if tasks["upserted"]:
+            rows, _ = self.task_controller.query_tasks(
+                limit=len(tasks["upserted"]), ids=tasks["upserted"], **filters
+            )
+        total = self.task_controller.count_tasks(**filters)
+        return changes["version"], (changed_ids, rows, total)
+
+    def show_first_page(self, result) -> None:
+        self.tracker.version, page = result
+        self.table.load(*page)
+
+    def show_changes(self, result) -> None:
+        version, changes = result
+        if version is None:
+            self.show_first_page(changes)
+            return
+        self.tracker.version = version
+        self.table.apply_changes(*changes)
 
-        # Фильтры поиска
-        query = self.search_entry.get().strip().lower() if self.search_entry else ""
+    def current_filters(self) -> dict:
+        query = self.search_entry.get().strip() if self.search_entry else ""
         status_filter_value = self.status_var.get() if self.status_var else ""
         priority_filter_value = getattr(self, "priority_var_filter", None)
         if priority_filter_value:
             priority_filter_value = priority_filter_value.get()
         else:
             priority_filter_value = 0
-
-        filtered_tasks = []
-        for task in tasks:
-            # Поиск по названию и описанию
-            if query and query not in task.title.lower() and query not in task.description.lower():
-                continue
-
-            # Фильтр по статусу
-            if status_filter_value and task.status != status_filter_value:
-                continue
-
-            # Фильтр по приоритету
-            if priority_filter_value and task.priority != priority_filter_value:
-                continue
-
-            filtered_tasks.append(task)
-
-        # Очищаем таблицу
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        # Заполняем таблицу
-        for task in filtered_tasks:
-            project = self.project_controller.get_project(task.project_id)
-            user = self.user_controller.get_user(task.assignee_id)
-            project_name = project.name if project else "—"
-            assignee_name = user.username if user else "—"
-
-            self.tree.insert("", "end", iid=task.id, values=(
-                task.title, task.description, task.priority, task.status, project_name, assignee_name
-            ))
+        return {
+            "text": query or None,
+            "status": status_filter_value or None,
+            "priority": priority_filter_value or None,
+        }
+
+    def fetch_page(self, after, offset=0) -> tuple[list, str | None]:
+        # Выполняется в фоновом потоке таблицы
+        return self.task_controller.query_tasks(
+            limit=PAGE_SIZE, after=after, offset=offset, **self.filters
+        )
 
     def add_task(self) -> None:
         title = self.title_entry.get()
@@ -130,44 +184,75 @@ class TaskView(ttk.Frame):
             messagebox.showerror("Ошибка", "Введите название задачи!")
             return
 
-        projects = self.project_controller.get_all_projects()
-        users = self.user_controller.get_all_users()
+        def done(added) -> None:
+            if not added:
+                messagebox.showerror("Ошибка", "Выберите существующий проект и исполнителя")
+                return
+            messagebox.showinfo("Успех", "Задача добавлена")
+            self.sync_tasks()
 
-        if not projects or not users:
-            messagebox.showerror("Ошибка", "Нет доступных проектов или пользователей")
-            return
+        self.worker.submit(
+            self.create_task, title, desc, priority, self.project_var.get(), self.user_var.get(),
+            on_done=done,
+        )
 
-        project = next((p for p in projects if p.name == self.project_var.get()), projects[0])
-        user = next((u for u in users if u.username == self.user_var.get()), users[0])
+    def create_task(self, title, desc, priority, project_name, username) -> bool:
+        # Выполняется в фоновом потоке; проект и исполнитель ищутся по индексам
+        project = self.project_controller.get_project_by_name(project_name)
+        user = self.user_controller.get_user_by_username(username)
+
+        if not project or not user:
+            return False
 
         due_date = datetime.now() + timedelta(days=7)
         self.task_controller.add_task(title, desc, priority, due_date, project.id, user.id)
-        messagebox.showinfo("Успех", "Задача добавлена")
-        self.refresh_tasks()
+        return True
 
     def delete_selected(self) -> None:
-        selected = self.tree.selection()
+        selected = self.table.selection()
         if not selected:
             messagebox.showwarning("Ошибка", "Выберите задачу для удаления")
             return
 
-        for item in selected:
-            task_id = int(item)
-            task = self.task_controller.get_task(task_id)
-            if task:
-                self.task_controller.delete_task(task)
-        self.refresh_tasks()
-        messagebox.showinfo("Успех", "Выбранные задачи успешно удалены")
+        def done(_) -> None:
+            self.sync_tasks()
+            messagebox.showinfo("Успех", "Выбранные задачи успешно удалены")
+
+        run_with_progress(
+            self.worker, self, "Удаление задач", self.task_controller.delete_tasks, selected,
+            on_done=done,
+        )
+
+    def change_status_selected(self) -> None:
+        selected = self.table.selection()
+        if not selected:
+            messagebox.showwarning("Ошибка", "Выберите задачи для смены статуса")
+            return
+
+        new_status = simpledialog.askstring(
+            "Сменить статус", f"Статус ({', '.join(allowed_statuses)}):",
+            initialvalue=allowed_statuses[0],
+        )
+        if new_status not in allowed_statuses:
+            if new_status is not None:
+                messagebox.showwarning("Ошибка", "Некорректный статус")
+            return
+
+        run_with_progress(
+            self.worker, self, "Смена статуса", self.task_controller.update_tasks_status,
+            selected, new_status,
+            on_done=lambda _: self.sync_tasks(),
+        )
 
     def edit_selected(self) -> None:
-        selected = self.tree.selection()
+        selected = self.table.selection()
         if not selected:
             messagebox.showwarning("Ошибка", "Выберите задачу для редактирования")
             return
 
-        task_id = int(selected[0])
-        task = self.task_controller.get_task(task_id)
+        self.worker.submit(self.task_controller.get_task, selected[0], on_done=self.edit_task)
 
+    def edit_task(self, task) -> None:
         if not task:
             messagebox.showerror("Ошибка", "Не удалось найти задачу")
             return
@@ -179,6 +264,12 @@ class TaskView(ttk.Frame):
         if new_title and new_desc:
             task.title = new_title
             task.description = new_desc
-            self.task_controller.update_task(task.id, title=new_title, description=new_desc)
-            self.refresh_tasks()
-            messagebox.showinfo("Успех", "Задача обновлена")
+
+            def done(_) -> None:
+                self.sync_tasks()
+                messagebox.showinfo("Успех", "Задача обновлена")
+
+            self.worker.submit(
+                self.task_controller.update_task, task.id, title=new_title, description=new_desc,
+                on_done=done,
+            )
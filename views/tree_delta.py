@@ -0,0 +1,85 @@
+# Точечное обновление Treeview: вместо очистки и повторной вставки всех строк
+# меняются только добавленные, изменённые и удалённые элементы
+
+
+def sync_tree(tree, current, wanted) -> None:
+    # current — {iid: values} уже показанных строк, обновляется на месте;
+    # wanted — {iid: values} нужного состояния. Новые строки добавляются в конец
+    for row_id in [row_id for row_id in current if row_id not in wanted]:
+        tree.delete(row_id)
+        del current[row_id]
+    for row_id, values in wanted.items():
+        old = current.get(row_id)
+        if old is None:
+            tree.insert("", "end", iid=row_id, values=values)
+        elif old != values:
+            tree.item(row_id, values=values)
+        else:
+            continue
+        current[row_id] = values
+
+
+class ChangeTracker:
+    # Версия журнала изменений, до которой актуальны строки окна.
+    # snapshot выполняется в фоновом потоке, version меняется в потоке Tk
+    def __init__(self, controller) -> None:
+        self.controller = controller
+        self.version = None
+
+    def snapshot(self, load, *args) -> tuple:
+        # Версия читается до данных, чтобы изменения во время загрузки не потерялись
+        return self.controller.get_change_version(), load(*args)
+
+
+class TrackedRows(ChangeTracker):
+    # Записи таблицы table журнала изменений, показанные в tree, и статистика задач по ним.
+    # iter_all, get_by_ids и load_stats — методы контроллера; load_all и load_changes
+    # выполняются в фоновом потоке, show — в потоке Tk
+    def __init__(self, tree, controller, table, iter_all, get_by_ids, load_stats) -> None:
+        super().__init__(controller)
+        self.tree = tree
+        self.table = table
+        self.iter_all = iter_all
+        self.get_by_ids = get_by_ids
+        self.load_stats = load_stats
+        self.records = {}
+        self.stats = {}
+        self.rows = {}
+
+    def load_all(self) -> tuple:
+        version, (records, stats) = self.snapshot(self._read_all)
+        return version, records, None, stats
+
+    def _read_all(self) -> tuple:
+        return {record.id: record for record in self.iter_all()}, self.load_stats()
+
+    def load_changes(self, version) -> tuple:
+        # Из базы читаются только изменённые записи; статистика задач
+        # пересчитывается, только если менялись задачи
+        changes = self.controller.get_changes_since(version)
+        changed = changes[self.table]
+        records = {record.id: record for record in self.get_by_ids(changed["upserted"])}
+        tasks = changes["tasks"]
+        stats = None
+        if tasks["upserted"] or tasks["deleted"]:
+            stats = self.load_stats()
+        return changes["version"], records, changed["deleted"], stats
+
+    def show(self, result, row_values) -> None:
+        # deleted=None означает полную загрузку: records заменяет всё, что было.
+        # row_values(запись, её статистика или None) -> значения строки
+        version, records, deleted, stats = result
+        if deleted is None:
+            self.records = records
+        else:
+            self.records.update(records)
+            for record_id in deleted:
+                self.records.pop(record_id, None)
+        if stats is not None:
+            self.stats = stats
+        self.version = version
+        wanted = {
+            record_id: row_values(record, self.stats.get(record_id))
+            for record_id, record in self.records.items()
+        }
+        sync_tree(self.tree, self.rows, wanted)
@@ -1,11 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from views.background import BackgroundWorker, run_with_progress
+from views.tree_delta import TrackedRows
 
 ROLES = ['admin', 'manager', 'developer']
 
 class UserView(ttk.Frame):
-    def __init__(self, parent, user_controller) -> None:
+    def __init__(self, parent, user_controller, worker=None) -> None:
         super().__init__(parent)
+        self.worker = worker or BackgroundWorker(self)
         self.user_controller = user_controller
 
         # Поля ввода
@@ -13,6 +16,8 @@ class UserView(ttk.Frame):
         self.email_entry = None
         self.role_entry = None
         self.tree = None
+        # Показанные пользователи и версия изменений, до которой они актуальны
+        self.tracked = None
 
         self.create_widgets()
 
@@ -47,20 +52,50 @@ class UserView(ttk.Frame):
         edit_btn.grid(row=6, column=0, columnspan=2, pady=5)
 
         # Таблица пользователей
-        self.tree = ttk.Treeview(self, columns=("id", "username", "email", "role"), show="headings")
+        self.tree = ttk.Treeview(
+            self, columns=("id", "username", "email", "role", "tasks", "open", "overdue"),
+            show="headings",
+        )
         for col in self.tree["columns"]:
             self.tree.heading(col, text=col.capitalize())
         self.tree.pack(fill="both", expand=True, padx=10, pady=5)
+        self.tracked = TrackedRows(
+            self.tree, self.user_controller, "users",
+            self.user_controller.iter_users,
+            self.user_controller.get_users_by_ids,
+            self.user_controller.get_workload_stats,
+        )
 
         self.refresh_users()
 
     def refresh_users(self) -> None:
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        # Полная загрузка; дальше таблица догоняет базу через sync_users
+        self.worker.submit(self.tracked.load_all, key="users.refresh", on_done=self.show_users)
 
-        users = self.user_controller.get_all_users()
-        for user in users:
-            self.tree.insert("", "end", values=(user.id, user.username, user.email, user.role))
+    def sync_users(self) -> None:
+        if self.tracked.version is None:
+            self.refresh_users()
+            return
+        self.worker.submit(
+            self.tracked.load_changes, self.tracked.version,
+            key="users.refresh",
+            on_done=self.show_users,
+        )
+
+    def show_users(self, result) -> None:
+        self.tracked.show(result, self.user_values)
+
+    @staticmethod
+    def user_values(user, stats) -> tuple:
+        if stats:
+            counters = (
+                stats["total"],
+                stats["total"] - stats["by_status"]["completed"],
+                stats["overdue"],
+            )
+        else:
+            counters = (0, 0, 0)
+        return (user.id, user.username, user.email, user.role) + counters
 
     def add_user(self) -> None:
         username = self.username_entry.get().strip()
@@ -71,11 +106,16 @@ class UserView(ttk.Frame):
             messagebox.showwarning("Ошибка", "Заполните все поля!")
             return
 
-        self.user_controller.add_user(username, email, role)
-        self.username_entry.delete(0, tk.END)
-        self.email_entry.delete(0, tk.END)
-        self.role_entry.delete(0, tk.END)
-        self.refresh_users()
+        def done(user_id) -> None:
+            if user_id is None:
+                messagebox.showerror("Ошибка", "Имя пользователя или email уже заняты")
+                return
+            self.username_entry.delete(0, tk.END)
+            self.email_entry.delete(0, tk.END)
+            self.role_entry.delete(0, tk.END)
+            self.sync_users()
+
+        self.worker.submit(self.user_controller.add_user, username, email, role, on_done=done)
 
     def delete_selected(self) -> None:
         selected = self.tree.selection()
@@ -83,12 +123,12 @@ class UserView(ttk.Frame):
             messagebox.showwarning("Ошибка", "Выберите пользователя для удаления!")
             return
 
-        for item in selected:
-            values = self.tree.item(item, "values")
-            user_id = values[0]
-            self.user_controller.delete_user(user_id)
-
-        self.refresh_users()
+        user_ids = [int(item) for item in selected]
+        run_with_progress(
+            self.worker, self, "Удаление пользователей", self.user_controller.delete_users,
+            user_ids,
+            on_done=lambda _: self.sync_users(),
+        )
 
     def edit_selected(self) -> None:
         selected = self.tree.selection()
@@ -96,10 +136,9 @@ class UserView(ttk.Frame):
             messagebox.showwarning("Ошибка", "Выберите пользователя для редактирования")
             return
 
-        values = self.tree.item(selected[0], "values")
-        user_id = int(values[0])
-        user = self.user_controller.get_user(user_id)
+        self.worker.submit(self.user_controller.get_user, int(selected[0]), on_done=self.edit_user)
 
+    def edit_user(self, user) -> None:
         if not user:
             messagebox.showerror("Ошибка", "Не удалось найти пользователя")
             return
@@ -109,9 +148,19 @@ class UserView(ttk.Frame):
         new_role = simpledialog.askstring("Редактировать данные пользователя",f"Роль ({', '.join(ROLES)}):", initialvalue=user.role)
 
         if new_username and new_email and new_role in ROLES:
-            self.user_controller.update_user(user.id, username=new_username, email=new_email, role=new_role)
-            self.refresh_users()
-            messagebox.showinfo("Успех", "Данные пользователя обновлены")
+            def done(updated) -> None:
+                # Имя и email уникальны: при совпадении с другим пользователем запись отклоняется
+                if not updated:
+                    messagebox.showerror("Ошибка", "Имя пользователя или email уже заняты")
+                    return
+                self.sync_users()
+                messagebox.showinfo("Успех", "Данные пользователя обновлены")
+
+            self.worker.submit(
+                self.user_controller.update_user, user.id,
+                username=new_username, email=new_email, role=new_role,
+                on_done=done,
+            )
         else:
             messagebox.showwarning("Ошибка", "Поля не заполнены или роль некорректна")
 
@@ -121,9 +170,11 @@ class UserView(ttk.Frame):
             messagebox.showwarning("Ошибка", "Выберите пользователя для просмотра задач")
             return
 
-        values = self.tree.item(selected[0], "values")
-        user_id = int(values[0])
-        tasks = self.user_controller.get_user_tasks(user_id)
+        self.worker.submit(
+            self.user_controller.get_user_tasks, int(selected[0]), on_done=self.show_tasks_list
+        )
+
+    def show_tasks_list(self, tasks) -> None:
         if not tasks:
             messagebox.showinfo("Информация", "У этого пользователя нет задач")
             return
@@ -0,0 +1,253 @@
+from tkinter import ttk, messagebox
+
+DEFAULT_ROW_HEIGHT = 20
+DEFAULT_PAGE_SIZE = 200
+# Сколько страниц держать в памяти; остальные выбрасываются и при возврате читаются заново
+DEFAULT_MAX_PAGES = 5
+PLACEHOLDER = "Загрузка…"
+
+
+class PagedRows:
+    # Ограниченное окно страниц строк. Для каждой встреченной страницы запоминается
+    # курсор её начала; страница без курсора читается по смещению (offset)
+    def __init__(self, page_size=DEFAULT_PAGE_SIZE, max_pages=DEFAULT_MAX_PAGES) -> None:
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.clear(0)
+
+    def clear(self, total) -> None:
+        self.total = total
+        self.pages = {}
+        self.cursors = {0: None}
+
+    def load(self, total, rows, cursor) -> None:
+        # Первая страница, загруженная заранее
+        self.clear(total)
+        self.store([(0, rows, cursor)])
+
+    def store(self, pages) -> None:
+        # pages — тройки (номер страницы, строки, курсор следующей страницы или None)
+        for index, rows, cursor in pages:
+            self.pages[index] = list(rows)
+            if cursor is not None:
+                self.cursors[index + 1] = cursor
+
+    def row(self, index):
+        page = self.pages.get(index // self.page_size)
+        position = index % self.page_size
+        if page is None or position >= len(page):
+            return None
+        return page[position]
+
+    def _page_range(self, start, end) -> range:
+        if end <= start:
+            return range(0)
+        return range(start // self.page_size, (end - 1) // self.page_size + 1)
+
+    def missing(self, start, end) -> list[tuple]:
+        # Что дочитать для строк [start, end): (номер страницы, курсор, смещение)
+        plan = []
+        for index in self._page_range(start, end):
+            if index in self.pages:
+                continue
+            after = self.cursors.get(index)
+            plan.append((index, after, 0 if after is not None else index * self.page_size))
+        return plan
+
+    def evict(self, start, end) -> None:
+        # Выбрасываются страницы, дальше всех отстоящие от окна [start, end)
+        needed = self._page_range(start, end)
+        center = (needed.start + needed.stop) / 2 if needed else 0
+        extra = sorted(
+            (index for index in self.pages if index not in needed),
+            key=lambda index: abs(index - center),
+        )
+        while extra and len(self.pages) > self.max_pages:
+            del self.pages[extra.pop()]
+
+    def apply_changes(self, changed_ids, rows, total) -> bool:
+        # Заменяет изменённые строки на месте, если порядок и число строк не меняются
+        # (сортировка по id, новых и исчезнувших строк в окне нет). Иначе окно
+        # сбрасывается и перечитывается — возвращается False
+        changed = set(changed_ids)
+        fresh = {row["id"]: row for row in rows}
+        positions = {
+            row["id"]: (index, position)
+            for index, page in self.pages.items()
+            for position, row in enumerate(page)
+            if row["id"] in changed
+        }
+        if total != self.total or set(positions) != set(fresh):
+            self.clear(total)
+            return False
+        for row_id, (index, position) in positions.items():
+            self.pages[index][position] = fresh[row_id]
+        return True
+
+
+# Таблица, в виджете которой находится только видимое окно строк.
+# Строки подгружаются страницами через fetch_page(after, offset) -> (rows, cursor)
+# в фоновом потоке worker; в памяти держится не больше max_pages страниц.
+# Выделение хранится по id строк и переживает прокрутку
+class VirtualTreeview(ttk.Frame):
+    def __init__(self, parent, columns, fetch_page, row_values, worker,
+                 page_size=DEFAULT_PAGE_SIZE, max_pages=DEFAULT_MAX_PAGES,
+                 visible_rows=25, overscan=10) -> None:
+        super().__init__(parent)
+        self.fetch_page = fetch_page
+        self.row_values = row_values
+        self.worker = worker
+        self.visible_rows = visible_rows
+        self.overscan = overscan
+
+        self.rows = PagedRows(page_size, max_pages)
+        # Растёт при каждой перезагрузке: страницы для прежних данных отбрасываются
+        self.generation = 0
+        self.requested = None
+        self.offset = 0
+        self.selected_ids = set()
+
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=visible_rows)
+        for col in columns:
+            self.tree.heading(col, text=col.capitalize())
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda event: self._scroll_by(3))
+        self.tree.bind("<Configure>", self._on_configure)
+
+    @property
+    def total(self) -> int:
+        return self.rows.total
+
+    def load(self, total, rows, cursor) -> None:
+        # Показ заранее загруженной первой страницы (например, из фонового потока)
+        self.rows.load(total, rows, cursor)
+        self._new_generation()
+        self.offset = 0
+        self.selected_ids.clear()
+        self.render()
+
+    def apply_changes(self, changed_ids, rows, total) -> None:
+        # changed_ids — id изменённых и удалённых строк, rows — их актуальные версии,
+        # прошедшие фильтр. Если строки сдвигаются, окно перечитывается по смещению
+        if not self.rows.apply_changes(changed_ids, rows, total):
+            self._new_generation()
+        self.selected_ids -= set(changed_ids) - {row["id"] for row in rows}
+        self.offset = min(self.offset, self._max_offset())
+        self.render()
+
+    def selection(self) -> list[int]:
+        return sorted(self.selected_ids)
+
+    def render(self) -> None:
+        start = max(0, self.offset - self.overscan)
+        end = min(self.total, self.offset + self.visible_rows + self.overscan)
+        self._request_pages(start, end)
+        self.rows.evict(start, end)
+
+        self.tree.delete(*self.tree.get_children())
+        for index in range(start, end):
+            row = self.rows.row(index)
+            if row is None:
+                self.tree.insert("", "end", iid=f"loading-{index}", values=(PLACEHOLDER,))
+            else:
+                self.tree.insert("", "end", iid=row["id"], values=self.row_values(row))
+        visible_selected = [
+            iid for iid in self.tree.get_children()
+            if iid.isdigit() and int(iid) in self.selected_ids
+        ]
+        if visible_selected:
+            self.tree.selection_set(visible_selected)
+
+        self.tree.yview_moveto(0)
+        self.tree.yview_scroll(self.offset - start, "units")
+        self._update_scrollbar()
+
+    def _new_generation(self) -> None:
+        self.generation += 1
+        self.requested = None
+
+    def _request_pages(self, start, end) -> None:
+        # Недостающие страницы читаются одним заданием; при быстрой прокрутке
+        # задания с тем же ключом схлопываются до последнего
+        plan = self.rows.missing(start, end)
+        if not plan or plan == self.requested:
+            return
+        self.requested = plan
+        self.worker.submit(
+            self._load_pages, plan, self.generation,
+            key=f"virtual_tree.{id(self)}", on_done=self._show_pages, on_error=self._pages_failed,
+        )
+
+    def _load_pages(self, plan, generation) -> tuple[int, list]:
+        # Выполняется в фоновом потоке
+        pages = []
+        for index, after, offset in plan:
+            rows, cursor = self.fetch_page(after, offset)
+            pages.append((index, rows, cursor))
+        return generation, pages
+
+    def _show_pages(self, result) -> None:
+        generation, pages = result
+        if generation != self.generation:
+            return
+        self.requested = None
+        self.rows.store(pages)
+        self.render()
+
+    def _pages_failed(self, error) -> None:
+        # Следующая прокрутка запросит страницы снова
+        self.requested = None
+        messagebox.showerror("Ошибка", str(error))
+
+    def _max_offset(self) -> int:
+        return max(0, self.total - self.visible_rows)
+
+    def _scroll_to(self, offset) -> str:
+        offset = min(max(0, offset), self._max_offset())
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+        return "break"
+
+    def _scroll_by(self, rows) -> str:
+        return self._scroll_to(self.offset + rows)
+
+    def _update_scrollbar(self) -> None:
+        if self.total == 0:
+            self.scrollbar.set(0, 1)
+            return
+        first = self.offset / self.total
+        last = min(1.0, (self.offset + self.visible_rows) / self.total)
+        self.scrollbar.set(first, last)
+
+    def _on_scrollbar(self, action, value, unit=None) -> None:
+        if action == "moveto":
+            self._scroll_to(int(float(value) * self.total))
+        elif unit == "pages":
+            self._scroll_by(int(value) * self.visible_rows)
+        else:
+            self._scroll_by(int(value))
+
+    def _on_mousewheel(self, event) -> str:
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_configure(self, event) -> None:
+        style_height = ttk.Style(self).lookup("Treeview", "rowheight")
+        row_height = int(style_height) if style_height else DEFAULT_ROW_HEIGHT
+        visible_rows = max(1, event.height // row_height - 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.offset = min(self.offset, self._max_offset())
+            self.render()
+
+    def _on_select(self, event) -> None:
+        # Строки вне окна и заглушки загрузки не трогаем, для видимых берём состояние из виджета
+        visible = {int(iid) for iid in self.tree.get_children() if iid.isdigit()}
+        selected = {int(iid) for iid in self.tree.selection() if iid.isdigit()}
+        self.selected_ids = (self.selected_ids - visible) | selected